@@ -1,11 +1,12 @@
 #!/bin/bash
 set -e
 
-FIRST_DATE=$(cut -d',' -f1 /app/config/date_range.txt | tr -d '\r\n ')
+START_DATE=$(cut -d',' -f1 /app/config/date_range.txt | tr -d '\r\n ')
+END_DATE=$(cut -d',' -f2 /app/config/date_range.txt | tr -d '\r\n ')
 
-echo "Running initial scrape for first date: $FIRST_DATE"
+echo "Running initial scrape from $START_DATE to ${END_DATE:-$START_DATE}"
 
-python /app/src/scraper/presentation/cli.py scrape-for-day "$FIRST_DATE"
+python /app/src/scraper/presentation/cli.py scrape-range "$START_DATE" "${END_DATE:-$START_DATE}"
 
 cron
 
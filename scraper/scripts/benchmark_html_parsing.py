@@ -0,0 +1,125 @@
+"""
+Benchmarks the HTML parsing backends on recorded DJE pages.
+
+Compares the BeautifulSoup/``html.parser`` code the crawlers used before with
+``scan_search_page`` for search results pages, and ``get_text`` with
+``html_to_text`` for diary pages. Pages come from the VCR cassettes, any HTML
+files given on the command line, and a synthetic results page.
+
+Usage::
+
+    PYTHONPATH=src python scripts/benchmark_html_parsing.py [page.html ...]
+"""
+
+import argparse
+import gzip
+import timeit
+from pathlib import Path
+
+import yaml
+from bs4 import BeautifulSoup
+
+from scraper.infrastructure.crawlers.dje_pages import (
+    BASE_URL_ROOT,
+    page_number_from_onclick,
+    popup_url_from_onclick,
+    scan_search_page,
+)
+from scraper.infrastructure.crawlers.html_parsing import HTML_PARSER, LXML, html_to_text
+
+CASSETTES_DIR = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "vcr_cassettes"
+
+
+def recorded_pages() -> dict[str, str]:
+    """Returns the HTML bodies recorded in the VCR cassettes, keyed by cassette and URL."""
+    pages = {}
+    for cassette in sorted(CASSETTES_DIR.glob("*.yaml")):
+        for interaction in yaml.safe_load(cassette.read_text())["interactions"]:
+            response = interaction["response"]
+            body = response["body"].get("string", b"")
+            if isinstance(body, str):
+                body = body.encode()
+            if "gzip" in response["headers"].get("Content-Encoding", []):
+                body = gzip.decompress(body)
+            html = body.decode("utf-8", errors="replace")
+            if "<html" in html.lower():
+                url = interaction["request"]["uri"].split("?")[0]
+                pages[f"{cassette.stem}: {url}"] = html
+    return pages
+
+
+def synthetic_results_page(rows: int) -> str:
+    """Builds a results page shaped like ``consultaAvancada.do`` with ``rows`` results."""
+    results = "".join(
+        f"<tr class='fundocinza1'><td><p>Resultado {n} da pesquisa RPV pagamento pelo INSS</p>"
+        '<a class="layout" title="Visualizar" '
+        f"onclick=\"popup('/cdje/consultaSimples.do?cdVolume=19&nuDiario=4000&cdCaderno=12"
+        f"&nuSeqpagina={n}')\">Visualizar</a></td></tr>"
+        for n in range(rows)
+    )
+    pages = "".join(f'<a onclick="trocaDePg({n});">{n}</a>' for n in range(2, 12))
+    return f'<html><body><table>{results}</table><span class="style5">{pages}</span></body></html>'
+
+
+def soup_search_page(search_html: str) -> tuple[list[str], list[int]]:
+    """The BeautifulSoup version of ``scan_search_page`` the crawlers used before."""
+    soup = BeautifulSoup(search_html, HTML_PARSER)
+    popup_urls = []
+    for row in soup.select("tr"):
+        link = row.select_one('a.layout[title="Visualizar"]')
+        popup_url = popup_url_from_onclick(link.get("onclick", "")) if link else None
+        if popup_url:
+            popup_urls.append(popup_url)
+    nav_span = soup.find("span", class_="style5")
+    page_links = [
+        page_num
+        for a in (nav_span.find_all("a") if nav_span else [])
+        if (page_num := page_number_from_onclick(a.get("onclick", ""))) is not None
+    ]
+    return popup_urls, page_links
+
+
+def soup_text(html: str) -> str:
+    return BeautifulSoup(html, HTML_PARSER).get_text(separator="\n", strip=True)
+
+
+def measure(label: str, baseline, candidate, html: str, repeat: int) -> None:
+    baseline_time = min(timeit.repeat(lambda: baseline(html), number=1, repeat=repeat))
+    candidate_time = min(timeit.repeat(lambda: candidate(html), number=1, repeat=repeat))
+    print(
+        f"  {label:<28} {baseline_time * 1000:9.1f} ms -> {candidate_time * 1000:8.1f} ms "
+        f"({baseline_time / candidate_time:5.1f}x)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("files", nargs="*", type=Path, help="Extra HTML pages to benchmark.")
+    parser.add_argument("--rows", type=int, default=500, help="Rows of the synthetic page.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement.")
+    args = parser.parse_args()
+
+    pages = recorded_pages()
+    pages.update({str(path): path.read_text(errors="replace") for path in args.files})
+    pages[f"synthetic results page ({args.rows} rows)"] = synthetic_results_page(args.rows)
+
+    for name, html in pages.items():
+        print(f"{name} ({len(html) / 1024:.0f} KiB)")
+        measure(
+            "search page: scanner",
+            soup_search_page,
+            lambda page: scan_search_page(page, BASE_URL_ROOT),
+            html,
+            args.repeat,
+        )
+        measure(
+            "page text: lxml",
+            soup_text,
+            lambda page: html_to_text(page, LXML),
+            html,
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
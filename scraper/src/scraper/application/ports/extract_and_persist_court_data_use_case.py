@@ -7,5 +7,6 @@ ExtractAndPersistFilterRequest = CourtCaseExtractorFilters
 
 class ExtractAndPersistCourtDataUseCase(ABC):
     @abstractmethod
-    async def execute(self, filters: ExtractAndPersistFilterRequest) -> None:
+    async def execute(self, filters: ExtractAndPersistFilterRequest) -> int:
+        """Returns the number of court cases extracted and persisted."""
         pass
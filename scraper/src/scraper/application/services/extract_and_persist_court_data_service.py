@@ -1,38 +1,256 @@
+import asyncio
+import contextlib
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, aclosing
+from dataclasses import dataclass
+
 from scraper.application.ports.extract_and_persist_court_data_use_case import (
     ExtractAndPersistCourtDataUseCase,
     ExtractAndPersistFilterRequest,
 )
+from scraper.domain.court_case import CourtCase
 from scraper.domain.ports.court_case_extractor import (
     CourtCaseExtractor,
 )
-from scraper.domain.ports.court_case_repository import CourtCaseRepository
+from scraper.domain.ports.court_case_repository import CourtCaseRepository, SaveManyResult
+
+
+@dataclass(frozen=True)
+class PersistencePipelineSettings:
+    """Sizes of the pipeline between the extractor and the repository."""
+
+    queue_size: int = 1000
+    batch_size: int = 500
+    flush_interval: float = 2.0
+    writers: int = 1
+
+
+@dataclass(frozen=True)
+class _Flush:
+    """
+    Queue marker asking a writer to save its pending cases right away.
+
+    One marker is queued per writer. A writer that took one waits at the
+    barrier until every writer took its own, so none can take two markers
+    of the same flush while another keeps its pending cases.
+    """
+
+    barrier: asyncio.Barrier
+
+
+_QueueItem = CourtCase | _Flush | None
 
 
 class ExtractAndPersistCourtDataService(ExtractAndPersistCourtDataUseCase):
     """
     Service to extract and persist court data.
+
+    Extraction and persistence run as a producer/consumer pipeline: the
+    extracted cases go through a bounded queue to writer tasks, which save
+    them with ``save_many`` once ``batch_size`` cases are pending or the
+    oldest pending case waited ``flush_interval`` seconds. Database writes
+    overlap with the crawl, and when the writers fall behind the full queue
+    stops pulling from the extractor, which slows the crawl down instead of
+    buffering cases in memory.
+
+    The extractor is given a ``wait_persisted`` callback that flushes the
+    writers and returns once every case yielded so far is saved, so it can
+    record its progress without getting ahead of the database.
     """
 
     def __init__(
         self,
         court_case_extractor: CourtCaseExtractor,
         court_case_repository: CourtCaseRepository,
+        pipeline: PersistencePipelineSettings | None = None,
+        repository_scope: Callable[[], AbstractAsyncContextManager[CourtCaseRepository]]
+        | None = None,
     ) -> None:
         """
         Initializes the service with the necessary dependencies.
 
         :param court_case_extractor: An instance of CourtCaseExtractor to extract court data.
         :param court_case_repository: An instance of CourtCaseRepository to persist court data.
+        :param pipeline: Queue and batch sizes, defaults to ``PersistencePipelineSettings()``.
+        :param repository_scope: Opens a repository with its own database session for
+            each writer. Required for more than one writer, since a session cannot be
+            shared by concurrent tasks.
         """
+        pipeline = pipeline or PersistencePipelineSettings()
+        if pipeline.writers < 1 or pipeline.batch_size < 1 or pipeline.queue_size < 1:
+            raise ValueError("writers, batch_size and queue_size must be at least 1")
+        if pipeline.writers > 1 and repository_scope is None:
+            raise ValueError("More than one writer requires a repository_scope")
         self.court_data_extractor = court_case_extractor
         self.court_case_repository = court_case_repository
+        self.pipeline = pipeline
+        self.repository_scope = repository_scope
 
-    async def execute(self, filters: ExtractAndPersistFilterRequest) -> None:
+    async def execute(self, filters: ExtractAndPersistFilterRequest) -> int:
         """
-        Extracts court data for a given case ID and persists it.
+        Extracts court data for the given filters and persists it while the
+        extraction is still running. Cases scraped again only update the rows
+        whose data changed.
+
+        If the extraction fails, the cases extracted so far are still saved
+        before the error is raised; if a writer fails, the extraction stops.
+
+        :return: Number of court cases extracted.
         """
-        court_cases = await self.court_data_extractor.extract(filters)
-        print(f"Extracted {len(court_cases)} court cases.")
+        queue: asyncio.Queue[_QueueItem] = asyncio.Queue(maxsize=self.pipeline.queue_size)
+        writers = [asyncio.create_task(self._write(queue)) for _ in range(self.pipeline.writers)]
+        try:
+            try:
+                extracted_count = await self._produce(filters, queue, writers)
+            except Exception:
+                # Saves what was extracted before the failure.
+                await self._finish_writers(queue, writers)
+                raise
+            saved = await self._finish_writers(queue, writers)
+        finally:
+            for writer in writers:
+                writer.cancel()
+            await asyncio.gather(*writers, return_exceptions=True)
+
+        print(
+            f"Extracted {extracted_count} court cases: "
+            f"{saved.inserted} new, {saved.updated} updated, {saved.unchanged} unchanged."
+        )
+        return extracted_count
+
+    async def _produce(
+        self,
+        filters: ExtractAndPersistFilterRequest,
+        queue: asyncio.Queue[_QueueItem],
+        writers: list[asyncio.Task],
+    ) -> int:
+        async def wait_persisted() -> None:
+            await self._wait_persisted(queue, writers)
+
+        extracted_count = 0
+        async with aclosing(
+            self.court_data_extractor.extract_stream(filters, wait_persisted=wait_persisted)
+        ) as batches:
+            async for court_cases in batches:
+                for court_case in court_cases:
+                    await self._put(queue, court_case, writers)
+                extracted_count += len(court_cases)
+        return extracted_count
+
+    async def _wait_persisted(
+        self,
+        queue: asyncio.Queue[_QueueItem],
+        writers: list[asyncio.Task],
+    ) -> None:
+        """
+        Asks the writers to save their pending cases and returns once every
+        case queued so far is saved, raising the error of a writer that failed.
+
+        Each writer takes one flush marker, which comes after every case it
+        took before, saves its pending cases and waits at the barrier. The
+        barrier opens once all of them, and this call, reached it.
+        """
+        flush = _Flush(asyncio.Barrier(len(writers) + 1))
+        for _ in writers:
+            await self._put(queue, flush, writers)
+        flushed = asyncio.create_task(flush.barrier.wait())
+        try:
+            while not flushed.done():
+                running = [writer for writer in writers if not writer.done()]
+                if not running:
+                    _raise_writer_error(writers)
+                    raise RuntimeError("Every writer stopped before the extraction finished")
+                await asyncio.wait([flushed, *running], return_when=asyncio.FIRST_COMPLETED)
+                _raise_writer_error(writers)
+        finally:
+            if not flushed.done():
+                flushed.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await flushed
+
+    async def _finish_writers(
+        self, queue: asyncio.Queue[_QueueItem], writers: list[asyncio.Task]
+    ) -> SaveManyResult:
+        for _ in writers:
+            await self._put(queue, None, writers)
+        saved = SaveManyResult()
+        for result in await asyncio.gather(*writers):
+            saved += result
+        return saved
+
+    @staticmethod
+    async def _put(
+        queue: asyncio.Queue[_QueueItem],
+        item: _QueueItem,
+        writers: list[asyncio.Task],
+    ) -> None:
+        """Puts ``item`` on the queue, raising the error of a writer that failed meanwhile."""
+        _raise_writer_error(writers)
+        try:
+            queue.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        put = asyncio.create_task(queue.put(item))
+        try:
+            while not put.done():
+                running = [writer for writer in writers if not writer.done()]
+                if not running:
+                    raise RuntimeError("Every writer stopped before the extraction finished")
+                await asyncio.wait([put, *running], return_when=asyncio.FIRST_COMPLETED)
+                _raise_writer_error(writers)
+        finally:
+            if not put.done():
+                put.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await put
+
+    async def _write(self, queue: asyncio.Queue[_QueueItem]) -> SaveManyResult:
+        if self.repository_scope is None:
+            return await self._drain(queue, self.court_case_repository)
+        async with self.repository_scope() as repository:
+            return await self._drain(queue, repository)
+
+    async def _drain(
+        self, queue: asyncio.Queue[_QueueItem], repository: CourtCaseRepository
+    ) -> SaveManyResult:
+        """
+        Saves the queued cases in batches until it receives ``None``, and
+        right away when it receives a ``_Flush`` marker.
+        """
+        loop = asyncio.get_running_loop()
+        saved = SaveManyResult()
+        batch: list[CourtCase] = []
+        flush_at = 0.0
+        while True:
+            timeout = max(flush_at - loop.time(), 0) if batch else None
+            try:
+                court_case = await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                saved += await repository.save_many(batch)
+                batch = []
+                continue
+            if court_case is None:
+                break
+            if isinstance(court_case, _Flush):
+                if batch:
+                    saved += await repository.save_many(batch)
+                    batch = []
+                await court_case.barrier.wait()
+                continue
+            if not batch:
+                flush_at = loop.time() + self.pipeline.flush_interval
+            batch.append(court_case)
+            if len(batch) >= self.pipeline.batch_size:
+                saved += await repository.save_many(batch)
+                batch = []
+        if batch:
+            saved += await repository.save_many(batch)
+        return saved
+
 
-        for court_case in court_cases:
-            await self.court_case_repository.save(court_case)
+def _raise_writer_error(writers: list[asyncio.Task]) -> None:
+    for writer in writers:
+        if writer.done() and not writer.cancelled() and writer.exception() is not None:
+            raise writer.exception()
@@ -0,0 +1,124 @@
+import asyncio
+import contextlib
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+
+from scraper.application.ports.extract_and_persist_court_data_use_case import (
+    ExtractAndPersistCourtDataUseCase,
+)
+from scraper.domain.ports.scrape_job_queue import ScrapeJobQueue
+from scraper.domain.scrape_job import ScrapeJob
+
+
+@dataclass
+class WorkerSummary:
+    completed: int = 0
+    failed: int = 0
+    extracted_count: int = 0
+
+
+class ScrapeJobWorkerService:
+    """
+    Service pulling scrape jobs from the shared queue and running them.
+
+    Each claimed job runs through ``ExtractAndPersistCourtDataUseCase`` while a
+    background task renews its lease every ``heartbeat_interval`` seconds. If
+    a renewal finds the lease taken over, the job is cancelled, since another
+    worker is already running it again.
+    """
+
+    def __init__(
+        self,
+        queue: ScrapeJobQueue,
+        service_scope: Callable[[], AbstractAsyncContextManager[ExtractAndPersistCourtDataUseCase]],
+        worker_id: str,
+        lease_seconds: float = 300.0,
+        heartbeat_interval: float = 60.0,
+        poll_interval: float = 10.0,
+    ) -> None:
+        """
+        Initializes the worker with the necessary dependencies.
+
+        :param queue: The queue jobs are claimed from.
+        :param service_scope: Opens the extract-and-persist service used for one job,
+            along with the resources it needs, such as a database session.
+        :param worker_id: Identifier of this worker, recorded as the lease owner.
+        :param lease_seconds: How long a claimed job stays leased without a heartbeat.
+        :param heartbeat_interval: Seconds between lease renewals, well below ``lease_seconds``.
+        :param poll_interval: Seconds to wait for new jobs when the queue is empty
+            and the worker keeps running.
+        """
+        if heartbeat_interval >= lease_seconds:
+            raise ValueError("heartbeat_interval must be shorter than lease_seconds")
+        self.queue = queue
+        self.service_scope = service_scope
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+
+    async def run(self, max_jobs: int | None = None, forever: bool = False) -> WorkerSummary:
+        """
+        Runs jobs until the queue is empty, or until ``max_jobs`` jobs ran.
+
+        :param max_jobs: Stop after this many jobs.
+        :param forever: Keep polling the queue instead of stopping when it is empty.
+        """
+        summary = WorkerSummary()
+        while max_jobs is None or summary.completed + summary.failed < max_jobs:
+            job = await self.queue.claim(self.worker_id, self.lease_seconds)
+            if job is None:
+                if not forever:
+                    break
+                await asyncio.sleep(self.poll_interval)
+                continue
+            await self._run_job(job, summary)
+
+        print(
+            f"Worker {self.worker_id} finished: {summary.completed} jobs completed, "
+            f"{summary.failed} failed, {summary.extracted_count} court cases extracted."
+        )
+        return summary
+
+    async def _run_job(self, job: ScrapeJob, summary: WorkerSummary) -> None:
+        print(f"Worker {self.worker_id} running job {job.id} ({job.key}), attempt {job.attempts}.")
+        execution = asyncio.create_task(self._execute(job))
+        heartbeat = asyncio.create_task(self._keep_lease(job, execution))
+        try:
+            extracted_count = await execution
+        except asyncio.CancelledError:
+            if not heartbeat.done():
+                raise
+            print(f"[Toolkit] Worker {self.worker_id} lost the lease of job {job.id}.")
+            summary.failed += 1
+            return
+        except Exception as ex:
+            await self.queue.fail(job.id, self.worker_id, f"{type(ex).__name__}: {ex}")
+            summary.failed += 1
+            return
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+        await self.queue.complete(job.id, self.worker_id, extracted_count)
+        summary.completed += 1
+        summary.extracted_count += extracted_count
+
+    async def _execute(self, job: ScrapeJob) -> int:
+        async with self.service_scope() as service:
+            return await service.execute(job.to_filters())
+
+    async def _keep_lease(self, job: ScrapeJob, execution: asyncio.Task) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                renewed = await self.queue.heartbeat(job.id, self.worker_id, self.lease_seconds)
+            except Exception as ex:
+                # The lease is still valid until it expires; try again on the next beat.
+                print(f"[Toolkit] Heartbeat for job {job.id} failed: {ex}")
+                continue
+            if not renewed:
+                execution.cancel()
+                return
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Self
@@ -46,14 +47,36 @@ class CourtCaseExtractor(ABC):
     """
     Abstract base class for court case extractors.
     This class defines the interface for extracting the Cases for a given Court.
-    Subclasses should implement the `extract` method to define the specific extraction
-    logic for different courts.
+    Subclasses should implement the `extract_stream` method to define the specific
+    extraction logic for different courts.
     """
 
     @abstractmethod
-    async def extract(self, filters: CourtCaseExtractorFilters) -> list[CourtCase]:
+    def extract_stream(
+        self,
+        filters: CourtCaseExtractorFilters,
+        wait_persisted: Callable[[], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[list[CourtCase]]:
         """
-        Extract case from the court.
+        Extract cases from the court as an asynchronous stream of batches.
+        Each batch is yielded as soon as it is parsed, so consumers can persist
+        cases while the extraction is still running.
         This method should be implemented by subclasses to define the extraction logic.
+
+        :param filters: Search filters.
+        :param wait_persisted: Given by consumers that persist batches after pulling
+            them, returns once every batch yielded so far is persisted. Extractors
+            that record progress, e.g. to resume an interrupted run, await it first
+            so they never mark cases as done before they are saved.
         """
         pass
+
+    async def extract(self, filters: CourtCaseExtractorFilters) -> list[CourtCase]:
+        """
+        Extract all cases from the court into a single list.
+        Prefer `extract_stream` for large extractions, as this keeps every case in memory.
+        """
+        court_cases: list[CourtCase] = []
+        async for batch in self.extract_stream(filters):
+            court_cases.extend(batch)
+        return court_cases
@@ -1,10 +1,27 @@
 """Provides the abstract interface for case data storage and retrieval."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
 from scraper.domain.court_case import CourtCase
 
 
+@dataclass(frozen=True)
+class SaveManyResult:
+    """How many cases a ``save_many`` call inserted, updated, or found unchanged."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    def __add__(self, other: "SaveManyResult") -> "SaveManyResult":
+        return SaveManyResult(
+            self.inserted + other.inserted,
+            self.updated + other.updated,
+            self.unchanged + other.unchanged,
+        )
+
+
 class CourtCaseRepository(ABC):
     """Abstract base class for a court case repository.
 
@@ -20,3 +37,13 @@ class CourtCaseRepository(ABC):
         :param case: The case to save.
         """
         pass
+
+    @abstractmethod
+    async def save_many(self, court_cases: list[CourtCase]) -> SaveManyResult:
+        """Saves several cases at once, updating the cases that already exist
+        and whose data changed.
+
+        :param court_cases: The cases to save.
+        :return: The number of cases inserted, updated and left unchanged.
+        """
+        pass
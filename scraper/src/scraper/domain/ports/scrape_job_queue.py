@@ -0,0 +1,60 @@
+"""Provides the abstract interface for the queue distributing scrape jobs to workers."""
+
+from abc import ABC, abstractmethod
+
+from scraper.domain.scrape_job import ScrapeJob
+
+
+class ScrapeJobQueue(ABC):
+    """Abstract base class for a scrape job queue.
+
+    Workers claim a job together with a lease. A worker keeps its lease alive
+    with ``heartbeat`` while the job runs; jobs whose lease expired, e.g.
+    because the worker died, go back to the queue until they run out of
+    attempts.
+    """
+
+    @abstractmethod
+    async def enqueue(self, jobs: list[ScrapeJob]) -> int:
+        """Adds jobs to the queue, skipping jobs whose key is already queued.
+
+        :param jobs: The jobs to add.
+        :return: The number of jobs added.
+        """
+        pass
+
+    @abstractmethod
+    async def claim(self, worker_id: str, lease_seconds: float) -> ScrapeJob | None:
+        """Claims the next pending job for a worker.
+
+        :param worker_id: Identifier of the claiming worker.
+        :param lease_seconds: How long the job stays leased without a heartbeat.
+        :return: The claimed job, or None if no job is pending.
+        """
+        pass
+
+    @abstractmethod
+    async def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """Extends the lease of a running job.
+
+        :return: False if the worker no longer holds the lease.
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, job_id: int, worker_id: str, extracted_count: int) -> None:
+        """Marks a job as done."""
+        pass
+
+    @abstractmethod
+    async def fail(self, job_id: int, worker_id: str, error: str) -> None:
+        """Returns a failed job to the queue, or marks it as failed when out of attempts."""
+        pass
+
+    @abstractmethod
+    async def requeue_expired(self) -> int:
+        """Returns running jobs whose lease expired to the queue.
+
+        :return: The number of jobs requeued or marked as failed.
+        """
+        pass
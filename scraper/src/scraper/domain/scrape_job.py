@@ -0,0 +1,51 @@
+"""
+Defines the scrape job, a unit of work shared by scraper workers through a queue.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import StrEnum
+
+from scraper.domain.ports.court_case_extractor import CourtCaseExtractorFilters
+
+
+class ScrapeJobStatus(StrEnum):
+    """Enumeration for scrape job statuses."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ScrapeJob:
+    """Represents the scraping of one day, diary section and search terms.
+
+    Jobs are identified by ``key``, so enqueueing the same work twice is a no-op.
+    ``id``, ``attempts`` and the lease fields are set by the queue once the job
+    is stored or claimed.
+    """
+
+    day: date
+    section_id: str | None
+    search_terms: str
+    id: int | None = None
+    status: ScrapeJobStatus = ScrapeJobStatus.PENDING
+    attempts: int = 0
+    lease_owner: str | None = None
+    lease_expires_at: datetime | None = None
+    extracted_count: int | None = None
+    last_error: str | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.day.isoformat()}|{self.section_id or ''}|{self.search_terms}"
+
+    def to_filters(self) -> CourtCaseExtractorFilters:
+        return CourtCaseExtractorFilters(
+            start_date=self.day,
+            end_date=self.day,
+            section_id=self.section_id,
+            search_terms=self.search_terms,
+        )
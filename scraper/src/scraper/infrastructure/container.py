@@ -1,43 +1,257 @@
+"""
+Builds the application services from the environment configuration.
+
+Importing this module stays cheap so the CLI starts fast: the database
+engine is created on first use, and SQLAlchemy, the crawlers and their
+parsing libraries (Playwright, crawlee, BeautifulSoup, pdfminer, PyPDF2)
+are only imported by the factories that need them.
+"""
+
+from __future__ import annotations
+
+import atexit
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from typing import TYPE_CHECKING
 
 from scraper.application.services.extract_and_persist_court_data_service import (
     ExtractAndPersistCourtDataService,
+    PersistencePipelineSettings,
 )
-from scraper.infrastructure.crawlers.bs_crawlee_court_case_extractor import (
-    BsCrawleeCourtCaseExtractor,
-)
+from scraper.application.services.scrape_job_worker_service import ScrapeJobWorkerService
+from scraper.infrastructure.crawler_config import CrawlerConfig
 from scraper.infrastructure.database_config import DatabaseConfig
-from scraper.infrastructure.persistence.repositories import SQLAlchemyCourtCaseRepository
+from scraper.infrastructure.job_queue_config import JobQueueConfig
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+    from scraper.domain.ports.court_case_extractor import CourtCaseExtractor
+    from scraper.infrastructure.crawlers.artifact_sink import ArtifactSink
+    from scraper.infrastructure.crawlers.crawl_checkpoint import CheckpointStore
+    from scraper.infrastructure.crawlers.diary_page_cache import DiaryPageCache
+    from scraper.infrastructure.crawlers.parsing_executor import ParsingExecutor
+    from scraper.infrastructure.persistence.repositories import (
+        SQLAlchemyCourtCaseRepository,
+        SQLAlchemyScrapeJobQueue,
+    )
 
 database_config = DatabaseConfig.from_env()
+crawler_config = CrawlerConfig.from_env()
+job_queue_config = JobQueueConfig.from_env()
 
-# Singleton engine
-engine = create_async_engine(database_config.url, echo=True)
+# Created on first use by get_engine and dropped by dispose_engine.
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+# Created on first use by get_parsing_executor and closed at exit.
+_parsing_executor: ParsingExecutor | None = None
+
+
+def get_engine() -> AsyncEngine:
+    """Returns the process wide engine, creating it from ``database_config`` on first use."""
+    global _engine, _session_factory
+    if _engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _engine = create_async_engine(database_config.url, **database_config.engine_options())
+        _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
+    return _engine
 
-# Singleton sessionmaker
-AsyncSessionLocal = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    get_engine()
+    return _session_factory
 
 
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         yield session
 
 
+async def dispose_engine() -> None:
+    """
+    Closes the pooled connections, which are bound to the current event loop.
+    The next session creates a new engine.
+    """
+    global _engine, _session_factory
+    if _engine is not None:
+        engine, _engine, _session_factory = _engine, None, None
+        await engine.dispose()
+
+
+def get_diary_page_cache() -> DiaryPageCache | None:
+    from scraper.infrastructure.crawlers.diary_page_cache import DiaryPageCache
+
+    if not crawler_config.page_cache_dir:
+        return None
+    return DiaryPageCache(
+        crawler_config.page_cache_dir,
+        max_bytes=crawler_config.page_cache_max_mb * 1024 * 1024,
+    )
+
+
+def get_checkpoint_store() -> CheckpointStore | None:
+    from scraper.infrastructure.crawlers.crawl_checkpoint import CheckpointStore
+
+    if not crawler_config.checkpoint_dir:
+        return None
+    return CheckpointStore(crawler_config.checkpoint_dir)
+
+
+def get_artifact_sink() -> ArtifactSink:
+    from scraper.infrastructure.crawlers.artifact_sink import FileArtifactSink, NullArtifactSink
+
+    if not crawler_config.artifact_dir:
+        return NullArtifactSink()
+    return FileArtifactSink(
+        crawler_config.artifact_dir,
+        sample_every=crawler_config.artifact_sample_every,
+        max_bytes=crawler_config.artifact_max_mb * 1024 * 1024,
+    )
+
+
+def get_parsing_executor() -> ParsingExecutor:
+    """
+    Returns the process wide parsing executor, so runs in the same process,
+    e.g. the shards of a range worker or the jobs of ``work``, reuse its
+    worker processes instead of spawning a pool each.
+    """
+    global _parsing_executor
+    if _parsing_executor is None:
+        from scraper.infrastructure.crawlers.parsing_executor import ParsingExecutor
+
+        _parsing_executor = ParsingExecutor(
+            max_workers=crawler_config.parsing_workers,
+            use_processes=crawler_config.parsing_use_processes,
+        )
+        atexit.register(_parsing_executor.close)
+    return _parsing_executor
+
+
+def get_court_case_extractor() -> CourtCaseExtractor:
+    if crawler_config.extractor == "crawlee":
+        from scraper.infrastructure.crawlers.crawlee_court_case_extractor import (
+            CrawleeCourtCaseExtractor,
+        )
+
+        return CrawleeCourtCaseExtractor(
+            max_concurrency=crawler_config.crawlee_max_concurrency,
+            # crawlee counts the retries after the first attempt.
+            max_request_retries=crawler_config.retry_max_attempts - 1,
+            parsing_executor=get_parsing_executor(),
+        )
+
+    from scraper.infrastructure.crawlers.bs_crawlee_court_case_extractor import (
+        BsCrawleeCourtCaseExtractor,
+        DetailFetchMode,
+        FrameWaitSettings,
+    )
+    from scraper.infrastructure.crawlers.http_client import HttpClientSettings
+    from scraper.infrastructure.crawlers.rate_limiter import AimdSettings
+    from scraper.infrastructure.crawlers.resource_router import ResourceRoutingRules
+    from scraper.infrastructure.crawlers.retry_policy import RetrySettings
+
+    return BsCrawleeCourtCaseExtractor(
+        max_concurrent_pages=crawler_config.max_concurrent_pages,
+        fetch_mode=DetailFetchMode(crawler_config.detail_fetch_mode),
+        http_settings=HttpClientSettings(
+            max_connections=crawler_config.http_max_connections,
+            max_keepalive_connections=crawler_config.http_max_keepalive_connections,
+            read_timeout=crawler_config.http_timeout,
+            http2=crawler_config.http2,
+        ),
+        max_exported=crawler_config.max_exported,
+        page_cache=get_diary_page_cache(),
+        parsing_executor=get_parsing_executor(),
+        artifact_sink=get_artifact_sink(),
+        frame_wait=FrameWaitSettings(
+            page_load_timeout=crawler_config.page_load_timeout,
+            frame_attach_timeout=crawler_config.frame_attach_timeout,
+            frame_ready_timeout=crawler_config.frame_ready_timeout,
+            redirect_timeout=crawler_config.frame_redirect_timeout,
+        ),
+        resource_rules=ResourceRoutingRules(
+            blocked_resource_types=frozenset(crawler_config.blocked_resource_types),
+            cached_resource_types=frozenset(crawler_config.cached_resource_types),
+            max_cached_bytes=crawler_config.asset_cache_max_mb * 1024 * 1024,
+        ),
+        rate_limit=AimdSettings(
+            initial_limit=crawler_config.rate_initial_limit,
+            min_limit=crawler_config.rate_min_limit,
+            max_limit=crawler_config.rate_max_limit,
+            latency_threshold=crawler_config.rate_latency_threshold,
+        ),
+        retry=RetrySettings(
+            max_attempts=crawler_config.retry_max_attempts,
+            base_delay=crawler_config.retry_base_delay,
+            max_delay=crawler_config.retry_max_delay,
+            breaker_failure_rate=crawler_config.breaker_failure_rate,
+            breaker_open_seconds=crawler_config.breaker_open_seconds,
+        ),
+        checkpoint_store=get_checkpoint_store(),
+    )
+
+
+def get_court_case_repository(session: AsyncSession) -> SQLAlchemyCourtCaseRepository:
+    from scraper.infrastructure.persistence.repositories import SQLAlchemyCourtCaseRepository
+
+    return SQLAlchemyCourtCaseRepository(
+        session,
+        chunk_size=database_config.save_chunk_size,
+        copy_threshold=database_config.copy_threshold,
+    )
+
+
+@asynccontextmanager
+async def court_case_repository_scope() -> AsyncGenerator[SQLAlchemyCourtCaseRepository, None]:
+    async with get_db_session() as session:
+        yield get_court_case_repository(session)
+
+
+def get_persistence_pipeline_settings() -> PersistencePipelineSettings:
+    return PersistencePipelineSettings(
+        queue_size=database_config.write_queue_size,
+        batch_size=database_config.write_batch_size,
+        flush_interval=database_config.write_flush_interval,
+        writers=database_config.writers,
+    )
+
+
 def get_extract_and_persist_course_case_service(
     session: AsyncSession,
 ) -> ExtractAndPersistCourtDataService:
-    court_case_extractor = BsCrawleeCourtCaseExtractor()
-    court_case_repository = SQLAlchemyCourtCaseRepository(session)
-
     return ExtractAndPersistCourtDataService(
-        court_case_extractor=court_case_extractor, court_case_repository=court_case_repository
+        court_case_extractor=get_court_case_extractor(),
+        court_case_repository=get_court_case_repository(session),
+        pipeline=get_persistence_pipeline_settings(),
+        # Extra writers need sessions of their own.
+        repository_scope=court_case_repository_scope if database_config.writers > 1 else None,
+    )
+
+
+@asynccontextmanager
+async def extract_and_persist_service_scope() -> AsyncGenerator[
+    ExtractAndPersistCourtDataService, None
+]:
+    async with get_db_session() as session:
+        yield get_extract_and_persist_course_case_service(session)
+
+
+def get_scrape_job_queue() -> SQLAlchemyScrapeJobQueue:
+    from scraper.infrastructure.persistence.repositories import SQLAlchemyScrapeJobQueue
+
+    return SQLAlchemyScrapeJobQueue(
+        get_session_factory(), max_attempts=job_queue_config.max_attempts
+    )
+
+
+def get_scrape_job_worker_service(worker_id: str) -> ScrapeJobWorkerService:
+    return ScrapeJobWorkerService(
+        queue=get_scrape_job_queue(),
+        service_scope=extract_and_persist_service_scope,
+        worker_id=worker_id,
+        lease_seconds=job_queue_config.lease_seconds,
+        heartbeat_interval=job_queue_config.heartbeat_interval,
+        poll_interval=job_queue_config.poll_interval,
     )
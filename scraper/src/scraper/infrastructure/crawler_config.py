@@ -0,0 +1,91 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class CrawlerConfig:
+    """Crawler configuration for the DJE court case extractor."""
+
+    extractor: str = "bs"
+    crawlee_max_concurrency: int = 8
+    max_concurrent_pages: int = 4
+    detail_fetch_mode: str = "http_first"
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_timeout: float = 30.0
+    http2: bool = False
+    max_exported: int | None = None
+    page_cache_dir: str | None = None
+    page_cache_max_mb: int = 512
+    parsing_workers: int | None = None
+    parsing_use_processes: bool = True
+    artifact_dir: str | None = None
+    artifact_sample_every: int | None = None
+    artifact_max_mb: int = 100
+    page_load_timeout: float = 30.0
+    frame_attach_timeout: float = 5.0
+    frame_ready_timeout: float = 10.0
+    frame_redirect_timeout: float = 10.0
+    blocked_resource_types: tuple[str, ...] = ("image", "media", "font", "stylesheet")
+    cached_resource_types: tuple[str, ...] = ("script",)
+    asset_cache_max_mb: int = 32
+    rate_initial_limit: float = 4.0
+    rate_min_limit: float = 1.0
+    rate_max_limit: float = 16.0
+    rate_latency_threshold: float = 5.0
+    retry_max_attempts: int = 3
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+    breaker_failure_rate: float = 0.5
+    breaker_open_seconds: float = 30.0
+    checkpoint_dir: str | None = "storage/request_queues/checkpoints"
+
+    @classmethod
+    def from_env(cls) -> "CrawlerConfig":
+        """Create crawler config from environment variables."""
+        max_exported = os.getenv("SCRAPER_MAX_EXPORTED")
+        parsing_workers = os.getenv("SCRAPER_PARSING_WORKERS")
+        artifact_sample_every = os.getenv("SCRAPER_ARTIFACT_SAMPLE_EVERY")
+        checkpoint_dir = os.getenv("SCRAPER_CHECKPOINT_DIR", "storage/request_queues/checkpoints")
+
+        return cls(
+            extractor=os.getenv("SCRAPER_EXTRACTOR", "bs"),
+            crawlee_max_concurrency=int(os.getenv("SCRAPER_CRAWLEE_MAX_CONCURRENCY", "8")),
+            max_concurrent_pages=int(os.getenv("SCRAPER_MAX_CONCURRENT_PAGES", "4")),
+            detail_fetch_mode=os.getenv("SCRAPER_DETAIL_FETCH_MODE", "http_first"),
+            http_max_connections=int(os.getenv("SCRAPER_HTTP_MAX_CONNECTIONS", "20")),
+            http_max_keepalive_connections=int(os.getenv("SCRAPER_HTTP_MAX_KEEPALIVE", "10")),
+            http_timeout=float(os.getenv("SCRAPER_HTTP_TIMEOUT", "30")),
+            http2=os.getenv("SCRAPER_HTTP2", "false").lower() == "true",
+            max_exported=int(max_exported) if max_exported else None,
+            page_cache_dir=os.getenv("SCRAPER_PAGE_CACHE_DIR") or None,
+            page_cache_max_mb=int(os.getenv("SCRAPER_PAGE_CACHE_MAX_MB", "512")),
+            parsing_workers=int(parsing_workers) if parsing_workers else None,
+            parsing_use_processes=os.getenv("SCRAPER_PARSING_PROCESSES", "true").lower() == "true",
+            artifact_dir=os.getenv("SCRAPER_ARTIFACT_DIR") or None,
+            artifact_sample_every=int(artifact_sample_every) if artifact_sample_every else None,
+            artifact_max_mb=int(os.getenv("SCRAPER_ARTIFACT_MAX_MB", "100")),
+            page_load_timeout=float(os.getenv("SCRAPER_PAGE_LOAD_TIMEOUT", "30")),
+            frame_attach_timeout=float(os.getenv("SCRAPER_FRAME_ATTACH_TIMEOUT", "5")),
+            frame_ready_timeout=float(os.getenv("SCRAPER_FRAME_READY_TIMEOUT", "10")),
+            frame_redirect_timeout=float(os.getenv("SCRAPER_FRAME_REDIRECT_TIMEOUT", "10")),
+            blocked_resource_types=_split_list(
+                os.getenv("SCRAPER_BLOCKED_RESOURCE_TYPES", "image,media,font,stylesheet")
+            ),
+            cached_resource_types=_split_list(os.getenv("SCRAPER_CACHED_RESOURCE_TYPES", "script")),
+            asset_cache_max_mb=int(os.getenv("SCRAPER_ASSET_CACHE_MAX_MB", "32")),
+            rate_initial_limit=float(os.getenv("SCRAPER_RATE_INITIAL_LIMIT", "4")),
+            rate_min_limit=float(os.getenv("SCRAPER_RATE_MIN_LIMIT", "1")),
+            rate_max_limit=float(os.getenv("SCRAPER_RATE_MAX_LIMIT", "16")),
+            rate_latency_threshold=float(os.getenv("SCRAPER_RATE_LATENCY_THRESHOLD", "5")),
+            retry_max_attempts=int(os.getenv("SCRAPER_RETRY_MAX_ATTEMPTS", "3")),
+            retry_base_delay=float(os.getenv("SCRAPER_RETRY_BASE_DELAY", "1")),
+            retry_max_delay=float(os.getenv("SCRAPER_RETRY_MAX_DELAY", "30")),
+            breaker_failure_rate=float(os.getenv("SCRAPER_BREAKER_FAILURE_RATE", "0.5")),
+            breaker_open_seconds=float(os.getenv("SCRAPER_BREAKER_OPEN_SECONDS", "30")),
+            checkpoint_dir=checkpoint_dir or None,
+        )
+
+
+def _split_list(value: str) -> tuple[str, ...]:
+    return tuple(item.strip() for item in value.split(",") if item.strip())
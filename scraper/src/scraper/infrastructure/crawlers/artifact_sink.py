@@ -0,0 +1,149 @@
+import asyncio
+import gzip
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_ARTIFACT_QUOTA_BYTES = 100 * 1024 * 1024
+
+
+class ArtifactSink(ABC):
+    """
+    Receives debug artifacts (raw HTML, PDFs) captured while crawling.
+
+    The extractor calls ``sample`` once per fetched page and only collects the
+    page's artifacts when it returns True, so a disabled sink costs nothing in
+    the hot loop.
+    """
+
+    @abstractmethod
+    def start_run(self) -> None:
+        """Called when an extraction run starts."""
+
+    @abstractmethod
+    async def finish_run(self) -> None:
+        """Called when an extraction run ends; waits for pending writes."""
+
+    @abstractmethod
+    def sample(self, failed: bool) -> bool:
+        """
+        Decides whether the artifacts of the current page should be captured.
+
+        :param failed: Whether the page could not be turned into usable content.
+        """
+
+    @abstractmethod
+    def capture(self, name: str, artifacts: Mapping[str, bytes]) -> None:
+        """
+        Stores the artifacts of a page without blocking the caller.
+
+        :param name: Human readable identifier of the page.
+        :param artifacts: Artifact file names mapped to their raw content.
+        """
+
+
+class NullArtifactSink(ArtifactSink):
+    """Default sink: never captures anything."""
+
+    def start_run(self) -> None:
+        return None
+
+    async def finish_run(self) -> None:
+        return None
+
+    def sample(self, failed: bool) -> bool:
+        return False
+
+    def capture(self, name: str, artifacts: Mapping[str, bytes]) -> None:
+        return None
+
+
+class FileArtifactSink(ArtifactSink):
+    """
+    Writes gzip-compressed artifacts into one directory per run.
+
+    Pages that failed are always captured; other pages are captured one in
+    every ``sample_every`` when that is set. Writes run on worker threads and
+    stop once the files under ``directory`` reach ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        sample_every: int | None = None,
+        max_bytes: int = DEFAULT_ARTIFACT_QUOTA_BYTES,
+    ) -> None:
+        """
+        :param directory: Root directory; each run writes into a timestamped subdirectory.
+        :param sample_every: Capture one in every N successful pages. None only
+            captures failures.
+        :param max_bytes: Disk quota for all runs under ``directory``.
+        """
+        if sample_every is not None and sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.directory = Path(directory)
+        self.sample_every = sample_every
+        self.max_bytes = max_bytes
+        self.captured = 0
+        self.dropped = 0
+        self._pages = 0
+        self._sequence = 0
+        self._run_dir: Path | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+        self._lock = threading.Lock()
+        self._size: int | None = None
+
+    def start_run(self) -> None:
+        run_id = f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}"
+        self._run_dir = self.directory / run_id
+        self._pages = 0
+        self._sequence = 0
+
+    async def finish_run(self) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self.captured or self.dropped:
+            print(
+                f"[Toolkit] Debug artifacts: {self.captured} pages saved to {self._run_dir}, "
+                f"{self.dropped} dropped over quota"
+            )
+
+    def sample(self, failed: bool) -> bool:
+        self._pages += 1
+        if failed:
+            return True
+        return self.sample_every is not None and self._pages % self.sample_every == 0
+
+    def capture(self, name: str, artifacts: Mapping[str, bytes]) -> None:
+        if self._run_dir is None:
+            self.start_run()
+        self._sequence += 1
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        page_dir = self._run_dir / f"{self._sequence:05d}-{safe_name}"
+        task = asyncio.create_task(asyncio.to_thread(self._write, page_dir, dict(artifacts)))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _write(self, page_dir: Path, artifacts: dict[str, bytes]) -> None:
+        compressed = {name: gzip.compress(content) for name, content in artifacts.items()}
+        total = sum(len(content) for content in compressed.values())
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_usage()
+            if self._size + total > self.max_bytes:
+                self.dropped += 1
+                return
+            self._size += total
+            self.captured += 1
+        page_dir.mkdir(parents=True, exist_ok=True)
+        for name, content in compressed.items():
+            (page_dir / f"{name}.gz").write_bytes(content)
+
+    def _disk_usage(self) -> int:
+        if not self.directory.exists():
+            return 0
+        return sum(path.stat().st_size for path in self.directory.rglob("*") if path.is_file())
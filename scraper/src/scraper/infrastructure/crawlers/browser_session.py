@@ -0,0 +1,96 @@
+from typing import Any
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from scraper.infrastructure.crawlers.resource_router import ResourceRouter
+
+DEFAULT_MAX_PAGES_PER_CONTEXT = 500
+
+
+class PlaywrightBrowserSession:
+    """
+    Owns the Chromium browser used by an extraction run.
+
+    The browser is launched lazily on first use and kept alive until ``close``
+    is called, so the launch cost is paid once per run instead of once per
+    results page. A single browser context is shared between results pages and
+    only recycled after it has opened ``max_pages_per_context`` pages.
+
+    Every context gets the ``router`` installed, so non-essential resources
+    are blocked and repeat static assets are served from memory.
+
+    When a ``browser`` is injected, its lifecycle belongs to the caller and
+    ``close`` leaves it running.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        browser: Browser | None = None,
+        max_pages_per_context: int = DEFAULT_MAX_PAGES_PER_CONTEXT,
+        router: ResourceRouter | None = None,
+    ) -> None:
+        """
+        :param user_agent: User agent applied to every browser context.
+        :param browser: Optional already launched browser to reuse.
+        :param max_pages_per_context: Pages opened before the context is recycled.
+        :param router: Request routing installed on every context, defaults to
+            a ``ResourceRouter`` with the default rules.
+        """
+        self.user_agent = user_agent
+        self.max_pages_per_context = max_pages_per_context
+        self.router = router or ResourceRouter()
+        self._owns_browser = browser is None
+        self._browser = browser
+        self._playwright: Playwright | None = None
+        self._context: BrowserContext | None = None
+        self._context_pages = 0
+        self.launch_count = 0
+        self.context_count = 0
+
+    async def context(self, cookies: list[dict[str, Any]]) -> BrowserContext:
+        """
+        Returns the shared browser context, launching or recycling it as needed.
+
+        :param cookies: Session cookies to make available to the detail pages.
+        """
+        if self._context is not None and self._context_pages >= self.max_pages_per_context:
+            await self._close_context()
+
+        if self._context is None:
+            browser = await self._get_browser()
+            self._context = await browser.new_context(user_agent=self.user_agent)
+            self._context_pages = 0
+            self.context_count += 1
+            self._context.on("page", self._on_page)
+            await self.router.attach(self._context)
+
+        if cookies:
+            await self._context.add_cookies(cookies)
+        return self._context
+
+    async def close(self) -> None:
+        """Closes the context and, when owned, the browser and Playwright driver."""
+        await self._close_context()
+        if self._owns_browser:
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def _get_browser(self) -> Browser:
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self.launch_count += 1
+        return self._browser
+
+    async def _close_context(self) -> None:
+        if self._context is not None:
+            await self._context.close()
+            self._context = None
+
+    def _on_page(self, _page: Any) -> None:
+        self._context_pages += 1
@@ -1,361 +1,877 @@
 import asyncio
-import io
 import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from decimal import Decimal
-from urllib.parse import parse_qs, urlencode, urljoin, urlparse
+from enum import StrEnum
+from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, BrowserContext, Frame, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from scraper.domain.court_case import CourtCase, CourtCaseAmount, CourtCaseStatus
+from scraper.domain.court_case import CourtCase
 from scraper.domain.ports.court_case_extractor import (
     CourtCaseExtractor,
     CourtCaseExtractorFilters,
 )
+from scraper.infrastructure.crawlers.artifact_sink import ArtifactSink, NullArtifactSink
+from scraper.infrastructure.crawlers.browser_session import (
+    DEFAULT_MAX_PAGES_PER_CONTEXT,
+    PlaywrightBrowserSession,
+)
+from scraper.infrastructure.crawlers.crawl_checkpoint import CheckpointStore, CrawlCheckpoint
+from scraper.infrastructure.crawlers.diary_page_cache import DiaryPageCache, DiaryPageKey
+from scraper.infrastructure.crawlers.dje_pages import (
+    BASE_URL_ROOT,
+    SEARCH_URL,
+    build_diary_page_url,
+    build_search_form,
+    find_next_page,
+    is_placeholder,
+    read_diary_response,
+    scan_search_page,
+)
+from scraper.infrastructure.crawlers.http_client import (
+    USER_AGENT,
+    HttpClientSettings,
+    build_async_client,
+)
+from scraper.infrastructure.crawlers.parsing_executor import ParsingExecutor
+from scraper.infrastructure.crawlers.rate_limiter import (
+    AimdSettings,
+    HostRateLimiters,
+    LimiterSignal,
+)
+from scraper.infrastructure.crawlers.resource_router import (
+    ResourceRouter,
+    ResourceRoutingRules,
+)
+from scraper.infrastructure.crawlers.retry_policy import (
+    CircuitBreaker,
+    DeadLetter,
+    RetrySettings,
+    backoff_delay,
+)
+
+BASE_URL = SEARCH_URL
+DEFAULT_MAX_CONCURRENT_PAGES = 4
+
+
+class DetailFetchMode(StrEnum):
+    """How diary detail pages are retrieved."""
+
+    BROWSER = "browser"
+    HTTP_FIRST = "http_first"
+
+
+@dataclass(frozen=True)
+class FrameWaitSettings:
+    """Deadlines, in seconds, for each stage of rendering a diary popup."""
+
+    page_load_timeout: float = 30.0
+    frame_attach_timeout: float = 5.0
+    frame_ready_timeout: float = 10.0
+    redirect_timeout: float = 10.0
+
+
+@dataclass(frozen=True)
+class DetailPageResult:
+    """Outcome of visiting a single diary detail page."""
+
+    frame_html: str | None = None
+    pdf_content: bytes | None = None
+    problem_reason: str | None = None
+    attempts: int = 1
+
 
-try:
-    from pdfminer.high_level import extract_text as pdfminer_extract_text
-except ImportError:
-    pdfminer_extract_text = None
+@dataclass
+class ExtractionRun:
+    """Mutable progress of a single ``extract_stream`` call."""
 
-try:
-    from PyPDF2 import PdfReader
-except ImportError:
-    PdfReader = None
+    published_at_fallback: datetime
+    exported_count: int = 0
+    stopped: bool = False
+    seen_targets: set[DiaryPageKey | str] = field(default_factory=set)
+    duplicate_targets: int = 0
+    dead_letters: list[DeadLetter] = field(default_factory=list)
+    processed_urls: list[str] = field(default_factory=list)
+    wait_persisted: Callable[[], Awaitable[None]] | None = None
 
-BASE_URL = "https://dje.tjsp.jus.br/cdje/consultaAvancada.do"
-BASE_URL_ROOT = "https://dje.tjsp.jus.br"
+
+@dataclass(frozen=True)
+class SearchResultsPage:
+    """A parsed page of search results."""
+
+    page_num: int
+    popup_urls: list[str]
+    page_links: list[int] = field(default_factory=list)
 
 
 class BsCrawleeCourtCaseExtractor(CourtCaseExtractor):
-    def __init__(self, url: str = BASE_URL, base_url_root: str = BASE_URL_ROOT) -> None:
+    def __init__(
+        self,
+        url: str = BASE_URL,
+        base_url_root: str = BASE_URL_ROOT,
+        max_concurrent_pages: int = DEFAULT_MAX_CONCURRENT_PAGES,
+        browser: Browser | None = None,
+        max_pages_per_context: int = DEFAULT_MAX_PAGES_PER_CONTEXT,
+        fetch_mode: DetailFetchMode = DetailFetchMode.HTTP_FIRST,
+        http_client: httpx.AsyncClient | None = None,
+        http_settings: HttpClientSettings | None = None,
+        max_exported: int | None = None,
+        page_cache: DiaryPageCache | None = None,
+        parsing_executor: ParsingExecutor | None = None,
+        artifact_sink: ArtifactSink | None = None,
+        frame_wait: FrameWaitSettings | None = None,
+        resource_rules: ResourceRoutingRules | None = None,
+        rate_limit: AimdSettings | None = None,
+        retry: RetrySettings | None = None,
+        checkpoint_store: CheckpointStore | None = None,
+    ) -> None:
+        """
+        :param url: Search form endpoint.
+        :param base_url_root: Root used to resolve relative popup URLs.
+        :param max_concurrent_pages: Maximum number of detail pages opened at once
+            in the browser context.
+        :param browser: Optional already launched browser shared across runs. When
+            omitted, one browser is launched per ``extract`` call.
+        :param max_pages_per_context: Detail pages served by a browser context
+            before it is recycled.
+        :param fetch_mode: ``HTTP_FIRST`` requests ``getPaginaDoDiario.do`` directly
+            and only opens the browser when that returns a placeholder; ``BROWSER``
+            always renders the popup in Playwright.
+        :param http_client: Optional shared ``httpx.AsyncClient``. When omitted, a
+            pooled client is built from ``http_settings`` for each ``extract`` call.
+        :param http_settings: Pool, timeout and HTTP/2 settings for the built client.
+        :param max_exported: Optional cap on the number of cases yielded per run.
+        :param page_cache: Optional on-disk cache of immutable diary page responses.
+        :param parsing_executor: Executor running HTML and PDF parsing off the event
+            loop, left open when a run ends so its pool can serve later runs.
+            Defaults to a ``ParsingExecutor`` of this extractor, whose process pool
+            starts lazily and is closed at the end of each run.
+        :param artifact_sink: Receives raw pages for debugging. Defaults to a
+            ``NullArtifactSink``, which captures nothing.
+        :param frame_wait: Per-stage deadlines used while rendering a popup in
+            the browser.
+        :param resource_rules: Resource types blocked or cached by the browser
+            contexts of each run.
+        :param rate_limit: AIMD settings of the per-host limiter in front of the
+            search, diary page and browser requests. The learned limits are kept
+            across runs of the same extractor.
+        :param retry: Retry, backoff and circuit breaker settings for detail
+            pages. Pages that keep failing are dead-lettered instead of stopping
+            the run.
+        :param checkpoint_store: Optional store used to save progress after each
+            results page and to resume an interrupted run with the same filters.
+        """
+        if max_concurrent_pages < 1:
+            raise ValueError("max_concurrent_pages must be at least 1")
         self.url = url
         self.base_url_root = base_url_root
-
-    async def extract(
-        self, filters: CourtCaseExtractorFilters
-    ) -> list[CourtCase]:
-        max_exported: int = 1000
+        self.max_concurrent_pages = max_concurrent_pages
+        self.browser = browser
+        self.max_pages_per_context = max_pages_per_context
+        self.fetch_mode = fetch_mode
+        self.http_client = http_client
+        self.http_settings = http_settings
+        self.max_exported = max_exported
+        self.page_cache = page_cache
+        self.parsing_executor = parsing_executor or ParsingExecutor()
+        # An injected executor may be shared by several runs; its owner closes it.
+        self._owns_parsing_executor = parsing_executor is None
+        self.artifact_sink = artifact_sink or NullArtifactSink()
+        self.frame_wait = frame_wait or FrameWaitSettings()
+        self.resource_rules = resource_rules or ResourceRoutingRules()
+        self.rate_limiters = HostRateLimiters(rate_limit)
+        self.retry = retry or RetrySettings()
+        self.circuit_breaker = CircuitBreaker(
+            window=self.retry.breaker_window,
+            min_calls=self.retry.breaker_min_calls,
+            failure_rate=self.retry.breaker_failure_rate,
+            open_seconds=self.retry.breaker_open_seconds,
+        )
+        self.dead_letters: list[DeadLetter] = []
+        self.checkpoint_store = checkpoint_store
+
+    async def extract_stream(
+        self,
+        filters: CourtCaseExtractorFilters,
+        wait_persisted: Callable[[], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[list[CourtCase]]:
         print(f"Extracting court cases with filters: {filters}")
-        extracted_cases: list[CourtCase] = []
-        published_at_fallback = filters.start_date if filters.start_date else datetime.now()
-        page_num = 1
-        seen_pages: set[int] = set()
-        user_agent = "Mozilla/5.0 (compatible; CourtCaseExtractor/1.0)"
-
-        with httpx.Client(headers={"User-Agent": user_agent}) as s:
-            stop_due_to_problem = False
-
-            while not stop_due_to_problem:
-                print("**" * 5, f"Exported count so far: {len(extracted_cases)}", "**" * 5)
-                if len(extracted_cases) >= max_exported:
-                    print(f"Reached max exported count: {max_exported}. Stopping extraction.")
+        run = ExtractionRun(
+            published_at_fallback=filters.start_date if filters.start_date else datetime.now(),
+            wait_persisted=wait_persisted,
+        )
+        browser_session = PlaywrightBrowserSession(
+            user_agent=USER_AGENT,
+            browser=self.browser,
+            max_pages_per_context=self.max_pages_per_context,
+            router=ResourceRouter(self.resource_rules),
+        )
+        http_client = self.http_client or build_async_client(self.http_settings, USER_AGENT)
+        self.artifact_sink.start_run()
+
+        try:
+            async with aclosing(
+                self._extract_pages(http_client, filters, browser_session, run)
+            ) as batches:
+                async for batch in batches:
+                    yield batch
+        finally:
+            await browser_session.close()
+            if http_client is not self.http_client:
+                await http_client.aclose()
+            await self.artifact_sink.finish_run()
+            if self._owns_parsing_executor:
+                await asyncio.to_thread(self.parsing_executor.close)
+            self.dead_letters = run.dead_letters
+
+        print(f"ExportedCount: {run.exported_count} cases")
+        if run.dead_letters:
+            print(f"[Toolkit] {len(run.dead_letters)} diary pages failed after every retry:")
+            for dead_letter in run.dead_letters:
+                print(
+                    f"  {dead_letter.url}: {dead_letter.reason} ({dead_letter.attempts} attempts)"
+                )
+        print(f"[Toolkit] Skipped {run.duplicate_targets} duplicate diary page targets")
+        routing = browser_session.router.stats
+        if routing.requests:
+            print(
+                f"[Toolkit] Browser requests: {routing.requests} total, {routing.blocked} blocked, "
+                f"{routing.cache_hits} served from the asset cache"
+            )
+        for host, limiter in self.rate_limiters.metrics().items():
+            print(
+                f"[Toolkit] Rate limit for {host}: {limiter.limit:.1f} concurrent requests "
+                f"({limiter.increases} increases, {limiter.decreases} decreases, "
+                f"signals {limiter.signals})"
+            )
+        if self.page_cache is not None:
+            print(
+                f"[Toolkit] Page cache: {self.page_cache.hits} hits, "
+                f"{self.page_cache.misses} misses"
+            )
+
+    async def _extract_pages(
+        self,
+        http_client: httpx.AsyncClient,
+        filters: CourtCaseExtractorFilters,
+        browser_session: PlaywrightBrowserSession,
+        run: ExtractionRun,
+    ) -> AsyncIterator[list[CourtCase]]:
+        filters_key = CheckpointStore.key_for(filters)
+        first_page, seen_pages = await self._resume_from_checkpoint(filters_key, run)
+
+        next_search: asyncio.Task[SearchResultsPage] | None = None
+        if first_page is not None:
+            next_search = asyncio.create_task(
+                self._fetch_search_page(http_client, filters, first_page)
+            )
+
+        try:
+            while next_search is not None and not run.stopped:
+                print("**" * 5, f"Exported count so far: {run.exported_count}", "**" * 5)
+                if self._reached_max_exported(run):
                     break
-                print(f"Fetching page {page_num}")
-                search_html = self._submit_request_with_session(s, filters, page_num)
-                soup = BeautifulSoup(search_html, "html.parser")
-                seen_pages.add(page_num)
-
-                popup_urls = []
-                for row in soup.select("tr"):
-                    link = row.select_one('a.layout[title="Visualizar"]')
-                    if not link:
-                        continue
-                    onclick_attr = link.get("onclick", "")
-                    popup_url = self._extract_popup_url_from_onclick(onclick_attr)
-                    if not popup_url:
-                        continue
-                    popup_urls.append(urljoin(self.base_url_root, popup_url))
-
-                if not popup_urls:
+                search_page = await next_search
+                next_search = None
+
+                if not search_page.popup_urls:
                     print("No popups found on this page.")
                     break
 
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(headless=True)
-                    context = await browser.new_context(user_agent=user_agent)
-                    await context.add_cookies(self._get_cookies_for_playwright(s.cookies.jar))
-
-                    def log_request(request):
-                        print(f"[Network] {request.method} {request.url}")
-
-                    context.on("request", log_request)
-
-                    for detail_url in popup_urls:
-                        if len(extracted_cases) >= max_exported:
-                            print(
-                                f"Reached max exported count: {max_exported}. Stopping extraction."
-                            )
-                            break
-                        print(f"Fetching detail page: {detail_url}")
-                        detail_page = await context.new_page()
-                        response = await detail_page.goto(detail_url)
-                        await detail_page.wait_for_load_state("domcontentloaded")
-
-                        main_html = await detail_page.content()
-                        with open("debug_main_page.html", "w", encoding="utf-8") as f:
-                            f.write(main_html)
-
-                        for fr in detail_page.frames:
-                            try:
-                                fr_html = await fr.content()
-                                with open(
-                                    f"debug_{fr.name}_frame.html", "w", encoding="utf-8"
-                                ) as f2:
-                                    f2.write(fr_html)
-                            except Exception:
-                                pass
-
-                        frame_html = ""
-                        frame = None
-                        for _ in range(10):
-                            frame = detail_page.frame(name="bottomFrame")
-                            if frame:
-                                break
-                            await asyncio.sleep(0.2)
-
-                        problem_detected = False
-                        problem_reason = None
-                        pdf_text = None
-
-                        def fetch_pdf_fallback(detail_url):
-                            parsed = urlparse(detail_url)
-                            params = parse_qs(parsed.query)
-                            base_get_pagina = (
-                                f"{parsed.scheme}://{parsed.netloc}/cdje/getPaginaDoDiario.do"
-                            )
-                            get_params = {
-                                "cdVolume": params.get("cdVolume", [""])[0],
-                                "nuDiario": params.get("nuDiario", [""])[0],
-                                "cdCaderno": params.get("cdCaderno", [""])[0],
-                                "nuSeqpagina": params.get("nuSeqpagina", [""])[0],
-                                "uuidCaptcha": "",
-                            }
-                            get_url = base_get_pagina + "?" + urlencode(get_params)
-                            print(f"[Toolkit] Fallback GET: {get_url}")
-                            try:
-                                resp = httpx.get(get_url)
-                                content_type = resp.headers.get("content-type", "")
-                                if (
-                                    resp.content[:5] == b"%PDF-"
-                                    or "application/pdf" in content_type
-                                ):
-                                    pdf_path = "debug_fallback_getPaginaDoDiario.pdf"
-                                    with open(pdf_path, "wb") as f:
-                                        f.write(resp.content)
-                                    print(f"[Toolkit] Fallback returned a PDF. Saved as {pdf_path}")
-                                    extracted_pdf_text = ""
-                                    if pdfminer_extract_text:
-                                        try:
-                                            extracted_pdf_text = pdfminer_extract_text(
-                                                io.BytesIO(resp.content)
-                                            )
-                                            print(
-                                                "[Toolkit] PDFMiner text extract (first 2000 chars):"
-                                            )
-                                            print(extracted_pdf_text[:2000])
-                                        except Exception as e:
-                                            print("[Toolkit] PDFMiner extraction failed:", e)
-                                    if not extracted_pdf_text and PdfReader:
-                                        try:
-                                            reader = PdfReader(io.BytesIO(resp.content))
-                                            pages = [p.extract_text() for p in reader.pages]
-                                            extracted_pdf_text = "\n".join([p or "" for p in pages])
-                                            print(
-                                                "[Toolkit] PyPDF2 text extract (first 2000 chars):"
-                                            )
-                                            print(extracted_pdf_text[:2000])
-                                        except Exception as e:
-                                            print("[Toolkit] PyPDF2 extraction failed:", e)
-                                    return None, "Fallback returned a PDF file", extracted_pdf_text
-                                else:
-                                    print("[Toolkit] Fallback fetch result (first 3000 chars):")
-                                    print(resp.text[:3000])
-                                    with open(
-                                        "debug_fallback_getPaginaDoDiario.html",
-                                        "w",
-                                        encoding="utf-8",
-                                    ) as f:
-                                        f.write(resp.text)
-                                    if (
-                                        "<title>Insert title here" in resp.text
-                                        or "processando" in resp.text
-                                        or "BENV_exibeProcessando" in resp.text
-                                        or len(resp.text.strip()) <= 50
-                                    ):
-                                        return (
-                                            None,
-                                            "Fallback returned only placeholder/empty content",
-                                            None,
-                                        )
-                                    return resp.text, None, None
-                            except Exception as ex:
-                                print(f"[Toolkit] Fallback request failed: {ex}")
-                                return None, "Fallback fetch failed", None
-
-                        if not frame:
-                            frame_html = ""
-                            frame_html, fallback_err, pdf_text = fetch_pdf_fallback(detail_url)
-                            if not frame_html and not pdf_text:
-                                problem_detected = True
-                                problem_reason = (
-                                    f"bottomFrame not found and fallback failed: {fallback_err}"
-                                )
-                        else:
-                            for _ in range(50):
-                                if (
-                                    frame.url
-                                    and "processando.do" not in frame.url
-                                    and "about:blank" not in frame.url
-                                ):
-                                    break
-                                await asyncio.sleep(0.2)
-                            if "processando.do" in frame.url or "about:blank" in frame.url:
-                                frame_html_temp = await frame.content()
-                                meta_refresh = re.search(
-                                    r'<meta\s+http-equiv=["\']refresh["\']\s+content=["\'][^;]+;\s*url=([^"\'>]+)',
-                                    frame_html_temp,
-                                    re.IGNORECASE,
-                                )
-                                if meta_refresh:
-                                    next_url = meta_refresh.group(1)
-                                    abs_next_url = urljoin(frame.url, next_url)
-                                    await frame.goto(abs_next_url)
-                                    await asyncio.sleep(1)
-                                    frame_html = await frame.content()
-                                else:
-                                    js_redirect = re.search(
-                                        r'window\.location\.href\s*=\s*[\'"]([^\'"]+)[\'"]',
-                                        frame_html_temp,
-                                    )
-                                    if js_redirect:
-                                        next_url = js_redirect.group(1)
-                                        abs_next_url = urljoin(frame.url, next_url)
-                                        await frame.goto(abs_next_url)
-                                        await asyncio.sleep(1)
-                                        frame_html = await frame.content()
-                                    else:
-                                        frame_html = frame_html_temp
-                                        if (
-                                            "<title>Insert title here" in frame_html
-                                            or "processando" in frame_html
-                                            or "BENV_exibeProcessando" in frame_html
-                                        ):
-                                            frame_html, fallback_err, pdf_text = fetch_pdf_fallback(
-                                                detail_url
-                                            )
-                                            if not frame_html and not pdf_text:
-                                                problem_detected = True
-                                                problem_reason = f"Frame stuck on processando/do and fallback not usable: {fallback_err}"
-                            else:
-                                frame_html = await frame.content()
-                                if (
-                                    "<title>Insert title here" in frame_html
-                                    or "processando" in frame_html
-                                    or "BENV_exibeProcessando" in frame_html
-                                ):
-                                    frame_html, fallback_err, pdf_text = fetch_pdf_fallback(
-                                        detail_url
-                                    )
-                                    if not frame_html and not pdf_text:
-                                        problem_detected = True
-                                        problem_reason = f"Frame loaded but only placeholder/processando content and fallback not usable: {fallback_err}"
-
-                        await detail_page.close()
-                        if problem_detected:
-                            print(
-                                f"[ERROR] Problem detected: {problem_reason}. Will stop processing."
-                            )
-                            stop_due_to_problem = True
-                            break
-
-                        # Add new logic to stop after max_exported cases!
-                        if frame_html:
-                            cases = self._parse_detail_html(frame_html, published_at_fallback)
-                        elif pdf_text:
-                            cases = self._parse_detail_pdf_text(pdf_text, published_at_fallback)
-                        else:
-                            cases = []
-
-                        for case in cases:
-                            if len(extracted_cases) >= max_exported:
-                                print(
-                                    f"Reached max exported count: {max_exported}. Stopping extraction."
-                                )
-                                stop_due_to_problem = True
-                                break
-                            extracted_cases.append(case)
-
-                        if stop_due_to_problem:
-                            break
-
-                    await browser.close()
-
-                if stop_due_to_problem:
+                # Start fetching the next results page while this page's details
+                # are processed, so search latency hides behind detail fetching.
+                next_page = find_next_page(search_page.page_links, seen_pages)
+                if next_page:
+                    seen_pages.add(next_page)
+                    next_search = asyncio.create_task(
+                        self._fetch_search_page(http_client, filters, next_page)
+                    )
+
+                async with aclosing(
+                    self._process_search_page(search_page, http_client, browser_session, run)
+                ) as batches:
+                    async for batch in batches:
+                        yield batch
+                await self._save_checkpoint(filters_key, next_page, seen_pages, run)
+                if run.stopped:
                     print("[Debug] Breaking page loop due to threshold or error.")
-                    break
 
-                next_page = self._find_next_page(soup, seen_pages)
-                if next_page:
-                    page_num = next_page
+            async with aclosing(
+                self._retry_dead_letters(http_client, browser_session, run)
+            ) as batches:
+                async for batch in batches:
+                    yield batch
+
+            await self._clear_checkpoint(filters_key, run)
+        finally:
+            if next_search is not None:
+                next_search.cancel()
+                await asyncio.gather(next_search, return_exceptions=True)
+
+    async def _retry_dead_letters(
+        self,
+        http_client: httpx.AsyncClient,
+        browser_session: PlaywrightBrowserSession,
+        run: ExtractionRun,
+    ) -> AsyncIterator[list[CourtCase]]:
+        """
+        Gives pages that failed during the crawl one more pass, once the host
+        has had time to recover.
+        """
+        if not run.dead_letters or run.stopped:
+            return
+        retry_urls = [dead_letter.url for dead_letter in run.dead_letters]
+        run.dead_letters = []
+        print(f"[Toolkit] Retrying {len(retry_urls)} dead-lettered diary pages.")
+        async with aclosing(
+            self._process_details(retry_urls, http_client, browser_session, run)
+        ) as batches:
+            async for batch in batches:
+                yield batch
+
+    async def _resume_from_checkpoint(
+        self, filters_key: str, run: ExtractionRun
+    ) -> tuple[int | None, set[int]]:
+        """
+        Restores ``run`` from the saved checkpoint of these filters, if any.
+
+        :return: The results page to fetch first, or None when every results
+            page was already processed, and the set of results pages already seen.
+        """
+        if self.checkpoint_store is None:
+            return 1, {1}
+        checkpoint = await asyncio.to_thread(self.checkpoint_store.load, filters_key)
+        if checkpoint is None:
+            return 1, {1}
+
+        run.exported_count = checkpoint.exported_count
+        run.dead_letters = list(checkpoint.dead_letters)
+        run.processed_urls = list(checkpoint.processed_urls)
+        # Dead letters are retried once the crawl ends, not when they reappear.
+        run.seen_targets = {
+            DiaryPageKey.from_url(url) or url
+            for url in [*checkpoint.processed_urls, *(d.url for d in checkpoint.dead_letters)]
+        }
+        print(
+            f"[Toolkit] Resuming from checkpoint: next page {checkpoint.next_page}, "
+            f"{len(checkpoint.processed_urls)} diary pages already processed"
+        )
+        return checkpoint.next_page, set(checkpoint.seen_pages)
+
+    async def _save_checkpoint(
+        self, filters_key: str, next_page: int | None, seen_pages: set[int], run: ExtractionRun
+    ) -> None:
+        """
+        Records the results pages and diary pages processed so far, once the
+        consumer has persisted every case yielded for them.
+        """
+        if self.checkpoint_store is None:
+            return
+        await self._wait_persisted(run)
+        checkpoint = CrawlCheckpoint(
+            filters_key=filters_key,
+            next_page=next_page,
+            seen_pages=sorted(seen_pages),
+            processed_urls=list(run.processed_urls),
+            exported_count=run.exported_count,
+            dead_letters=list(run.dead_letters),
+        )
+        await asyncio.to_thread(self.checkpoint_store.save, checkpoint)
+
+    async def _clear_checkpoint(self, filters_key: str, run: ExtractionRun) -> None:
+        if self.checkpoint_store is None:
+            return
+        await self._wait_persisted(run)
+        await asyncio.to_thread(self.checkpoint_store.clear, filters_key)
+
+    @staticmethod
+    async def _wait_persisted(run: ExtractionRun) -> None:
+        if run.wait_persisted is not None:
+            await run.wait_persisted()
+
+    def _reached_max_exported(self, run: ExtractionRun) -> bool:
+        if self.max_exported is not None and run.exported_count >= self.max_exported:
+            print(f"Reached max exported count: {self.max_exported}. Stopping extraction.")
+            run.stopped = True
+        return run.stopped
+
+    async def _fetch_search_page(
+        self, http_client: httpx.AsyncClient, filters: CourtCaseExtractorFilters, page_num: int
+    ) -> SearchResultsPage:
+        print(f"Fetching page {page_num}")
+        search_html = await self._submit_request_with_session(http_client, filters, page_num)
+        links = scan_search_page(search_html, self.base_url_root)
+        return SearchResultsPage(
+            page_num=page_num, popup_urls=links.popup_urls, page_links=links.page_links
+        )
+
+    async def _process_search_page(
+        self,
+        search_page: SearchResultsPage,
+        http_client: httpx.AsyncClient,
+        browser_session: PlaywrightBrowserSession,
+        run: ExtractionRun,
+    ) -> AsyncIterator[list[CourtCase]]:
+        """
+        Fetches and parses the detail pages of one results page, yielding the
+        cases of each diary page as soon as it is parsed.
+        """
+        detail_urls = self._unseen_targets(search_page.popup_urls, run)
+        if not detail_urls:
+            return
+
+        async with aclosing(
+            self._process_details(detail_urls, http_client, browser_session, run)
+        ) as batches:
+            async for batch in batches:
+                yield batch
+
+    async def _process_details(
+        self,
+        detail_urls: list[str],
+        http_client: httpx.AsyncClient,
+        browser_session: PlaywrightBrowserSession,
+        run: ExtractionRun,
+    ) -> AsyncIterator[list[CourtCase]]:
+        """
+        Fetches, parses and yields the cases of ``detail_urls``.
+
+        Pages that still fail after every retry are added to ``run.dead_letters``,
+        and the others to ``run.processed_urls`` once their cases are yielded.
+        Sets ``run.stopped`` when the export cap is reached.
+        """
+        get_context = self._lazy_context(
+            browser_session, self._get_cookies_for_playwright(http_client.cookies.jar)
+        )
+
+        async with aclosing(self._fetch_details(get_context, http_client, detail_urls)) as details:
+            async for detail_url, detail in details:
+                if detail.problem_reason:
+                    print(
+                        f"[ERROR] Problem detected on {detail_url}: "
+                        f"{detail.problem_reason}. Dead-lettering the page."
+                    )
+                    run.dead_letters.append(
+                        DeadLetter(detail_url, detail.problem_reason, detail.attempts)
+                    )
+                    continue
+
+                if detail.frame_html:
+                    cases = await self.parsing_executor.parse_html(
+                        detail.frame_html, run.published_at_fallback
+                    )
+                elif detail.pdf_content:
+                    cases = await self.parsing_executor.parse_pdf(
+                        detail.pdf_content, run.published_at_fallback
+                    )
                 else:
+                    cases = []
+
+                if self.max_exported is not None:
+                    cases = cases[: self.max_exported - run.exported_count]
+                if cases:
+                    run.exported_count += len(cases)
+                    yield cases
+                run.processed_urls.append(detail_url)
+
+                if self._reached_max_exported(run):
                     break
 
-        print(f"ExportedCount: {len(extracted_cases)} cases")
-        return extracted_cases
+    def _unseen_targets(self, popup_urls: list[str], run: ExtractionRun) -> list[str]:
+        """
+        Drops popups pointing to a diary page already fetched in this run.
+
+        Many search hits share the same diary page, and parsing a page already
+        yields every ``PROCESSO`` block on it, so the first fetch covers them all.
+        """
+        unseen = []
+        for popup_url in popup_urls:
+            target = DiaryPageKey.from_url(popup_url) or popup_url
+            if target in run.seen_targets:
+                run.duplicate_targets += 1
+                continue
+            run.seen_targets.add(target)
+            unseen.append(popup_url)
+        return unseen
+
+    def _lazy_context(
+        self, browser_session: PlaywrightBrowserSession, cookies: list[dict]
+    ) -> Callable[[], Awaitable[BrowserContext]]:
+        """
+        Returns a getter that opens the browser context on first use only, so
+        results pages served entirely over HTTP never start Chromium.
+        """
+        lock = asyncio.Lock()
+        context: BrowserContext | None = None
+
+        async def get_context() -> BrowserContext:
+            nonlocal context
+            async with lock:
+                if context is None:
+                    context = await browser_session.context(cookies)
+            return context
+
+        return get_context
+
+    async def _fetch_details(
+        self,
+        get_context: Callable[[], Awaitable[BrowserContext]],
+        http_client: httpx.AsyncClient,
+        detail_urls: list[str],
+    ) -> AsyncIterator[tuple[str, DetailPageResult]]:
+        """
+        Fetches detail pages concurrently, bounded by ``max_concurrent_pages``.
+
+        Results are yielded in the same order as ``detail_urls`` so that callers
+        can apply the export cap deterministically. Pending fetches are
+        cancelled as soon as the caller stops iterating.
 
-    def _submit_request_with_session(
-        self, s: httpx.Client, filters: CourtCaseExtractorFilters, page_num: int = 1
+        Failed pages are retried up to ``retry.max_attempts`` times with jittered
+        exponential backoff, outside the concurrency bound, and every attempt
+        waits for the circuit breaker to close.
+
+        In ``DetailFetchMode.HTTP_FIRST`` each diary page is requested directly
+        and the browser context is only requested for pages whose direct response
+        was a placeholder.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+
+        async def fetch_once(detail_url: str) -> DetailPageResult:
+            async with semaphore:
+                try:
+                    return await self._fetch_detail_page(get_context, http_client, detail_url)
+                except Exception as ex:
+                    return DetailPageResult(problem_reason=f"{type(ex).__name__}: {ex}")
+
+        async def fetch(detail_url: str) -> DetailPageResult:
+            for attempt in range(1, self.retry.max_attempts + 1):
+                await self.circuit_breaker.wait_until_closed()
+                detail = await fetch_once(detail_url)
+                self.circuit_breaker.record(success=not detail.problem_reason)
+                if not detail.problem_reason or attempt == self.retry.max_attempts:
+                    return replace(detail, attempts=attempt)
+                delay = backoff_delay(attempt, self.retry)
+                print(f"[Toolkit] Retrying {detail_url} in {delay:.1f}s: {detail.problem_reason}")
+                await asyncio.sleep(delay)
+
+        tasks = [asyncio.create_task(fetch(detail_url)) for detail_url in detail_urls]
+        try:
+            for detail_url, task in zip(detail_urls, tasks, strict=True):
+                yield detail_url, await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_detail_page(
+        self,
+        get_context: Callable[[], Awaitable[BrowserContext]],
+        http_client: httpx.AsyncClient,
+        detail_url: str,
+    ) -> DetailPageResult:
+        """
+        Fetches one diary page, directly first in ``HTTP_FIRST`` mode, and in the
+        browser otherwise or when the direct response is a placeholder.
+
+        The artifact sink samples each page once, whichever way it was served:
+        the direct response is kept in ``artifacts`` and captured along with the
+        rendered page when the browser takes over.
+        """
+        artifacts: dict[str, bytes] = {}
+        direct = None
+        if self.fetch_mode is DetailFetchMode.HTTP_FIRST:
+            direct = await self._fetch_detail_over_http(http_client, detail_url, artifacts)
+            if not direct.problem_reason:
+                # Empty when the page came from the cache, which is not sampled.
+                if artifacts and self.artifact_sink.sample(failed=False):
+                    self.artifact_sink.capture(self._artifact_name("diary", detail_url), artifacts)
+                return direct
+            print(f"[Toolkit] {direct.problem_reason}. Falling back to the browser.")
+        context = await get_context()
+        return await self._fetch_detail(context, http_client, detail_url, artifacts, direct=direct)
+
+    async def _fetch_detail(
+        self,
+        context: BrowserContext,
+        http_client: httpx.AsyncClient,
+        detail_url: str,
+        artifacts: dict[str, bytes] | None = None,
+        direct: DetailPageResult | None = None,
+    ) -> DetailPageResult:
+        """
+        Renders a diary popup in the browser.
+
+        :param artifacts: Artifacts already collected for this page, captured
+            with the rendered page when the sink samples it.
+        :param direct: The failed ``HTTP_FIRST`` fetch of this page, reported
+            instead of requesting ``getPaginaDoDiario.do`` a second time when
+            the frame is unusable.
+        """
+        artifacts = {} if artifacts is None else artifacts
+        cache_key = DiaryPageKey.from_url(detail_url)
+        cached = await self._cache_get(cache_key, "frame")
+        if cached is not None:
+            return DetailPageResult(frame_html=cached.decode("utf-8"))
+
+        print(f"Fetching detail page: {detail_url}")
+        detail_page = await context.new_page()
+        try:
+            await self._load_detail_page(detail_page, detail_url)
+            detail = await self._read_detail_page(
+                detail_page, http_client, detail_url, artifacts, direct
+            )
+            if self.artifact_sink.sample(failed=detail.problem_reason is not None):
+                await self._capture_page_artifacts(detail_page, detail_url, artifacts)
+        finally:
+            await detail_page.close()
+
+        if detail.frame_html and not detail.problem_reason:
+            await self._cache_put(cache_key, "frame", detail.frame_html.encode("utf-8"))
+        return detail
+
+    async def _load_detail_page(self, detail_page: Page, detail_url: str) -> None:
+        async with self.rate_limiters.permit(detail_url) as permit:
+            response = await detail_page.goto(
+                detail_url,
+                wait_until="domcontentloaded",
+                timeout=self.frame_wait.page_load_timeout * 1000,
+            )
+            if response is not None:
+                permit.signal = LimiterSignal.from_status(response.status)
+
+    async def _read_detail_page(
+        self,
+        detail_page: Page,
+        http_client: httpx.AsyncClient,
+        detail_url: str,
+        artifacts: dict[str, bytes],
+        direct: DetailPageResult | None = None,
+    ) -> DetailPageResult:
+        """
+        Reads the diary page rendered in ``bottomFrame``, following a pending
+        redirect, and falls back to ``getPaginaDoDiario.do`` when the frame is
+        missing or only shows the processing placeholder.
+        """
+        frame = await self._wait_for_bottom_frame(detail_page)
+        if not frame:
+            return await self._fall_back_from_frame(
+                http_client,
+                detail_url,
+                "bottomFrame not found and fallback failed",
+                artifacts,
+                direct,
+            )
+
+        await self._wait_for_frame_ready(frame)
+        frame_html = await frame.content()
+        if self._is_pending_frame_url(frame.url):
+            redirect_url = self._find_frame_redirect(frame_html)
+            if redirect_url:
+                await self._follow_frame_redirect(frame, urljoin(frame.url, redirect_url))
+                return DetailPageResult(frame_html=await frame.content())
+            problem = "Frame stuck on processando/do and fallback not usable"
+        else:
+            problem = (
+                "Frame loaded but only placeholder/processando content and fallback not usable"
+            )
+
+        if not is_placeholder(frame_html):
+            return DetailPageResult(frame_html=frame_html)
+        self.rate_limiters.for_url(detail_url).record(LimiterSignal.PLACEHOLDER)
+        return await self._fall_back_from_frame(http_client, detail_url, problem, artifacts, direct)
+
+    async def _fall_back_from_frame(
+        self,
+        http_client: httpx.AsyncClient,
+        detail_url: str,
+        problem: str,
+        artifacts: dict[str, bytes],
+        direct: DetailPageResult | None,
+    ) -> DetailPageResult:
+        """
+        Falls back to ``getPaginaDoDiario.do`` for an unusable frame, unless
+        ``direct`` already holds the failed response of that same request.
+        """
+        if direct is not None:
+            return DetailPageResult(problem_reason=f"{problem}: {direct.problem_reason}")
+        return await self._fetch_fallback_detail(http_client, detail_url, problem, artifacts)
+
+    async def _wait_for_bottom_frame(self, detail_page: Page) -> Frame | None:
+        """Waits until the popup attaches ``bottomFrame``, up to the attach deadline."""
+        try:
+            frame_element = await detail_page.wait_for_selector(
+                'frame[name="bottomFrame"]',
+                state="attached",
+                timeout=self.frame_wait.frame_attach_timeout * 1000,
+            )
+        except PlaywrightTimeoutError:
+            return None
+        if frame_element is None:
+            return None
+        return await frame_element.content_frame()
+
+    async def _wait_for_frame_ready(self, frame: Frame) -> None:
+        """
+        Waits until ``frame`` leaves the processing placeholder and finishes loading.
+
+        Returns as soon as the frame navigates to its content. When the ready
+        deadline passes the frame is left as is, and the caller inspects it for
+        a redirect or a placeholder.
+        """
+        try:
+            await frame.wait_for_url(
+                lambda url: not self._is_pending_frame_url(url),
+                wait_until="load",
+                timeout=self.frame_wait.frame_ready_timeout * 1000,
+            )
+        except PlaywrightTimeoutError:
+            pass
+
+    async def _follow_frame_redirect(self, frame: Frame, url: str) -> None:
+        try:
+            await frame.goto(
+                url, wait_until="load", timeout=self.frame_wait.redirect_timeout * 1000
+            )
+        except PlaywrightTimeoutError:
+            print(f"[Toolkit] Redirect to {url} did not finish loading in time.")
+
+    def _find_frame_redirect(self, frame_html: str) -> str | None:
+        meta_refresh = re.search(
+            r'<meta\s+http-equiv=["\']refresh["\']\s+content=["\'][^;]+;\s*url=([^"\'>]+)',
+            frame_html,
+            re.IGNORECASE,
+        )
+        if meta_refresh:
+            return meta_refresh.group(1)
+        js_redirect = re.search(
+            r'window\.location\.href\s*=\s*[\'"]([^\'"]+)[\'"]',
+            frame_html,
+        )
+        if js_redirect:
+            return js_redirect.group(1)
+        return None
+
+    def _is_pending_frame_url(self, url: str) -> bool:
+        return not url or "processando.do" in url or "about:blank" in url
+
+    async def _fetch_detail_over_http(
+        self,
+        http_client: httpx.AsyncClient,
+        detail_url: str,
+        artifacts: dict[str, bytes] | None = None,
+    ) -> DetailPageResult:
+        """Fetches a diary page straight from ``getPaginaDoDiario.do``, without a browser."""
+        return await self._fetch_fallback_detail(
+            http_client, detail_url, "Direct diary page fetch failed", artifacts
+        )
+
+    async def _fetch_fallback_detail(
+        self,
+        http_client: httpx.AsyncClient,
+        detail_url: str,
+        problem: str,
+        artifacts: dict[str, bytes] | None = None,
+    ) -> DetailPageResult:
+        """
+        Fetches ``getPaginaDoDiario.do`` for ``detail_url``, reporting ``problem``
+        along with the fallback error when it returns neither HTML nor a PDF.
+        """
+        frame_html, fallback_err, pdf_content = await self._fetch_pdf_fallback(
+            http_client, detail_url, artifacts
+        )
+        if not frame_html and not pdf_content:
+            return DetailPageResult(problem_reason=f"{problem}: {fallback_err}")
+        return DetailPageResult(frame_html=frame_html, pdf_content=pdf_content)
+
+    async def _capture_page_artifacts(
+        self, detail_page: Page, detail_url: str, collected: dict[str, bytes]
+    ) -> None:
+        artifacts = {**collected, "main_page.html": (await detail_page.content()).encode("utf-8")}
+        for index, fr in enumerate(detail_page.frames):
+            try:
+                fr_html = await fr.content()
+            except Exception:
+                continue
+            artifacts[f"frame_{index}_{fr.name or 'main'}.html"] = fr_html.encode("utf-8")
+        self.artifact_sink.capture(self._artifact_name("detail", detail_url), artifacts)
+
+    def _artifact_name(self, kind: str, detail_url: str) -> str:
+        key = DiaryPageKey.from_url(detail_url)
+        if key is None:
+            return kind
+        return f"{kind}-{key.nu_diario}-{key.cd_caderno}-{key.nu_seqpagina}"
+
+    async def _fetch_pdf_fallback(
+        self,
+        http_client: httpx.AsyncClient,
+        detail_url: str,
+        artifacts: dict[str, bytes] | None = None,
+    ) -> tuple[str | None, str | None, bytes | None]:
+        """
+        Requests ``getPaginaDoDiario.do`` for ``detail_url``.
+
+        :param artifacts: Receives the raw response, for the caller to capture
+            if the artifact sink samples the page.
+        """
+        cache_key = DiaryPageKey.from_url(detail_url)
+        cached = await self._cache_get(cache_key, "diary")
+        if cached is not None:
+            return read_diary_response(cached, cached.decode("utf-8", errors="replace"))
+
+        get_url = build_diary_page_url(detail_url)
+        print(f"[Toolkit] Fallback GET: {get_url}")
+        try:
+            async with self.rate_limiters.permit(get_url) as permit:
+                resp = await http_client.get(get_url)
+                content_type = resp.headers.get("content-type", "")
+                result = read_diary_response(resp.content, resp.text, content_type)
+                permit.signal = LimiterSignal.from_status(resp.status_code)
+                if permit.signal is LimiterSignal.OK and not result[0] and not result[2]:
+                    permit.signal = LimiterSignal.PLACEHOLDER
+        except Exception as ex:
+            print(f"[Toolkit] Fallback request failed: {ex}")
+            return None, "Fallback fetch failed", None
+
+        frame_html, _, pdf_content = result
+        if artifacts is not None:
+            artifacts[f"getPaginaDoDiario.{'pdf' if pdf_content else 'html'}"] = resp.content
+        if pdf_content:
+            await self._cache_put(cache_key, "diary", pdf_content)
+        elif frame_html:
+            await self._cache_put(cache_key, "diary", frame_html.encode("utf-8"))
+        return result
+
+    async def _cache_get(self, key: DiaryPageKey | None, kind: str) -> bytes | None:
+        if self.page_cache is None or key is None:
+            return None
+        return await asyncio.to_thread(self.page_cache.get, key, kind)
+
+    async def _cache_put(self, key: DiaryPageKey | None, kind: str, content: bytes) -> None:
+        if self.page_cache is None or key is None:
+            return
+        await asyncio.to_thread(self.page_cache.put, key, kind, content)
+
+    async def _submit_request_with_session(
+        self, s: httpx.AsyncClient, filters: CourtCaseExtractorFilters, page_num: int = 1
     ) -> str:
         url = self.url
-        data_inicial = self._convert_date_to_ddmmyyyy(filters.start_date)
-        data_final = self._convert_date_to_ddmmyyyy(filters.end_date)
-        data = {
-            "dadosConsulta.dtInicio": data_inicial,
-            "dadosConsulta.dtFim": data_final,
-            "dadosConsulta.cdCaderno": getattr(filters, "section_id", None) or "12",
-            "dadosConsulta.pesquisaLivre": getattr(filters, "search_terms", None) or "",
-            "pagina": str(page_num),
-        }
+        data = build_search_form(filters, page_num)
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
-            "User-Agent": "Mozilla/5.0 (compatible; CourtCaseExtractor/1.0)",
+            "User-Agent": USER_AGENT,
         }
-        response = s.post(url, data=data, headers=headers)
+        async with self.rate_limiters.permit(url) as permit:
+            response = await s.post(url, data=data, headers=headers)
+            permit.signal = LimiterSignal.from_status(response.status_code)
         if response.status_code != 200:
             raise Exception(f"Failed to fetch data: {response.status_code} - {response.text}")
         return response.text
 
-    def _convert_date_to_ddmmyyyy(self, date_obj: datetime | None) -> str:
-        if not date_obj:
-            return ""
-        try:
-            return date_obj.strftime("%d/%m/%Y")
-        except ValueError as e:
-            print(f"Error converting date: {e}")
-            return ""
-
-    def _extract_popup_url_from_onclick(self, onclick: str) -> str | None:
-        match = re.search(r"popup\('([^']+)'\)", onclick)
-        if match:
-            return match.group(1)
-        return None
-
-    def _find_next_page(self, soup: BeautifulSoup, seen_pages: set[int]) -> int | None:
-        nav_span = soup.find("span", class_="style5")
-        if not nav_span:
-            return None
-        for a in nav_span.find_all("a"):
-            onclick = a.get("onclick", "")
-            match = re.search(r"trocaDePg\((\d+)\)", onclick)
-            if match:
-                page_num = int(match.group(1))
-                if page_num not in seen_pages:
-                    return page_num
-        return None
-
     def _get_cookies_for_playwright(self, httpx_jar) -> list[dict]:
         cookies = []
         for cookie in httpx_jar:
@@ -372,84 +888,3 @@ class BsCrawleeCourtCaseExtractor(CourtCaseExtractor):
                 }
             )
         return cookies
-
-    def _parse_detail_html(self, html: str, published_at_fallback: datetime) -> list[CourtCase]:
-        soup = BeautifulSoup(html, "html.parser")
-        plain_text = soup.get_text(separator="\n", strip=True)
-        cases = []
-        published_at = published_at_fallback
-        published_at_match = re.search(r"Disponibiliza[çc][aã]o: ([^\n]+)", plain_text)
-        if published_at_match:
-            date_str = published_at_match.group(1).split("Diário")[0].strip()
-            try:
-                published_at = datetime.strptime(date_str, "%A, %d de %B de %Y")
-            except Exception as e:
-                print(f"Could not parse published_at: {e}")
-
-        process_blocks = re.split(r"(?=PROCESSO\s*:)", plain_text)
-        for block in process_blocks:
-            process_match = re.search(r"PROCESSO\s*:\s*([0-9\-.]+)", block)
-            lawyer_match = re.search(r"ADVOGADO\s*:\s*(.+)", block)
-            if process_match:
-                case_id = process_match.group(1).strip()
-                lawyer = lawyer_match.group(1).strip() if lawyer_match else ""
-                court_case_amount = CourtCaseAmount(
-                    Decimal("1000.00"), Decimal("1000.00"), Decimal("1000.00")
-                )
-                case = CourtCase(
-                    id=case_id,
-                    name=f"Case for {case_id}",
-                    lawyers=[lawyer] if lawyer else [],
-                    status=CourtCaseStatus.NEW,
-                    amount=court_case_amount,
-                    published_at=published_at,
-                    content=block.strip(),
-                )
-                cases.append(case)
-        return cases
-
-    def _parse_detail_pdf_text(
-        self, pdf_text: str, published_at_fallback: datetime
-    ) -> list[CourtCase]:
-        """
-        Parses extracted PDF text to return a list of CourtCase objects.
-        You can improve this regex logic as needed for your court's document format.
-        """
-        # Example: Match lines like 'Processo 0004319-12.2018.8.26.0509 - Execução da Pena - Aberto - ...'
-        cases = []
-        published_at = published_at_fallback
-        # Try to extract a publish date from the top of the PDF
-        published_at_match = re.search(r"Disponibiliza[çc][aã]o: ([^\n]+)", pdf_text)
-        if published_at_match:
-            date_str = published_at_match.group(1).split("Diário")[0].strip()
-            try:
-                published_at = datetime.strptime(date_str, "%A, %d de %B de %Y")
-            except Exception as e:
-                print(f"Could not parse published_at from PDF: {e}")
-
-        # Find all process blocks
-        process_pattern = re.compile(
-            r"(Processo\s*(?P<id>\d{7,}-\d{2}\.\d{4}\.\d{1,2}\.\d{2}\.\d{4}).*?)(?=Processo\s*\d{7,}-\d{2}\.\d{4}\.\d{1,2}\.\d{2}\.\d{4}|$)",
-            re.DOTALL,
-        )
-        matches = process_pattern.finditer(pdf_text)
-        for match in matches:
-            block = match.group(0)
-            case_id = match.group("id")
-            lawyer_match = re.search(r"ADV:\s*([A-ZÁ-Úa-zá-ú\s]+)\s*\(OAB\s*[\d\w/]+\)", block)
-            lawyer = lawyer_match.group(1).strip() if lawyer_match else ""
-            court_case_amount = CourtCaseAmount(
-                Decimal("1000.00"), Decimal("1000.00"), Decimal("1000.00")
-            )
-            case = CourtCase(
-                id=case_id,
-                name=f"Case for {case_id}",
-                lawyers=[lawyer] if lawyer else [],
-                status=CourtCaseStatus.NEW,
-                amount=court_case_amount,
-                published_at=published_at,
-                content=block.strip(),
-            )
-            cases.append(case)
-        print(f"Extracted {len(cases)} cases from PDF text")
-        return cases
@@ -0,0 +1,80 @@
+import dataclasses
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Self
+
+from scraper.domain.ports.court_case_extractor import CourtCaseExtractorFilters
+from scraper.infrastructure.crawlers.retry_policy import DeadLetter
+
+DEFAULT_CHECKPOINT_DIR = "storage/request_queues/checkpoints"
+
+
+@dataclass
+class CrawlCheckpoint:
+    """Progress of an extraction run, saved after every completed results page."""
+
+    filters_key: str
+    next_page: int | None
+    seen_pages: list[int] = field(default_factory=list)
+    processed_urls: list[str] = field(default_factory=list)
+    exported_count: int = 0
+    dead_letters: list[DeadLetter] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(dataclasses.asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> Self:
+        data = json.loads(raw)
+        data["dead_letters"] = [DeadLetter(**item) for item in data.get("dead_letters", [])]
+        return cls(**data)
+
+
+class CheckpointStore:
+    """
+    Stores one JSON checkpoint per set of search filters.
+
+    Checkpoints live next to crawlee's request queues, in
+    ``storage/request_queues/checkpoints`` by default, and are written
+    atomically so a run killed mid-write still finds the previous checkpoint.
+    Methods do blocking file IO and are meant to be called through
+    ``asyncio.to_thread``.
+    """
+
+    def __init__(self, directory: str | Path = DEFAULT_CHECKPOINT_DIR) -> None:
+        """
+        :param directory: Directory holding the checkpoint files, created if missing.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(filters: CourtCaseExtractorFilters) -> str:
+        """Returns a stable key identifying a crawl of ``filters``."""
+        raw = json.dumps(dataclasses.asdict(filters), default=str, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def load(self, filters_key: str) -> CrawlCheckpoint | None:
+        path = self._path(filters_key)
+        try:
+            return CrawlCheckpoint.from_json(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as ex:
+            print(f"[Toolkit] Ignoring unreadable checkpoint {path}: {ex}")
+            return None
+
+    def save(self, checkpoint: CrawlCheckpoint) -> None:
+        path = self._path(checkpoint.filters_key)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(checkpoint.to_json(), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def clear(self, filters_key: str) -> None:
+        self._path(filters_key).unlink(missing_ok=True)
+
+    def _path(self, filters_key: str) -> Path:
+        return self.directory / f"{filters_key}.json"
@@ -0,0 +1,378 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cache
+from typing import Any
+from urllib.parse import urlencode
+from uuid import uuid4
+
+from crawlee import ConcurrencySettings, Request, service_locator
+from crawlee.configuration import Configuration
+from crawlee.crawlers import (
+    BasicCrawlingContext,
+    HttpCrawler,
+    HttpCrawlingContext,
+    PlaywrightCrawler,
+    PlaywrightCrawlingContext,
+)
+from crawlee.storage_clients import MemoryStorageClient
+from crawlee.storages import RequestQueue
+
+from scraper.domain.court_case import CourtCase
+from scraper.domain.ports.court_case_extractor import (
+    CourtCaseExtractor,
+    CourtCaseExtractorFilters,
+)
+from scraper.infrastructure.crawlers.diary_page_cache import DiaryPageKey
+from scraper.infrastructure.crawlers.dje_pages import (
+    BASE_URL_ROOT,
+    SEARCH_URL,
+    build_diary_page_url,
+    build_search_form,
+    find_next_page,
+    is_placeholder,
+    read_diary_response,
+    scan_search_page,
+)
+from scraper.infrastructure.crawlers.parsing_executor import ParsingExecutor
+from scraper.infrastructure.juscash_assessment_settings import (
+    JuscashAssessmentSettings,
+    assessment_settings,
+)
+
+SEARCH_LABEL = "SEARCH"
+DIARY_PAGE_LABEL = "DIARY_PAGE"
+DEFAULT_MAX_CONCURRENCY = 8
+# Batches parsed but not yet consumed from which the crawler is paused, so a slow
+# consumer slows the crawl down instead of piling up cases. It resumes at half.
+MAX_PENDING_BATCHES = 32
+
+_CRAWLEE_CONFIGURATION = Configuration(
+    persist_storage=False, write_metadata=False, purge_on_start=False
+)
+
+
+@dataclass
+class CrawleeRun:
+    """Shared state of the crawlers of a single ``extract_stream`` call."""
+
+    filters: CourtCaseExtractorFilters
+    published_at_fallback: datetime
+    batches: asyncio.Queue[list[CourtCase] | None]
+    exported_count: int = 0
+    seen_pages: set[int] = field(default_factory=lambda: {1})
+    seen_targets: set[DiaryPageKey | str] = field(default_factory=set)
+    placeholder_urls: list[str] = field(default_factory=list)
+    failed_urls: list[str] = field(default_factory=list)
+    # AutoscaledPool of the running crawler, see _autoscaled_pool.
+    pool: Any = None
+    paused: bool = False
+
+    def pause(self) -> None:
+        """Stops the running crawler from starting new requests."""
+        if self.pool is not None and not self.paused:
+            print(f"[Toolkit] {self.batches.qsize()} batches waiting, pausing the crawler.")
+            self.pool.pause()
+            self.paused = True
+
+    def resume(self) -> None:
+        if self.pool is not None and self.paused:
+            self.pool.resume()
+        self.paused = False
+
+
+class CrawleeCourtCaseExtractor(CourtCaseExtractor):
+    """
+    Extracts court cases with crawlee's autoscaled crawlers.
+
+    An ``HttpCrawler`` handles two request types: ``SEARCH`` requests
+    post the search form and enqueue the next results page, and ``DIARY_PAGE``
+    requests fetch ``getPaginaDoDiario.do`` directly. Diary pages that only
+    return the "processando" placeholder are then rendered as ``DIARY_PAGE``
+    requests on a ``PlaywrightCrawler``.
+
+    Both crawlers run on crawlee's ``AutoscaledPool``, which grows and shrinks
+    concurrency up to ``max_concurrency`` from CPU and memory load, with their
+    own in-memory request queue, session pool and retries. Each crawler stops
+    after ``settings.max_requests_per_crawler`` requests and gives up on a
+    request handler after ``settings.timeout``.
+    """
+
+    def __init__(
+        self,
+        url: str = SEARCH_URL,
+        base_url_root: str = BASE_URL_ROOT,
+        settings: JuscashAssessmentSettings = assessment_settings,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_request_retries: int = 3,
+        parsing_executor: ParsingExecutor | None = None,
+    ) -> None:
+        """
+        :param url: Search form endpoint.
+        :param base_url_root: Root used to resolve relative popup URLs.
+        :param settings: Assessment settings providing the per-crawler request
+            budget and the request handler timeout.
+        :param max_concurrency: Upper bound for the autoscaled concurrency.
+        :param max_request_retries: Retries crawlee grants each failed request, on top
+            of its first attempt.
+        :param parsing_executor: Executor running HTML and PDF parsing off the event loop,
+            left open when a run ends. Defaults to one closed at the end of each run.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_request_retries < 0:
+            raise ValueError("max_request_retries must not be negative")
+        self.url = url
+        self.base_url_root = base_url_root
+        self.settings = settings
+        self.max_concurrency = max_concurrency
+        self.max_request_retries = max_request_retries
+        self.parsing_executor = parsing_executor or ParsingExecutor()
+        # An injected executor may be shared by several runs; its owner closes it.
+        self._owns_parsing_executor = parsing_executor is None
+
+    async def extract_stream(
+        self,
+        filters: CourtCaseExtractorFilters,
+        wait_persisted: Callable[[], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[list[CourtCase]]:
+        # Nothing to wait for: this extractor records no progress across runs.
+        print(f"Extracting court cases with crawlee, filters: {filters}")
+        run = CrawleeRun(
+            filters=filters,
+            published_at_fallback=filters.start_date if filters.start_date else datetime.now(),
+            batches=asyncio.Queue(),
+        )
+        crawl = asyncio.create_task(self._crawl(filters, run))
+        try:
+            while (batch := await run.batches.get()) is not None:
+                if run.batches.qsize() <= MAX_PENDING_BATCHES // 2:
+                    run.resume()
+                yield batch
+            await crawl
+        finally:
+            if not crawl.done():
+                crawl.cancel()
+                await asyncio.gather(crawl, return_exceptions=True)
+            if self._owns_parsing_executor:
+                await asyncio.to_thread(self.parsing_executor.close)
+
+        print(f"ExportedCount: {run.exported_count} cases")
+        if run.failed_urls:
+            print(f"[Toolkit] {len(run.failed_urls)} requests failed after every retry:")
+            for url in run.failed_urls:
+                print(f"  {url}")
+
+    async def _crawl(self, filters: CourtCaseExtractorFilters, run: CrawleeRun) -> None:
+        try:
+            await self._run_crawler(
+                self._build_http_crawler, run, [self._search_request(filters, 1)]
+            )
+            if run.placeholder_urls:
+                print(
+                    f"[Toolkit] Rendering {len(run.placeholder_urls)} diary pages in the browser."
+                )
+                await self._run_crawler(
+                    self._build_browser_crawler,
+                    run,
+                    [
+                        Request.from_url(popup_url, label=DIARY_PAGE_LABEL)
+                        for popup_url in run.placeholder_urls
+                    ],
+                )
+        finally:
+            run.batches.put_nowait(None)
+
+    async def _run_crawler(
+        self,
+        build_crawler: Callable[[CrawleeRun, RequestQueue], HttpCrawler | PlaywrightCrawler],
+        run: CrawleeRun,
+        requests: list[Request],
+    ) -> None:
+        request_queue = await self._open_request_queue()
+        crawler = build_crawler(run, request_queue)
+        run.pool, run.paused = _autoscaled_pool(crawler), False
+        try:
+            await crawler.run(requests)
+            if not await request_queue.is_finished():
+                print(
+                    f"[Toolkit] The crawler stopped at its limit of "
+                    f"{self.settings.max_requests_per_crawler} requests with requests left "
+                    "in its queue; raise max_requests_per_crawler to crawl them."
+                )
+        finally:
+            run.pool, run.paused = None, False
+            await request_queue.drop()
+
+    @staticmethod
+    async def _open_request_queue() -> RequestQueue:
+        """Opens a request queue private to one crawler of one run."""
+        _configure_crawlee()
+        return await RequestQueue.open(name=f"dje-{uuid4().hex}")
+
+    def _crawler_options(self, request_queue: RequestQueue) -> dict:
+        return {
+            "request_manager": request_queue,
+            "max_requests_per_crawl": self.settings.max_requests_per_crawler,
+            "request_handler_timeout": self.settings.timeout,
+            "max_request_retries": self.max_request_retries,
+            "concurrency_settings": ConcurrencySettings(
+                min_concurrency=1, max_concurrency=self.max_concurrency
+            ),
+        }
+
+    def _build_http_crawler(self, run: CrawleeRun, request_queue: RequestQueue) -> HttpCrawler:
+        crawler = HttpCrawler(**self._crawler_options(request_queue))
+
+        @crawler.router.handler(SEARCH_LABEL)
+        async def search_handler(context: HttpCrawlingContext) -> None:
+            await self._handle_search(context, run)
+
+        @crawler.router.handler(DIARY_PAGE_LABEL)
+        async def diary_page_handler(context: HttpCrawlingContext) -> None:
+            await self._handle_diary_page(context, run)
+
+        @crawler.failed_request_handler
+        async def failed_handler(context: BasicCrawlingContext, error: Exception) -> None:
+            run.failed_urls.append(context.request.url)
+
+        return crawler
+
+    def _build_browser_crawler(
+        self, run: CrawleeRun, request_queue: RequestQueue
+    ) -> PlaywrightCrawler:
+        crawler = PlaywrightCrawler(
+            browser_type="chromium", headless=True, **self._crawler_options(request_queue)
+        )
+
+        @crawler.router.handler(DIARY_PAGE_LABEL)
+        async def rendered_page_handler(context: PlaywrightCrawlingContext) -> None:
+            await self._handle_rendered_page(context, run)
+
+        @crawler.failed_request_handler
+        async def failed_handler(context: BasicCrawlingContext, error: Exception) -> None:
+            run.failed_urls.append(context.request.url)
+
+        return crawler
+
+    def _search_request(self, filters: CourtCaseExtractorFilters, page_num: int) -> Request:
+        return Request.from_url(
+            self.url,
+            method="POST",
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            payload=urlencode(build_search_form(filters, page_num)),
+            label=SEARCH_LABEL,
+            use_extended_unique_key=True,
+            user_data={"page_num": page_num},
+        )
+
+    async def _handle_search(self, context: HttpCrawlingContext, run: CrawleeRun) -> None:
+        """Enqueues the diary pages of a results page and the next results page."""
+        search_html = context.http_response.read().decode("utf-8", errors="replace")
+        links = scan_search_page(search_html, self.base_url_root)
+        if not links.popup_urls:
+            print(f"No popups found on page {context.request.user_data['page_num']}.")
+            return
+
+        requests = []
+        for popup_url in links.popup_urls:
+            target = DiaryPageKey.from_url(popup_url) or popup_url
+            if target in run.seen_targets:
+                continue
+            run.seen_targets.add(target)
+            requests.append(
+                Request.from_url(
+                    build_diary_page_url(popup_url),
+                    label=DIARY_PAGE_LABEL,
+                    user_data={"popup_url": popup_url},
+                )
+            )
+
+        next_page = find_next_page(links.page_links, run.seen_pages)
+        if next_page:
+            run.seen_pages.add(next_page)
+            requests.append(self._search_request(run.filters, next_page))
+
+        await context.add_requests(requests)
+
+    async def _handle_diary_page(self, context: HttpCrawlingContext, run: CrawleeRun) -> None:
+        """Parses a directly fetched diary page, deferring placeholders to the browser."""
+        content = context.http_response.read()
+        content_type = context.http_response.headers.get("content-type", "")
+        frame_html, _, pdf_content = read_diary_response(
+            content, content.decode("utf-8", errors="replace"), content_type
+        )
+        if frame_html:
+            cases = await self.parsing_executor.parse_html(frame_html, run.published_at_fallback)
+        elif pdf_content:
+            cases = await self.parsing_executor.parse_pdf(pdf_content, run.published_at_fallback)
+        else:
+            run.placeholder_urls.append(context.request.user_data["popup_url"])
+            return
+        await self._publish(cases, run)
+
+    async def _handle_rendered_page(
+        self, context: PlaywrightCrawlingContext, run: CrawleeRun
+    ) -> None:
+        """Reads ``bottomFrame`` once the popup has replaced its placeholder."""
+        timeout = self.settings.timeout.total_seconds() * 1000
+        frame_element = await context.page.wait_for_selector(
+            'frame[name="bottomFrame"]', state="attached", timeout=timeout
+        )
+        frame = await frame_element.content_frame()
+        await frame.wait_for_url(
+            lambda url: bool(url) and "processando.do" not in url and "about:blank" not in url,
+            wait_until="load",
+            timeout=timeout,
+        )
+        frame_html = await frame.content()
+        if is_placeholder(frame_html):
+            # Raising hands the request back to crawlee's retry logic.
+            raise RuntimeError(f"Diary page still processing: {context.request.url}")
+        cases = await self.parsing_executor.parse_html(frame_html, run.published_at_fallback)
+        await self._publish(cases, run)
+
+    async def _publish(self, cases: list[CourtCase], run: CrawleeRun) -> None:
+        """
+        Hands parsed cases to ``extract_stream`` without waiting, since request
+        handlers run under crawlee's ``request_handler_timeout``. Backpressure
+        comes from pausing the crawler once ``MAX_PENDING_BATCHES`` are waiting.
+        """
+        if cases:
+            run.batches.put_nowait(cases)
+            run.exported_count += len(cases)
+            if run.batches.qsize() >= MAX_PENDING_BATCHES:
+                run.pause()
+
+
+@cache
+def _configure_crawlee() -> None:
+    """
+    Keeps crawlee's storages in memory.
+
+    By default crawlee persists request queues, statistics and sessions under
+    ``./storage`` and purges that directory whenever a crawler starts. The
+    service locator only accepts this once per process, before any crawler
+    retrieves its services.
+    """
+    service_locator.set_configuration(_CRAWLEE_CONFIGURATION)
+    service_locator.set_storage_client(MemoryStorageClient.from_config(_CRAWLEE_CONFIGURATION))
+
+
+def _autoscaled_pool(crawler: HttpCrawler | PlaywrightCrawler) -> Any:
+    """
+    Returns the ``AutoscaledPool`` running ``crawler``, whose ``pause`` and
+    ``resume`` apply the backpressure of ``CrawleeRun``.
+
+    crawlee only exposes them on the private ``_autoscaled_pool`` attribute,
+    so this fails loudly when an upgrade moves it, rather than letting the
+    crawl run without backpressure.
+    """
+    pool = getattr(crawler, "_autoscaled_pool", None)
+    if not callable(getattr(pool, "pause", None)) or not callable(getattr(pool, "resume", None)):
+        raise RuntimeError(
+            f"{type(crawler).__name__} has no _autoscaled_pool with pause() and resume(); "
+            "this crawlee version is not supported by the crawler backpressure"
+        )
+    return pool
@@ -0,0 +1,163 @@
+import contextlib
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024
+# Writes between two scans of the directory size, which other processes also change.
+RESCAN_EVERY_PUTS = 100
+
+
+@dataclass(frozen=True)
+class DiaryPageKey:
+    """
+    Identifies a published DJE diary page.
+
+    Published pages never change, so these four parameters fully address the
+    content of both the popup frame and the ``getPaginaDoDiario.do`` response.
+    """
+
+    cd_volume: str
+    nu_diario: str
+    cd_caderno: str
+    nu_seqpagina: str
+
+    @classmethod
+    def from_url(cls, url: str) -> Self | None:
+        """
+        Build a key from a popup or ``getPaginaDoDiario.do`` URL.
+
+        :param url: URL carrying the diary page query parameters.
+        :return: The key, or None when the URL does not identify a diary page.
+        """
+        params = parse_qs(urlparse(url).query)
+        nu_diario = params.get("nuDiario", [""])[0]
+        nu_seqpagina = params.get("nuSeqpagina", [""])[0]
+        if not nu_diario or not nu_seqpagina:
+            return None
+        return cls(
+            cd_volume=params.get("cdVolume", [""])[0],
+            nu_diario=nu_diario,
+            cd_caderno=params.get("cdCaderno", [""])[0],
+            nu_seqpagina=nu_seqpagina,
+        )
+
+    @property
+    def digest(self) -> str:
+        raw = f"{self.cd_volume}|{self.nu_diario}|{self.cd_caderno}|{self.nu_seqpagina}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class DiaryPageCache:
+    """
+    Persistent, size-capped cache of immutable diary page responses.
+
+    Entries are stored as ``<sha256 of key>.<kind>`` files. Reads refresh the
+    file modification time, and writes evict the least recently used files
+    until the cache fits into ``max_bytes``. Methods do blocking file IO and
+    are meant to be called through ``asyncio.to_thread``.
+
+    Several processes, such as the ``scrape-range`` workers, may share the
+    directory. Files can then vanish between listing and use, which is
+    treated like a miss, and the total size is re-read from disk before
+    evicting and every ``RESCAN_EVERY_PUTS`` writes instead of trusting the
+    bytes this process wrote.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> None:
+        """
+        :param directory: Directory holding the cached files, created if missing.
+        :param max_bytes: Maximum total size of the cached files.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._size = self._disk_usage()
+        self._puts_since_scan = 0
+
+    def get(self, key: DiaryPageKey, kind: str) -> bytes | None:
+        """
+        Return the cached content for a page, or None on a miss.
+
+        :param key: Diary page identifier.
+        :param kind: Kind of response, e.g. ``"diary"`` or ``"frame"``.
+        """
+        path = self._path(key, kind)
+        with self._lock:
+            try:
+                content = path.read_bytes()
+            except FileNotFoundError:
+                self.misses += 1
+                return None
+            # Another process may have evicted it since; the content read is still valid.
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(path)
+            self.hits += 1
+            return content
+
+    def put(self, key: DiaryPageKey, kind: str, content: bytes) -> None:
+        """
+        Store the content for a page, evicting least recently used entries if needed.
+
+        :param key: Diary page identifier.
+        :param kind: Kind of response, e.g. ``"diary"`` or ``"frame"``.
+        :param content: Raw response content.
+        """
+        if len(content) > self.max_bytes:
+            return
+        path = self._path(key, kind)
+        # Unique per process and thread, so concurrent writers never share a temporary file.
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}-{threading.get_ident()}.tmp")
+        with self._lock:
+            previous_size = self._file_size(path)
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+            self._size += len(content) - previous_size
+            self._puts_since_scan += 1
+            if self._size > self.max_bytes or self._puts_since_scan >= RESCAN_EVERY_PUTS:
+                self._size = self._disk_usage()
+                self._puts_since_scan = 0
+                self._evict()
+
+    def _evict(self) -> None:
+        if self._size <= self.max_bytes:
+            return
+        for _, size, path in sorted(self._entry_stats()):
+            if self._size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= size
+
+    def _disk_usage(self) -> int:
+        return sum(size for _, size, _ in self._entry_stats())
+
+    def _entry_stats(self) -> list[tuple[float, int, Path]]:
+        """Modification time and size of each entry, skipping files removed meanwhile."""
+        stats = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            stats.append((stat.st_mtime, stat.st_size, path))
+        return stats
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _entries(self) -> list[Path]:
+        return [path for path in self.directory.iterdir() if path.suffix != ".tmp"]
+
+    def _path(self, key: DiaryPageKey, kind: str) -> Path:
+        return self.directory / f"{key.digest}.{kind}"
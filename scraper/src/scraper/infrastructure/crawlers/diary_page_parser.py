@@ -0,0 +1,86 @@
+"""
+Pure parsing functions for DJE diary pages.
+
+Everything here is CPU-bound and free of IO or shared state, so it can run in
+worker processes through ``ParsingExecutor``.
+"""
+
+import io
+from datetime import datetime
+from decimal import Decimal
+
+from scraper.domain.court_case import CourtCase, CourtCaseAmount, CourtCaseStatus
+from scraper.infrastructure.crawlers.diary_text_tokenizer import tokenize_diary_text
+from scraper.infrastructure.crawlers.html_parsing import html_to_text
+
+try:
+    from pdfminer.high_level import extract_text as pdfminer_extract_text
+except ImportError:
+    pdfminer_extract_text = None
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+
+
+def extract_pdf_text(content: bytes) -> str:
+    """Extracts the text of a PDF with PDFMiner, falling back to PyPDF2."""
+    extracted_pdf_text = ""
+    if pdfminer_extract_text:
+        try:
+            extracted_pdf_text = pdfminer_extract_text(io.BytesIO(content))
+        except Exception as e:
+            print("[Toolkit] PDFMiner extraction failed:", e)
+    if not extracted_pdf_text and PdfReader:
+        try:
+            reader = PdfReader(io.BytesIO(content))
+            pages = [p.extract_text() for p in reader.pages]
+            extracted_pdf_text = "\n".join([p or "" for p in pages])
+        except Exception as e:
+            print("[Toolkit] PyPDF2 extraction failed:", e)
+    return extracted_pdf_text
+
+
+def parse_detail_pdf(content: bytes, published_at_fallback: datetime) -> list[CourtCase]:
+    """Extracts the text of a diary page PDF and parses its process blocks."""
+    return parse_detail_pdf_text(extract_pdf_text(content), published_at_fallback)
+
+
+def parse_detail_html(html: str, published_at_fallback: datetime) -> list[CourtCase]:
+    """Parses a diary page frame, returning one CourtCase per ``PROCESSO`` block."""
+    return parse_diary_text(html_to_text(html), published_at_fallback)
+
+
+def parse_detail_pdf_text(pdf_text: str, published_at_fallback: datetime) -> list[CourtCase]:
+    """Parses the text extracted from a diary page PDF, one CourtCase per ``Processo`` block."""
+    cases = parse_diary_text(pdf_text, published_at_fallback)
+    print(f"Extracted {len(cases)} cases from PDF text")
+    return cases
+
+
+def parse_diary_text(text: str, published_at_fallback: datetime) -> list[CourtCase]:
+    """
+    Builds the court cases of a diary page from its plain text.
+
+    :param text: Text of the page, from its HTML or PDF.
+    :param published_at_fallback: Publication date used when the page has none.
+    """
+    diary_text = tokenize_diary_text(text)
+    published_at = diary_text.published_at or published_at_fallback
+    return [
+        CourtCase(
+            id=block.case_id,
+            name=f"Case for {block.case_id}",
+            lawyers=block.lawyers,
+            status=CourtCaseStatus.NEW,
+            amount=CourtCaseAmount(
+                gross_principal=block.gross_principal or Decimal("0"),
+                interest=block.interest or Decimal("0"),
+                lawyer_fees=block.lawyer_fees or Decimal("0"),
+            ),
+            published_at=published_at,
+            content=text[block.start : block.end].strip(),
+        )
+        for block in diary_text.blocks
+    ]
@@ -0,0 +1,157 @@
+"""
+Single-pass tokenizer for the text of DJE diary pages.
+
+One precompiled regex scans the page text once, left to right, and every
+match is a token: a process number starting a new block, a lawyers line,
+an amount label, an ``R$`` amount or the publication date. No alternative
+consumes more than the rest of its line, and the scan resumes after each
+token, so it stays linear in the size of the text however many blocks a
+page holds.
+
+Both the HTML and the PDF diary pages go through ``tokenize_diary_text``.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+
+_CNJ_NUMBER = r"\d{7,}-\d{2}\.\d{4}\.\d{1,2}\.\d{2}\.\d{4}"
+
+_TOKEN_RE = re.compile(
+    rf"""
+    (?P<PROCESS>PROCESSO\s*:\s*(?P<process_id>\d[\d.\-]*))
+    | (?P<CNJ_PROCESS>Processo\s*(?P<cnj_id>{_CNJ_NUMBER}))
+    | (?P<LAWYERS>\bADV(?:OGADO)?S?\s*:[ \t]*(?P<lawyers>(?:(?!Processo|PROCESSO)[^\n])*))
+    | (?P<PUBLISHED>Disponibiliza[çc][aã]o\s*:[ \t]*(?P<published>[^\n]*))
+    | (?P<PRINCIPAL>(?i:\bprincipal\b))
+    | (?P<INTEREST>(?i:\bjuros\b))
+    | (?P<FEES>(?i:\bhonor[áa]rios\b))
+    | (?P<AMOUNT>R\$\s*(?P<amount>\d{{1,3}}(?:\.\d{{3}})+,\d{{2}}|\d+,\d{{2}}))
+    """,
+    re.VERBOSE,
+)
+_OAB_RE = re.compile(r"\(OAB\b[^)\n]*\)")
+_DATE_RE = re.compile(r"(\d{1,2})\s+de\s+([A-Za-zç]+)\s+de\s+(\d{4})", re.IGNORECASE)
+
+_MONTHS = {
+    "janeiro": 1,
+    "fevereiro": 2,
+    "março": 3,
+    "marco": 3,
+    "abril": 4,
+    "maio": 5,
+    "junho": 6,
+    "julho": 7,
+    "agosto": 8,
+    "setembro": 9,
+    "outubro": 10,
+    "novembro": 11,
+    "dezembro": 12,
+}
+_AMOUNT_FIELDS = {"PRINCIPAL": "gross_principal", "INTEREST": "interest", "FEES": "lawyer_fees"}
+
+
+@dataclass
+class ProcessBlock:
+    """The text of one process in a diary page and the fields found in it."""
+
+    case_id: str
+    start: int
+    end: int = -1
+    lawyers: list[str] = field(default_factory=list)
+    gross_principal: Decimal | None = None
+    interest: Decimal | None = None
+    lawyer_fees: Decimal | None = None
+
+    def add_amount(self, amount_field: str | None, amount: Decimal) -> None:
+        """Sets ``amount_field``, or the principal when unlabeled, unless already set."""
+        amount_field = amount_field or ("gross_principal" if self.gross_principal is None else None)
+        if amount_field and getattr(self, amount_field) is None:
+            setattr(self, amount_field, amount)
+
+
+@dataclass
+class DiaryText:
+    """The process blocks of a diary page and its publication date, if found."""
+
+    blocks: list[ProcessBlock]
+    published_at: datetime | None = None
+
+
+def tokenize_diary_text(text: str) -> DiaryText:
+    """
+    Splits ``text`` into process blocks and extracts their fields in one pass.
+
+    A block starts at ``PROCESSO: <number>`` or ``Processo <CNJ number>`` and
+    runs until the next one; a repeated mention of the current process does
+    not start a new block. Lawyers come from ``ADV:``/``ADVOGADO:`` lines,
+    split on their ``(OAB ...)`` registrations. An ``R$`` amount is assigned
+    to the last label seen before it (principal, juros or honorários), or to
+    the principal when it has no label and the principal is still unset.
+
+    :param text: Plain text of a diary page, as extracted from its HTML or PDF.
+    """
+    blocks: list[ProcessBlock] = []
+    published_at: datetime | None = None
+    current: ProcessBlock | None = None
+    pending_field: str | None = None
+
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind in ("PROCESS", "CNJ_PROCESS"):
+            case_id = match.group("process_id") or match.group("cnj_id")
+            if current is not None and current.case_id == case_id:
+                continue
+            if current is not None:
+                current.end = match.start()
+            current = ProcessBlock(case_id=case_id, start=match.start())
+            blocks.append(current)
+            pending_field = None
+        elif kind == "PUBLISHED":
+            published_at = published_at or parse_publication_date(match.group("published"))
+        elif current is None:
+            continue
+        elif kind == "LAWYERS":
+            current.lawyers.extend(_split_lawyers(match.group("lawyers")))
+        elif kind == "AMOUNT":
+            current.add_amount(pending_field, parse_amount(match.group("amount")))
+            pending_field = None
+        else:
+            pending_field = _AMOUNT_FIELDS[kind]
+
+    if current is not None:
+        current.end = len(text)
+    return DiaryText(blocks=blocks, published_at=published_at)
+
+
+def parse_amount(value: str) -> Decimal:
+    """Converts a Brazilian formatted amount, such as ``1.234,56``, to a Decimal."""
+    return Decimal(value.replace(".", "").replace(",", "."))
+
+
+def parse_publication_date(value: str) -> datetime | None:
+    """
+    Parses dates such as ``Quarta-feira, 13 de novembro de 2024``.
+
+    Month names are matched against a Portuguese table, so this does not
+    depend on the process locale.
+    """
+    match = _DATE_RE.search(value)
+    if not match:
+        return None
+    month = _MONTHS.get(match.group(2).lower())
+    if month is None:
+        return None
+    try:
+        return datetime(int(match.group(3)), month, int(match.group(1)))
+    except ValueError:
+        return None
+
+
+def _split_lawyers(value: str) -> list[str]:
+    # "A (OAB 1/SP), B (OAB 2/SP) ..." splits into the names plus the trailing text.
+    *names, rest = _OAB_RE.split(value)
+    if not names:
+        names = [rest]
+    return [name for name in (name.strip(" \t-,;") for name in names) if name]
@@ -0,0 +1,172 @@
+"""Helpers for the DJE search form, its results pages and the diary page endpoint."""
+
+import html
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from urllib.parse import parse_qs, parse_qsl, urlencode, urljoin, urlparse
+
+from scraper.domain.ports.court_case_extractor import CourtCaseExtractorFilters
+
+SEARCH_URL = "https://dje.tjsp.jus.br/cdje/consultaAvancada.do"
+BASE_URL_ROOT = "https://dje.tjsp.jus.br"
+DEFAULT_SECTION_ID = "12"
+
+_POPUP_RE = re.compile(r"popup\('([^']+)'\)")
+_NEXT_PAGE_RE = re.compile(r"trocaDePg\((\d+)\)")
+# Opening and closing <a> and <span> tags, with quoted attribute values that may contain ">".
+_TAG_RE = re.compile(r"""<(/?)(a|span)\b((?:[^>"']|"[^"]*"|'[^']*')*)>""", re.IGNORECASE)
+_ATTR_RE = re.compile(r"""([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?""")
+
+
+@dataclass(frozen=True)
+class SearchPageLinks:
+    """The links of a search results page the crawler follows."""
+
+    popup_urls: list[str]
+    page_links: list[int]
+
+
+def build_search_form(filters: CourtCaseExtractorFilters, page_num: int = 1) -> dict[str, str]:
+    """
+    Builds the form posted to ``consultaAvancada.do`` for one results page.
+
+    :param filters: Search filters.
+    :param page_num: Results page to request, starting at 1.
+    """
+    return {
+        "dadosConsulta.dtInicio": _format_date(filters.start_date),
+        "dadosConsulta.dtFim": _format_date(filters.end_date),
+        "dadosConsulta.cdCaderno": getattr(filters, "section_id", None) or DEFAULT_SECTION_ID,
+        "dadosConsulta.pesquisaLivre": getattr(filters, "search_terms", None) or "",
+        "pagina": str(page_num),
+    }
+
+
+def scan_search_page(search_html: str, base_url_root: str = BASE_URL_ROOT) -> SearchPageLinks:
+    """
+    Extracts the popup and pagination links of a results page without building a tree.
+
+    Results pages are large and only their ``<a>`` tags matter, so this scans
+    the ``<a>`` and ``<span>`` tags with a regex instead of parsing the whole
+    document. Popup URLs come from the ``onclick`` of every
+    ``a.layout[title="Visualizar"]`` link, canonical and absolute; page
+    numbers from the ``trocaDePg`` links inside the first ``span.style5``.
+    """
+    popup_urls: list[str] = []
+    page_links: list[int] = []
+    nav_depth = 0
+    nav_done = False
+    for match in _TAG_RE.finditer(search_html):
+        closing, tag, raw_attrs = match.group(1), match.group(2).lower(), match.group(3)
+        if tag == "span":
+            if nav_depth:
+                nav_depth += -1 if closing else 1
+                nav_done = nav_done or nav_depth == 0
+            elif (
+                not closing
+                and not nav_done
+                and "style5" in raw_attrs
+                and "style5" in _attrs(raw_attrs).get("class", "").split()
+            ):
+                nav_depth = 1
+            continue
+        # Most links are neither popups nor page links; skip them before parsing attributes.
+        if closing or ("popup(" not in raw_attrs and "trocaDePg(" not in raw_attrs):
+            continue
+
+        attrs = _attrs(raw_attrs)
+        onclick = attrs.get("onclick", "")
+        if nav_depth and (page_num := page_number_from_onclick(onclick)) is not None:
+            page_links.append(page_num)
+        if "layout" in attrs.get("class", "").split() and attrs.get("title") == "Visualizar":
+            popup_url = popup_url_from_onclick(onclick, base_url_root)
+            if popup_url:
+                popup_urls.append(popup_url)
+    return SearchPageLinks(popup_urls=popup_urls, page_links=page_links)
+
+
+def popup_url_from_onclick(onclick: str, base_url_root: str = BASE_URL_ROOT) -> str | None:
+    """Returns the canonical, absolute URL opened by a ``popup('...')`` handler, if any."""
+    match = _POPUP_RE.search(onclick)
+    if not match:
+        return None
+    return canonicalize_popup_url(urljoin(base_url_root, match.group(1)))
+
+
+def page_number_from_onclick(onclick: str) -> int | None:
+    """Returns the results page requested by a ``trocaDePg(n)`` handler, if any."""
+    match = _NEXT_PAGE_RE.search(onclick)
+    return int(match.group(1)) if match else None
+
+
+def canonicalize_popup_url(popup_url: str) -> str:
+    """Sorts the query parameters so equivalent popup URLs compare equal."""
+    parsed = urlparse(popup_url)
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return parsed._replace(query=query, fragment="").geturl()
+
+
+def find_next_page(page_links: list[int], seen_pages: set[int]) -> int | None:
+    """Returns the first linked results page that was not seen yet."""
+    return next((page_num for page_num in page_links if page_num not in seen_pages), None)
+
+
+def build_diary_page_url(detail_url: str) -> str:
+    """Maps a popup URL to the ``getPaginaDoDiario.do`` URL serving the same diary page."""
+    parsed = urlparse(detail_url)
+    params = parse_qs(parsed.query)
+    base_get_pagina = f"{parsed.scheme}://{parsed.netloc}/cdje/getPaginaDoDiario.do"
+    get_params = {
+        "cdVolume": params.get("cdVolume", [""])[0],
+        "nuDiario": params.get("nuDiario", [""])[0],
+        "cdCaderno": params.get("cdCaderno", [""])[0],
+        "nuSeqpagina": params.get("nuSeqpagina", [""])[0],
+        "uuidCaptcha": "",
+    }
+    return base_get_pagina + "?" + urlencode(get_params)
+
+
+def is_placeholder(html: str) -> bool:
+    """Whether ``html`` is the "processando" page shown while a diary page is rendered."""
+    return (
+        "<title>Insert title here" in html
+        or "processando" in html
+        or "BENV_exibeProcessando" in html
+    )
+
+
+def read_diary_response(
+    content: bytes, text: str, content_type: str = ""
+) -> tuple[str | None, str | None, bytes | None]:
+    """
+    Classifies a ``getPaginaDoDiario.do`` response.
+
+    :return: A ``(html, problem, pdf_content)`` tuple, where ``html`` is set for
+        usable HTML, ``pdf_content`` for a PDF, and ``problem`` describes the
+        response whenever it is not usable HTML.
+    """
+    if content[:5] == b"%PDF-" or "application/pdf" in content_type:
+        return None, "Fallback returned a PDF file", content
+    if is_placeholder(text) or len(text.strip()) <= 50:
+        return None, "Fallback returned only placeholder/empty content", None
+    return text, None, None
+
+
+def _format_date(date_obj: datetime | None) -> str:
+    if not date_obj:
+        return ""
+    try:
+        return date_obj.strftime("%d/%m/%Y")
+    except ValueError as e:
+        print(f"Error converting date: {e}")
+        return ""
+
+
+def _attrs(raw_attrs: str) -> dict[str, str]:
+    return {
+        match.group(1).lower(): html.unescape(
+            next((value for value in match.group(2, 3, 4) if value is not None), "")
+        )
+        for match in _ATTR_RE.finditer(raw_attrs)
+    }
@@ -0,0 +1,57 @@
+"""
+HTML parsing backends.
+
+lxml is used when it is installed, as it parses large DJE pages several times
+faster than the pure-Python ``html.parser``, which remains the fallback.
+``SCRAPER_HTML_PARSER=html.parser`` forces the fallback.
+"""
+
+import os
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+    etree = None
+
+LXML = "lxml"
+HTML_PARSER = "html.parser"
+
+_IGNORED_TEXT_ELEMENTS = ("script", "style", "template")
+
+
+def default_backend() -> str:
+    """Returns the backend used when none is given: lxml if available, else html.parser."""
+    if lxml is None or os.getenv("SCRAPER_HTML_PARSER") == HTML_PARSER:
+        return HTML_PARSER
+    return LXML
+
+
+def html_to_text(html: str, backend: str | None = None) -> str:
+    """
+    Returns the visible text of ``html``, one stripped string per line.
+
+    The result matches ``soup.get_text(separator="\\n", strip=True)``; with
+    lxml it is built straight from the lxml tree, skipping BeautifulSoup.
+
+    :param html: HTML to extract the text from.
+    :param backend: ``"lxml"`` or ``"html.parser"``, defaults to ``default_backend()``.
+    """
+    if (backend or default_backend()) == LXML and lxml and html.strip():
+        try:
+            root = lxml.html.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            pass
+        else:
+            etree.strip_elements(
+                root,
+                *_IGNORED_TEXT_ELEMENTS,
+                etree.Comment,
+                etree.ProcessingInstruction,
+                with_tail=False,
+            )
+            return "\n".join(text for text in (t.strip() for t in root.itertext()) if text)
+    return BeautifulSoup(html, HTML_PARSER).get_text(separator="\n", strip=True)
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+
+import httpx
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+USER_AGENT = "Mozilla/5.0 (compatible; CourtCaseExtractor/1.0)"
+
+
+@dataclass(frozen=True)
+class HttpClientSettings:
+    """Connection pool and timeout settings for the shared HTTP client."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    write_timeout: float = 10.0
+    pool_timeout: float = 10.0
+    http2: bool = False
+
+
+def build_async_client(
+    settings: HttpClientSettings | None = None, user_agent: str = USER_AGENT
+) -> httpx.AsyncClient:
+    """
+    Builds the pooled ``httpx.AsyncClient`` shared by search and diary page requests.
+
+    HTTP/2 is only enabled when requested and the optional ``h2`` package is
+    installed; otherwise the client silently stays on HTTP/1.1.
+
+    :param settings: Pool and timeout settings, defaults to ``HttpClientSettings()``.
+    :param user_agent: User agent sent with every request.
+    """
+    settings = settings or HttpClientSettings()
+    http2 = settings.http2 and h2 is not None
+    if settings.http2 and not http2:
+        print("[Toolkit] HTTP/2 requested but 'h2' is not installed. Using HTTP/1.1.")
+
+    return httpx.AsyncClient(
+        headers={"User-Agent": user_agent},
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.connect_timeout,
+            read=settings.read_timeout,
+            write=settings.write_timeout,
+            pool=settings.pool_timeout,
+        ),
+    )
@@ -0,0 +1,80 @@
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from typing import Any
+
+from scraper.domain.court_case import CourtCase
+from scraper.infrastructure.crawlers.diary_page_parser import (
+    parse_detail_html,
+    parse_detail_pdf,
+)
+
+DEFAULT_INLINE_THRESHOLD = 64 * 1024
+
+
+class ParsingExecutor:
+    """
+    Runs diary page parsing off the event loop.
+
+    Inputs larger than ``inline_threshold`` bytes go to a process pool sized to
+    the available cores, so a large diary PDF no longer freezes in-flight
+    browser pages and HTTP requests. Smaller inputs, or every input when
+    ``use_processes`` is False, run on a worker thread to avoid the pickling
+    round trip.
+
+    The pool starts on first use and starts again after ``close``. An
+    extractor closes the executor it created when its run ends, so idle
+    workers do not outlive the run. The container instead shares one
+    executor per process, closed at exit, so consecutive runs reuse its
+    workers.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        use_processes: bool = True,
+    ) -> None:
+        """
+        :param max_workers: Process pool size, defaults to the number of cores.
+        :param inline_threshold: Input size, in bytes, from which the process pool is used.
+        :param use_processes: Set to False to parse everything on threads.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.inline_threshold = inline_threshold
+        self.use_processes = use_processes
+        self._process_pool: Executor | None = None
+
+    async def parse_html(self, html: str, published_at_fallback: datetime) -> list[CourtCase]:
+        """Parses a diary page frame into court cases."""
+        return await self._run(len(html), parse_detail_html, html, published_at_fallback)
+
+    async def parse_pdf(self, content: bytes, published_at_fallback: datetime) -> list[CourtCase]:
+        """Extracts the text of a diary page PDF and parses it into court cases."""
+        return await self._run(len(content), parse_detail_pdf, content, published_at_fallback)
+
+    def close(self) -> None:
+        """Shuts the process pool down, if it was started."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+
+    async def _run(
+        self, size: int, func: Callable[..., list[CourtCase]], *args: Any
+    ) -> list[CourtCase]:
+        if not self.use_processes or size < self.inline_threshold:
+            return await asyncio.to_thread(func, *args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_process_pool(), func, *args)
+
+    def _get_process_pool(self) -> Executor:
+        if self._process_pool is None:
+            # Spawned workers do not inherit the event loop, browser or sockets.
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
@@ -0,0 +1,186 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from urllib.parse import urlparse
+
+import httpx
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+class LimiterSignal(StrEnum):
+    """How a request to the host went, as seen by the rate limiter."""
+
+    OK = "ok"
+    THROTTLED = "throttled"
+    TIMEOUT = "timeout"
+    PLACEHOLDER = "placeholder"
+    ERROR = "error"
+
+    @classmethod
+    def from_status(cls, status_code: int) -> "LimiterSignal":
+        if status_code == 429 or status_code >= 500:
+            return cls.THROTTLED
+        return cls.OK
+
+
+BACKOFF_SIGNALS = frozenset(
+    {LimiterSignal.THROTTLED, LimiterSignal.TIMEOUT, LimiterSignal.PLACEHOLDER}
+)
+
+
+@dataclass(frozen=True)
+class AimdSettings:
+    """Additive-increase/multiplicative-decrease settings of a host rate limiter."""
+
+    initial_limit: float = 4.0
+    min_limit: float = 1.0
+    max_limit: float = 16.0
+    increase_step: float = 1.0
+    decrease_factor: float = 0.5
+    latency_threshold: float = 5.0
+    decrease_cooldown: float = 1.0
+
+    def __post_init__(self) -> None:
+        # Permits are granted while in_flight < int(limit), so a limit below 1 blocks forever.
+        if not 1 <= self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError(
+                "AIMD limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+
+
+@dataclass
+class RateLimiterMetrics:
+    """Current limit and decision counters of a host rate limiter."""
+
+    limit: float
+    in_flight: int = 0
+    requests: int = 0
+    increases: int = 0
+    decreases: int = 0
+    holds: int = 0
+    signals: dict[str, int] = field(default_factory=dict)
+    last_decision: str = "initial"
+
+
+@dataclass
+class Permit:
+    """A granted request slot; set ``signal`` to report how the request went."""
+
+    signal: LimiterSignal = LimiterSignal.OK
+
+
+class AimdRateLimiter:
+    """
+    Bounds concurrent requests to one host with an AIMD controlled limit.
+
+    Every healthy response grows the limit by ``increase_step / limit``, i.e. by
+    about one slot per window of responses. Throttling status codes, timeouts
+    and "processando" placeholders halve it (by ``decrease_factor``), at most
+    once per ``decrease_cooldown`` so one congestion episode is only punished
+    once. Slow but successful responses hold the limit where it is.
+    """
+
+    def __init__(self, settings: AimdSettings | None = None) -> None:
+        """
+        :param settings: AIMD settings, defaults to ``AimdSettings()``.
+        """
+        self.settings = settings or AimdSettings()
+        self.metrics = RateLimiterMetrics(limit=self.settings.initial_limit)
+        self._condition = asyncio.Condition()
+        self._last_decrease = float("-inf")
+
+    @asynccontextmanager
+    async def permit(self) -> AsyncIterator[Permit]:
+        """
+        Waits for a free slot and holds it while the request runs.
+
+        Timeouts raised inside the block are reported as ``TIMEOUT``; other
+        exceptions do not change the limit.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.metrics.in_flight < int(self.metrics.limit))
+            self.metrics.in_flight += 1
+
+        permit = Permit()
+        started_at = time.monotonic()
+        try:
+            yield permit
+        except (httpx.TimeoutException, PlaywrightTimeoutError, TimeoutError):
+            permit.signal = LimiterSignal.TIMEOUT
+            raise
+        except (Exception, asyncio.CancelledError):
+            permit.signal = LimiterSignal.ERROR
+            raise
+        finally:
+            async with self._condition:
+                self.metrics.in_flight -= 1
+                self.record(permit.signal, time.monotonic() - started_at)
+                self._condition.notify_all()
+
+    def record(self, signal: LimiterSignal, latency: float | None = None) -> None:
+        """
+        Adjusts the limit after a response.
+
+        :param signal: Outcome of the request.
+        :param latency: Request duration in seconds, when known.
+        """
+        metrics = self.metrics
+        metrics.requests += 1
+        metrics.signals[signal] = metrics.signals.get(signal, 0) + 1
+
+        if signal in BACKOFF_SIGNALS:
+            now = time.monotonic()
+            if now - self._last_decrease < self.settings.decrease_cooldown:
+                self._decide("hold")
+                return
+            self._last_decrease = now
+            metrics.limit = max(
+                self.settings.min_limit, metrics.limit * self.settings.decrease_factor
+            )
+            self._decide("decrease")
+        elif signal is LimiterSignal.OK and (
+            latency is None or latency <= self.settings.latency_threshold
+        ):
+            metrics.limit = min(
+                self.settings.max_limit,
+                metrics.limit + self.settings.increase_step / metrics.limit,
+            )
+            self._decide("increase")
+        else:
+            self._decide("hold")
+
+    def _decide(self, decision: str) -> None:
+        self.metrics.last_decision = decision
+        if decision == "increase":
+            self.metrics.increases += 1
+        elif decision == "decrease":
+            self.metrics.decreases += 1
+        else:
+            self.metrics.holds += 1
+
+
+class HostRateLimiters:
+    """One ``AimdRateLimiter`` per host, created on first use."""
+
+    def __init__(self, settings: AimdSettings | None = None) -> None:
+        """
+        :param settings: AIMD settings shared by every host.
+        """
+        self.settings = settings or AimdSettings()
+        self._limiters: dict[str, AimdRateLimiter] = {}
+
+    def for_url(self, url: str) -> AimdRateLimiter:
+        host = urlparse(url).netloc
+        if host not in self._limiters:
+            self._limiters[host] = AimdRateLimiter(self.settings)
+        return self._limiters[host]
+
+    def permit(self, url: str) -> AbstractAsyncContextManager[Permit]:
+        """Shortcut for ``for_url(url).permit()``."""
+        return self.for_url(url).permit()
+
+    def metrics(self) -> dict[str, RateLimiterMetrics]:
+        return {host: limiter.metrics for host, limiter in self._limiters.items()}
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from playwright.async_api import BrowserContext, Route
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+DEFAULT_CACHED_RESOURCE_TYPES = frozenset({"script"})
+DEFAULT_ASSET_CACHE_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ResourceRoutingRules:
+    """Which Playwright resource types are blocked and which are served from memory."""
+
+    blocked_resource_types: frozenset[str] = DEFAULT_BLOCKED_RESOURCE_TYPES
+    cached_resource_types: frozenset[str] = DEFAULT_CACHED_RESOURCE_TYPES
+    max_cached_bytes: int = DEFAULT_ASSET_CACHE_BYTES
+
+
+@dataclass(frozen=True)
+class CachedAsset:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+@dataclass
+class RoutingStats:
+    """Counters replacing the per-request network log."""
+
+    requests: int = 0
+    blocked: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    fetch_errors: int = 0
+    by_resource_type: dict[str, int] = field(default_factory=dict)
+
+
+class ResourceRouter:
+    """
+    Routes every request of a browser context through ``ResourceRoutingRules``.
+
+    Blocked resource types are aborted before they reach the network. Cached
+    resource types are fetched once and then fulfilled from an in-memory LRU
+    cache, which is shared by every context the router is attached to; when
+    fetching one fails, the request continues to the network instead. All
+    other requests, including the diary documents themselves, continue
+    untouched.
+    """
+
+    def __init__(self, rules: ResourceRoutingRules | None = None) -> None:
+        """
+        :param rules: Routing rules, defaults to ``ResourceRoutingRules()``.
+        """
+        self.rules = rules or ResourceRoutingRules()
+        self.stats = RoutingStats()
+        self._assets: OrderedDict[str, CachedAsset] = OrderedDict()
+        self._cached_bytes = 0
+
+    async def attach(self, context: BrowserContext) -> None:
+        """Installs the routing handler on ``context``."""
+        await context.route("**/*", self.handle)
+
+    async def handle(self, route: Route) -> None:
+        request = route.request
+        resource_type = request.resource_type
+        self.stats.requests += 1
+        self.stats.by_resource_type[resource_type] = (
+            self.stats.by_resource_type.get(resource_type, 0) + 1
+        )
+
+        if resource_type in self.rules.blocked_resource_types:
+            self.stats.blocked += 1
+            await route.abort()
+            return
+
+        if resource_type not in self.rules.cached_resource_types or request.method != "GET":
+            await route.continue_()
+            return
+
+        asset = self._assets.get(request.url)
+        if asset is not None:
+            self.stats.cache_hits += 1
+            self._assets.move_to_end(request.url)
+            await route.fulfill(status=asset.status, headers=asset.headers, body=asset.body)
+            return
+
+        self.stats.cache_misses += 1
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as ex:
+            # An unresolved route would hang the popup until its load deadline.
+            print(f"[Toolkit] Could not fetch {request.url} for the asset cache: {ex}")
+            self.stats.fetch_errors += 1
+            await route.continue_()
+            return
+        if response.ok:
+            self._store(request.url, CachedAsset(response.status, response.headers, body))
+        await route.fulfill(response=response, body=body)
+
+    def _store(self, url: str, asset: CachedAsset) -> None:
+        if len(asset.body) > self.rules.max_cached_bytes:
+            return
+        previous = self._assets.pop(url, None)
+        if previous is not None:
+            self._cached_bytes -= len(previous.body)
+        self._assets[url] = asset
+        self._cached_bytes += len(asset.body)
+        while self._cached_bytes > self.rules.max_cached_bytes:
+            _, evicted = self._assets.popitem(last=False)
+            self._cached_bytes -= len(evicted.body)
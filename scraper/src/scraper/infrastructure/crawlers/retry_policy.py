@@ -0,0 +1,160 @@
+import asyncio
+import contextlib
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RetrySettings:
+    """Retry and circuit breaker settings for diary detail pages."""
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    breaker_window: int = 20
+    breaker_min_calls: int = 5
+    breaker_failure_rate: float = 0.5
+    breaker_open_seconds: float = 30.0
+
+    def __post_init__(self) -> None:
+        # Attempts include the first request, so below 1 a page would never be fetched.
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 <= self.base_delay <= self.max_delay:
+            raise ValueError("Retry delays must satisfy 0 <= base_delay <= max_delay")
+
+
+@dataclass(frozen=True)
+class DeadLetter:
+    """A diary page that still failed after every retry."""
+
+    url: str
+    reason: str
+    attempts: int
+
+
+def backoff_delay(
+    attempt: int, settings: RetrySettings, rand: Callable[[], float] = random.random
+) -> float:
+    """
+    Returns the "full jitter" delay before retry number ``attempt``.
+
+    The delay is drawn uniformly between zero and ``base_delay * 2 ** (attempt - 1)``,
+    capped at ``max_delay``, so concurrent retries do not hit the host in lockstep.
+
+    :param attempt: Number of the attempt that just failed, starting at 1.
+    :param settings: Retry settings.
+    :param rand: Source of uniform numbers in [0, 1), injectable for tests.
+    """
+    ceiling = min(settings.max_delay, settings.base_delay * 2 ** (attempt - 1))
+    return ceiling * rand()
+
+
+class CircuitBreaker:
+    """
+    Pauses requests to the host while the recent failure rate is too high.
+
+    The breaker opens once at least ``min_calls`` of the last ``window``
+    outcomes are known and ``failure_rate`` of them failed. While open, callers
+    of ``wait_until_closed`` sleep for ``open_seconds``. Afterwards the breaker
+    is half open: a single caller is let through as the trial request and the
+    others keep waiting until its outcome closes the breaker on success or
+    opens it again on failure. A trial that reports nothing within
+    ``open_seconds`` is considered lost and another caller takes its place.
+    Outcomes of requests that were in flight while it was open are ignored.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param window: Number of recent outcomes considered.
+        :param min_calls: Outcomes required before the breaker may open.
+        :param failure_rate: Share of failures, between 0 and 1, that opens the breaker.
+        :param open_seconds: How long the breaker stays open.
+        :param clock: Monotonic clock, injectable for tests.
+        """
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.open_count = 0
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._opened_at: float | None = None
+        self._trial_started_at: float | None = None
+        self._trial_done = asyncio.Event()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "open" if self._remaining_open() > 0 else "half_open"
+
+    async def wait_until_closed(self) -> None:
+        """
+        Sleeps until the breaker is closed, or until the caller becomes the
+        trial request of the half open breaker.
+        """
+        while True:
+            remaining = self._remaining_open()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            elif self._opened_at is None:
+                return
+            elif (trial_remaining := self._remaining_trial()) <= 0:
+                self._trial_started_at = self._clock()
+                self._trial_done.clear()
+                return
+            else:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._trial_done.wait(), trial_remaining)
+
+    def record(self, success: bool) -> None:
+        """
+        Records the outcome of a request.
+
+        :param success: Whether the request produced usable content.
+        """
+        state = self.state
+        if state == "open":
+            return
+        if state == "half_open":
+            self._trial_started_at = None
+            self._trial_done.set()
+            if success:
+                self._opened_at = None
+                self._outcomes.clear()
+            else:
+                self._open()
+            return
+
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if (
+            len(self._outcomes) >= self.min_calls
+            and failures / len(self._outcomes) >= self.failure_rate
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self.open_count += 1
+        print(f"[Toolkit] Circuit breaker opened for {self.open_seconds:.0f}s.")
+
+    def _remaining_open(self) -> float:
+        if self._opened_at is None:
+            return 0.0
+        return self._opened_at + self.open_seconds - self._clock()
+
+    def _remaining_trial(self) -> float:
+        if self._trial_started_at is None:
+            return 0.0
+        return self._trial_started_at + self.open_seconds - self._clock()
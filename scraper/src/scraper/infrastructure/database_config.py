@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass
@@ -12,6 +13,20 @@ class DatabaseConfig:
     max_overflow: int = 20
     pool_pre_ping: bool = True
     pool_recycle: int = 3600
+    save_chunk_size: int = 500
+    copy_threshold: int | None = 500
+    write_queue_size: int = 1000
+    write_batch_size: int = 500
+    write_flush_interval: float = 2.0
+    writers: int = 1
+
+    def __post_init__(self) -> None:
+        # Writers never save more than write_batch_size cases at once.
+        if self.copy_threshold is not None and self.copy_threshold > self.write_batch_size:
+            raise ValueError(
+                "copy_threshold above write_batch_size is never reached; "
+                "raise the batch size or set DB_COPY_THRESHOLD=0 to disable COPY"
+            )
 
     @classmethod
     def from_env(cls) -> "DatabaseConfig":
@@ -28,10 +43,32 @@ class DatabaseConfig:
             f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{name}",
         )
 
+        write_batch_size = int(os.getenv("DB_WRITE_BATCH_SIZE", "500"))
         return cls(
             url=database_url,
             echo=os.getenv("DB_ECHO", "false").lower() == "true",
             pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
             max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
             pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
+            save_chunk_size=int(os.getenv("DB_SAVE_CHUNK_SIZE", "500")),
+            # Batches of at least this many cases are loaded with COPY; 0 disables it.
+            # Defaults to the write batch size: writers fill whole batches when the
+            # database falls behind the crawl, which is when COPY pays off.
+            copy_threshold=int(os.getenv("DB_COPY_THRESHOLD", str(write_batch_size))) or None,
+            write_queue_size=int(os.getenv("DB_WRITE_QUEUE_SIZE", "1000")),
+            write_batch_size=write_batch_size,
+            write_flush_interval=float(os.getenv("DB_WRITE_FLUSH_INTERVAL", "2.0")),
+            writers=int(os.getenv("DB_WRITERS", "1")),
         )
+
+    def engine_options(self) -> dict[str, Any]:
+        """Keyword arguments for ``create_async_engine``."""
+        options: dict[str, Any] = {"echo": self.echo, "pool_pre_ping": self.pool_pre_ping}
+        # SQLite, used by the tests, runs on a pool without these settings.
+        if not self.url.startswith("sqlite"):
+            options.update(
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_recycle=self.pool_recycle,
+            )
+        return options
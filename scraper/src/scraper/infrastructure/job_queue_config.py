@@ -0,0 +1,22 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class JobQueueConfig:
+    """Settings of the scrape job queue shared by scraper workers."""
+
+    max_attempts: int = 3
+    lease_seconds: float = 300.0
+    heartbeat_interval: float = 60.0
+    poll_interval: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "JobQueueConfig":
+        """Create job queue config from environment variables."""
+        return cls(
+            max_attempts=int(os.getenv("SCRAPER_JOB_MAX_ATTEMPTS", "3")),
+            lease_seconds=float(os.getenv("SCRAPER_JOB_LEASE_SECONDS", "300")),
+            heartbeat_interval=float(os.getenv("SCRAPER_JOB_HEARTBEAT_INTERVAL", "60")),
+            poll_interval=float(os.getenv("SCRAPER_JOB_POLL_INTERVAL", "10")),
+        )
@@ -0,0 +1,62 @@
+"""Scrape jobs
+
+Revision ID: 5c1e0b7d9a42
+Revises: a47eadc19301
+Create Date: 2026-10-18 09:12:31.402118
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e0b7d9a42"
+down_revision: str | Sequence[str] | None = "a47eadc19301"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "scrape_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("section_id", sa.String(), nullable=True),
+        sa.Column("search_terms", sa.String(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "PENDING", "RUNNING", "DONE", "FAILED", name="scrapejobstatus", native_enum=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("lease_owner", sa.String(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("extracted_count", sa.Integer(), nullable=True),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("key"),
+    )
+    op.create_index(op.f("ix_scrape_jobs_status"), "scrape_jobs", ["status"], unique=False)
+    op.create_index(
+        op.f("ix_scrape_jobs_lease_expires_at"), "scrape_jobs", ["lease_expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_scrape_jobs_lease_expires_at"), table_name="scrape_jobs")
+    op.drop_index(op.f("ix_scrape_jobs_status"), table_name="scrape_jobs")
+    op.drop_table("scrape_jobs")
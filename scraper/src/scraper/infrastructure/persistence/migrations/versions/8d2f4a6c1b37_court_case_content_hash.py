@@ -0,0 +1,29 @@
+"""Court case content hash
+
+Revision ID: 8d2f4a6c1b37
+Revises: 5c1e0b7d9a42
+Create Date: 2026-10-18 14:03:52.118734
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f4a6c1b37"
+down_revision: str | Sequence[str] | None = "5c1e0b7d9a42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows keep a NULL hash; the next save of each case fills it in.
+    op.add_column("court_cases", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("court_cases", "content_hash")
@@ -1,5 +1,7 @@
 from .court_case_model import CourtCaseModel
+from .scrape_job_model import ScrapeJobModel
 
 __all__ = [
     "CourtCaseModel",
+    "ScrapeJobModel",
 ]
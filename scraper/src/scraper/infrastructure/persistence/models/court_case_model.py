@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import UTC, datetime
 from decimal import Decimal
 
-from sqlalchemy import JSON, DateTime, Enum, Numeric, func
+from sqlalchemy import JSON, DateTime, Enum, Numeric, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from scraper.domain.court_case import CourtCase, CourtCaseAmount, CourtCaseStatus
@@ -40,6 +42,7 @@ class CourtCaseModel(BaseModel[CourtCase]):
     interest: Mapped[Decimal] = mapped_column(Numeric(precision=18, scale=2), nullable=False)
     lawyer_fees: Mapped[Decimal] = mapped_column(Numeric(precision=18, scale=2), nullable=False)
     content: Mapped[str] = mapped_column(nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     def to_entity(self) -> CourtCase:
         """Convert the model instance to a domain entity object."""
@@ -71,4 +74,26 @@ class CourtCaseModel(BaseModel[CourtCase]):
             interest=entity.amount.interest,
             lawyer_fees=entity.amount.lawyer_fees,
             content=entity.content,
+            content_hash=cls.fingerprint(entity),
         )
+
+    @staticmethod
+    def fingerprint(entity: CourtCase) -> str:
+        """
+        Returns a SHA-256 of the scraped data of a case, ignoring whitespace changes.
+
+        Covers the name, publication date, lawyers, amounts and content, so a
+        case scraped again with the same data gets the same fingerprint.
+        """
+        amount = entity.amount
+        data = [
+            entity.name,
+            entity.published_at.date().isoformat() if entity.published_at else None,
+            [" ".join(lawyer.split()) for lawyer in entity.lawyers],
+            [
+                str(value.quantize(Decimal("0.01")))
+                for value in (amount.gross_principal, amount.interest, amount.lawyer_fees)
+            ],
+            " ".join((entity.content or "").split()),
+        ]
+        return hashlib.sha256(json.dumps(data, ensure_ascii=False).encode()).hexdigest()
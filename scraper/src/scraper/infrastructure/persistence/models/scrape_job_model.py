@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Enum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from scraper.domain.scrape_job import ScrapeJob, ScrapeJobStatus
+from scraper.infrastructure.persistence.models.base_model import BaseModel
+
+
+class ScrapeJobModel(BaseModel[ScrapeJob]):
+    """
+    Model class for ScrapeJob.
+    The table doubles as the work queue shared by every scraper worker.
+    """
+
+    __tablename__ = "scrape_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    key: Mapped[str] = mapped_column(nullable=False, unique=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    section_id: Mapped[str | None] = mapped_column(nullable=True)
+    search_terms: Mapped[str] = mapped_column(nullable=False)
+    status: Mapped[ScrapeJobStatus] = mapped_column(
+        Enum(ScrapeJobStatus, native_enum=False),
+        nullable=False,
+        index=True,
+        default=ScrapeJobStatus.PENDING,
+    )
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    lease_owner: Mapped[str | None] = mapped_column(nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+    extracted_count: Mapped[int | None] = mapped_column(nullable=True)
+    last_error: Mapped[str | None] = mapped_column(nullable=True)
+
+    def to_entity(self) -> ScrapeJob:
+        """Convert the model instance to a domain entity object."""
+        return ScrapeJob(
+            id=self.id,
+            day=self.day,
+            section_id=self.section_id,
+            search_terms=self.search_terms,
+            status=self.status,
+            attempts=self.attempts,
+            lease_owner=self.lease_owner,
+            lease_expires_at=self.lease_expires_at,
+            extracted_count=self.extracted_count,
+            last_error=self.last_error,
+        )
+
+    @classmethod
+    def from_entity(cls, entity: ScrapeJob) -> ScrapeJobModel:
+        """Populate the model instance from a domain entity object."""
+        return cls(
+            id=entity.id,
+            key=entity.key,
+            day=entity.day,
+            section_id=entity.section_id,
+            search_terms=entity.search_terms,
+            status=entity.status,
+            attempts=entity.attempts,
+            lease_owner=entity.lease_owner,
+            lease_expires_at=entity.lease_expires_at,
+            extracted_count=entity.extracted_count,
+            last_error=entity.last_error,
+        )
@@ -1,5 +1,7 @@
 from .sqlalchemy_court_case_repository import SQLAlchemyCourtCaseRepository
+from .sqlalchemy_scrape_job_queue import SQLAlchemyScrapeJobQueue
 
 __all__ = [
     "SQLAlchemyCourtCaseRepository",
+    "SQLAlchemyScrapeJobQueue",
 ]
@@ -1,29 +1,207 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import Boolean, column, literal_column, select, table, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from scraper.domain.court_case import CourtCase
-from scraper.domain.ports.court_case_repository import CourtCaseRepository
+from scraper.domain.ports.court_case_repository import CourtCaseRepository, SaveManyResult
 from scraper.infrastructure.persistence.models.court_case_model import CourtCaseModel
 
+DEFAULT_CHUNK_SIZE = 500
+# The default write batch size of the persistence pipeline.
+DEFAULT_COPY_THRESHOLD = 500
+# Filled by the column defaults, or by save_many for updated_at.
+_TIMESTAMP_COLUMNS = {"created_at", "updated_at"}
+# Not overwritten when a case is scraped again: its status moves on once it was read.
+_KEPT_ON_CONFLICT = {"id", "status"}
+_ROW_COLUMNS = [
+    model_column.key
+    for model_column in CourtCaseModel.__table__.columns
+    if model_column.key not in _TIMESTAMP_COLUMNS
+]
+_STAGING_TABLE = "court_cases_staging"
+# PostgreSQL only returns inserted and updated rows; xmax is 0 for the inserted ones.
+_INSERTED_FLAG = literal_column("xmax = 0", Boolean)
+
 
 class SQLAlchemyCourtCaseRepository(CourtCaseRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        copy_threshold: int | None = DEFAULT_COPY_THRESHOLD,
+    ) -> None:
         """
         Initializes the repository with an SQLAlchemy session.
 
         :param session: An instance of AsyncSession for database operations.
+        :param chunk_size: Rows written by each ``INSERT`` of ``save_many``, which keeps
+            the statement below the bind parameter limits of PostgreSQL and SQLite.
+        :param copy_threshold: From this many cases, ``save_many`` loads them with
+            ``COPY`` when the session runs on asyncpg. ``None`` disables it.
         """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
         self.session = session
+        self.chunk_size = chunk_size
+        self.copy_threshold = copy_threshold
 
     async def save(self, court_case: CourtCase) -> None:
         """
-        Saves a court case to the database.
+        Saves a court case to the database, updating it if it already exists.
         :param court_case: The CourtCase instance to be saved.
         """
-        model = CourtCaseModel.from_entity(court_case)
         print(f"Saving court case: {court_case.case_id} to the database...")
+        await self.save_many([court_case])
+        print(f"Saved court case: {court_case.case_id} to the database.")
+
+    async def save_many(self, court_cases: list[CourtCase]) -> SaveManyResult:
+        """
+        Upserts court cases with one multi-row ``INSERT ... ON CONFLICT (id) DO UPDATE``
+        per chunk, all in a single transaction. Existing rows are only updated
+        when their ``content_hash`` differs, so re-scraping unchanged cases
+        writes nothing.
+
+        Large backfills on asyncpg, from ``copy_threshold`` cases on, are
+        instead streamed into a temporary staging table with a binary ``COPY``
+        and merged into ``court_cases`` by a single ``INSERT ... SELECT`` with
+        the same conflict handling.
 
+        When the same id appears more than once, the last case wins, since one
+        statement cannot update the same row twice.
+
+        :param court_cases: The CourtCase instances to be saved.
+        """
+        # Sorted so concurrent writers lock the rows they share in the same order.
+        unique_cases = sorted(
+            {court_case.id: court_case for court_case in court_cases}.values(),
+            key=lambda court_case: court_case.id,
+        )
+        result = SaveManyResult()
+        if not unique_cases:
+            return result
+
+        rows = [_to_row(court_case) for court_case in unique_cases]
         async with self.session.begin():
-            self.session.add(model)
-            await self.session.commit()
+            if self._uses_copy(len(rows)):
+                result = await self._copy_and_merge(rows)
+            else:
+                for start in range(0, len(rows), self.chunk_size):
+                    result += await self._upsert(rows[start : start + self.chunk_size])
+
+        print(
+            f"[Toolkit] Saved {len(unique_cases)} court cases: "
+            f"{result.inserted} inserted, {result.updated} updated, "
+            f"{result.unchanged} unchanged."
+        )
+        return result
+
+    def _uses_copy(self, row_count: int) -> bool:
+        dialect = self.session.bind.dialect
+        return (
+            self.copy_threshold is not None
+            and row_count >= self.copy_threshold
+            and dialect.name == "postgresql"
+            and dialect.driver == "asyncpg"
+        )
+
+    async def _copy_and_merge(self, rows: list[dict]) -> SaveManyResult:
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        dialect = connection.dialect
+        # Converts the values like SQLAlchemy would, e.g. JSON to text and enums to names.
+        processors = [
+            (
+                key,
+                CourtCaseModel.__table__.c[key].type.dialect_impl(dialect).bind_processor(dialect),
+            )
+            for key in _ROW_COLUMNS
+        ]
+
+        # Created in the session transaction, on the same connection, and dropped at commit.
+        await connection.execute(
+            text(
+                f"CREATE TEMPORARY TABLE {_STAGING_TABLE} "
+                f"(LIKE {CourtCaseModel.__tablename__} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+        await raw_connection.driver_connection.copy_records_to_table(
+            _STAGING_TABLE,
+            records=(
+                tuple(process(row[key]) if process else row[key] for key, process in processors)
+                for row in rows
+            ),
+            columns=_ROW_COLUMNS,
+        )
+
+        staging = table(_STAGING_TABLE, *[column(key) for key in _ROW_COLUMNS])
+        merge = postgresql.insert(CourtCaseModel).from_select(
+            _ROW_COLUMNS, select(*[staging.c[key] for key in _ROW_COLUMNS])
+        )
+        inserted_flags = (
+            (await connection.execute(_on_conflict_update(merge).returning(_INSERTED_FLAG)))
+            .scalars()
+            .all()
+        )
+        return _postgresql_result(len(rows), inserted_flags)
+
+    async def _upsert(self, rows: list[dict]) -> SaveManyResult:
+        if self.session.bind.dialect.name == "postgresql":
+            statement = _on_conflict_update(postgresql.insert(CourtCaseModel).values(rows))
+            inserted_flags = (
+                (await self.session.execute(statement.returning(_INSERTED_FLAG))).scalars().all()
+            )
+            return _postgresql_result(len(rows), inserted_flags)
+
+        # SQLite cannot return what the upsert did, so compare with the stored hashes first.
+        stored_hashes = dict(
+            (
+                await self.session.execute(
+                    select(CourtCaseModel.id, CourtCaseModel.content_hash).where(
+                        CourtCaseModel.id.in_([row["id"] for row in rows])
+                    )
+                )
+            )
+            .tuples()
+            .all()
+        )
+        await self.session.execute(_on_conflict_update(sqlite.insert(CourtCaseModel).values(rows)))
+        unchanged = sum(
+            1
+            for row in rows
+            if row["id"] in stored_hashes and stored_hashes[row["id"]] == row["content_hash"]
+        )
+        return SaveManyResult(
+            inserted=len(rows) - len(stored_hashes),
+            updated=len(stored_hashes) - unchanged,
+            unchanged=unchanged,
+        )
+
+
+def _to_row(court_case: CourtCase) -> dict:
+    model = CourtCaseModel.from_entity(court_case)
+    return {key: getattr(model, key) for key in _ROW_COLUMNS}
+
+
+def _on_conflict_update(statement):
+    return statement.on_conflict_do_update(
+        index_elements=[CourtCaseModel.id],
+        set_={
+            **{
+                key: statement.excluded[key] for key in _ROW_COLUMNS if key not in _KEPT_ON_CONFLICT
+            },
+            "updated_at": datetime.now(UTC),
+        },
+        # Rows whose data did not change are left alone: no new row version, WAL or index churn.
+        where=CourtCaseModel.content_hash.is_distinct_from(statement.excluded.content_hash),
+    )
+
 
-            print(f"Saved court case: {court_case.case_id} to the database.")
+def _postgresql_result(row_count: int, inserted_flags: list[bool]) -> SaveManyResult:
+    inserted = sum(inserted_flags)
+    return SaveManyResult(
+        inserted=inserted,
+        updated=len(inserted_flags) - inserted,
+        unchanged=row_count - len(inserted_flags),
+    )
@@ -0,0 +1,176 @@
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from scraper.domain.ports.scrape_job_queue import ScrapeJobQueue
+from scraper.domain.scrape_job import ScrapeJob, ScrapeJobStatus
+from scraper.infrastructure.persistence.models.scrape_job_model import ScrapeJobModel
+
+DEFAULT_MAX_ATTEMPTS = 3
+CLAIM_RETRIES = 3
+
+
+class SQLAlchemyScrapeJobQueue(ScrapeJobQueue):
+    """
+    Scrape job queue stored in the ``scrape_jobs`` table.
+
+    On PostgreSQL, workers claim jobs with ``SELECT ... FOR UPDATE SKIP LOCKED``,
+    so concurrent workers on any number of hosts never block on, or receive,
+    the same row. SQLite ignores the locking clause; there every claim is
+    also guarded by its ``UPDATE ... WHERE status = 'PENDING'``, which makes
+    the queue usable for local runs and tests.
+
+    Every method runs in its own short transaction, so a long scrape never
+    holds a row lock; the lease is what keeps other workers away.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        """
+        :param session_factory: Creates the sessions used for each queue operation.
+        :param max_attempts: Claims a job gets before it is marked as failed.
+        :param clock: Returns the current time, injectable for tests.
+        """
+        self.session_factory = session_factory
+        self.max_attempts = max_attempts
+        self._clock = clock
+
+    async def enqueue(self, jobs: list[ScrapeJob]) -> int:
+        if not jobs:
+            return 0
+        rows = [
+            {
+                "key": job.key,
+                "day": job.day,
+                "section_id": job.section_id,
+                "search_terms": job.search_terms,
+                "status": ScrapeJobStatus.PENDING,
+                "attempts": 0,
+            }
+            for job in jobs
+        ]
+        async with self.session_factory() as session, session.begin():
+            insert = (
+                postgresql.insert if session.bind.dialect.name == "postgresql" else sqlite.insert
+            )
+            result = await session.execute(
+                insert(ScrapeJobModel)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["key"])
+                .returning(ScrapeJobModel.id)
+            )
+            return len(result.all())
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> ScrapeJob | None:
+        async with self.session_factory() as session, session.begin():
+            now = self._clock()
+            await self._requeue_expired(session, now)
+            for _ in range(CLAIM_RETRIES):
+                job_id = await session.scalar(
+                    select(ScrapeJobModel.id)
+                    .where(ScrapeJobModel.status == ScrapeJobStatus.PENDING)
+                    .order_by(ScrapeJobModel.day, ScrapeJobModel.id)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+                if job_id is None:
+                    return None
+                claimed = await session.scalar(
+                    update(ScrapeJobModel)
+                    .where(
+                        ScrapeJobModel.id == job_id,
+                        ScrapeJobModel.status == ScrapeJobStatus.PENDING,
+                    )
+                    .values(
+                        status=ScrapeJobStatus.RUNNING,
+                        attempts=ScrapeJobModel.attempts + 1,
+                        lease_owner=worker_id,
+                        lease_expires_at=now + timedelta(seconds=lease_seconds),
+                    )
+                    .returning(ScrapeJobModel)
+                )
+                if claimed is not None:
+                    return claimed.to_entity()
+            return None
+
+    async def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        async with self.session_factory() as session, session.begin():
+            result = await session.execute(
+                update(ScrapeJobModel)
+                .where(self._leased_by(job_id, worker_id))
+                .values(lease_expires_at=self._clock() + timedelta(seconds=lease_seconds))
+            )
+            return result.rowcount == 1
+
+    async def complete(self, job_id: int, worker_id: str, extracted_count: int) -> None:
+        async with self.session_factory() as session, session.begin():
+            result = await session.execute(
+                update(ScrapeJobModel)
+                .where(self._leased_by(job_id, worker_id))
+                .values(
+                    status=ScrapeJobStatus.DONE,
+                    extracted_count=extracted_count,
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    last_error=None,
+                )
+            )
+        if result.rowcount != 1:
+            print(
+                f"[Toolkit] Worker {worker_id} lost the lease of job {job_id} before completing it."
+            )
+
+    async def fail(self, job_id: int, worker_id: str, error: str) -> None:
+        released = {"lease_owner": None, "lease_expires_at": None, "last_error": error}
+        async with self.session_factory() as session, session.begin():
+            leased = self._leased_by(job_id, worker_id)
+            await session.execute(
+                update(ScrapeJobModel)
+                .where(leased, ScrapeJobModel.attempts >= self.max_attempts)
+                .values(status=ScrapeJobStatus.FAILED, **released)
+            )
+            await session.execute(
+                update(ScrapeJobModel)
+                .where(leased)
+                .values(status=ScrapeJobStatus.PENDING, **released)
+            )
+
+    async def requeue_expired(self) -> int:
+        async with self.session_factory() as session, session.begin():
+            return await self._requeue_expired(session, self._clock())
+
+    async def _requeue_expired(self, session: AsyncSession, now: datetime) -> int:
+        expired = and_(
+            ScrapeJobModel.status == ScrapeJobStatus.RUNNING,
+            ScrapeJobModel.lease_expires_at < now,
+        )
+        released = {"lease_owner": None, "lease_expires_at": None}
+        failed = await session.execute(
+            update(ScrapeJobModel)
+            .where(expired, ScrapeJobModel.attempts >= self.max_attempts)
+            .values(status=ScrapeJobStatus.FAILED, last_error="Lease expired", **released)
+        )
+        requeued = await session.execute(
+            update(ScrapeJobModel).where(expired).values(status=ScrapeJobStatus.PENDING, **released)
+        )
+        if failed.rowcount or requeued.rowcount:
+            print(
+                f"[Toolkit] Expired leases: {requeued.rowcount} jobs requeued, "
+                f"{failed.rowcount} failed."
+            )
+        return failed.rowcount + requeued.rowcount
+
+    @staticmethod
+    def _leased_by(job_id: int, worker_id: str):
+        return and_(
+            ScrapeJobModel.id == job_id,
+            ScrapeJobModel.lease_owner == worker_id,
+            ScrapeJobModel.status == ScrapeJobStatus.RUNNING,
+        )
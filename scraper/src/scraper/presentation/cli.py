@@ -1,12 +1,23 @@
 import asyncio
 import datetime as dt
+import os
+import socket
 
 import typer
 
 from scraper.domain.ports.court_case_extractor import CourtCaseExtractorFilters
+from scraper.domain.scrape_job import ScrapeJob
 from scraper.infrastructure.container import (
     get_db_session,
     get_extract_and_persist_course_case_service,
+    get_scrape_job_queue,
+    get_scrape_job_worker_service,
+)
+from scraper.presentation.range_scraper import (
+    DEFAULT_SEARCH_TERMS,
+    ScrapeShard,
+    build_shards,
+    scrape_range,
 )
 
 app = typer.Typer()
@@ -35,7 +46,7 @@ def scrape_for_day(date: str = typer.Argument(..., help="Date in YYYY-MM-DD")):
                 start_date=date_obj,  # <-- pass as date object!
                 end_date=date_obj,
                 section_id=None,
-                search_terms='"RPV"+e+"pagamento+pelo+INSS"',
+                search_terms=DEFAULT_SEARCH_TERMS,
             )
             await service.execute(filters)
             typer.echo(f"Extracted and persisted cases for {date_obj}.")
@@ -43,5 +54,74 @@ def scrape_for_day(date: str = typer.Argument(..., help="Date in YYYY-MM-DD")):
     asyncio.run(inner())
 
 
+@app.command("scrape-range")
+def scrape_range_command(
+    start: str = typer.Argument(..., help="First date in YYYY-MM-DD"),
+    end: str = typer.Argument(..., help="Last date in YYYY-MM-DD, inclusive"),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        envvar="SCRAPER_RANGE_WORKERS",
+        help="Worker processes, defaults to the CPU count.",
+    ),
+    sections: list[str] | None = typer.Option(
+        None, "--section", help="Diary section to shard by; repeat for several sections."
+    ),
+):
+    """Scrape every day between START and END, one shard per day and section, in parallel."""
+    shards = _parse_shards(start, end, sections)
+    typer.echo(f"Scraping {len(shards)} shards from {start} to {end}.")
+    summary = scrape_range(shards, max_workers=workers)
+    for line in summary.lines():
+        typer.echo(line)
+    if summary.failed:
+        raise typer.Exit(1)
+
+
+@app.command("enqueue-range")
+def enqueue_range(
+    start: str = typer.Argument(..., help="First date in YYYY-MM-DD"),
+    end: str = typer.Argument(..., help="Last date in YYYY-MM-DD, inclusive"),
+    sections: list[str] | None = typer.Option(
+        None, "--section", help="Diary section to shard by; repeat for several sections."
+    ),
+):
+    """Queue one scrape job per day and section between START and END for `work` to run."""
+    jobs = [
+        ScrapeJob(day=shard.day, section_id=shard.section_id, search_terms=shard.search_terms)
+        for shard in _parse_shards(start, end, sections)
+    ]
+    added = asyncio.run(get_scrape_job_queue().enqueue(jobs))
+    typer.echo(f"Queued {added} jobs, {len(jobs) - added} were already queued.")
+
+
+@app.command("work")
+def work(
+    worker_id: str | None = typer.Option(
+        None, "--worker-id", help="Lease owner name, defaults to <hostname>-<pid>."
+    ),
+    max_jobs: int | None = typer.Option(None, "--max-jobs", help="Stop after this many jobs."),
+    forever: bool = typer.Option(
+        False, "--forever", help="Keep polling for new jobs instead of stopping when none is left."
+    ),
+):
+    """Run queued scrape jobs; start one worker per container to scale out."""
+    service = get_scrape_job_worker_service(worker_id or f"{socket.gethostname()}-{os.getpid()}")
+    summary = asyncio.run(service.run(max_jobs=max_jobs, forever=forever))
+    if summary.failed:
+        raise typer.Exit(1)
+
+
+def _parse_shards(start: str, end: str, sections: list[str] | None) -> list[ScrapeShard]:
+    try:
+        start_date = dt.datetime.strptime(start, "%Y-%m-%d").date()
+        end_date = dt.datetime.strptime(end, "%Y-%m-%d").date()
+        return build_shards(start_date, end_date, sections)
+    except ValueError as ex:
+        typer.secho(f"Invalid date range: {ex}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(1) from ex
+
+
 if __name__ == "__main__":
     app()
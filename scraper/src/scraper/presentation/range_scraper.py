@@ -0,0 +1,173 @@
+"""Splits a date range into shards and scrapes them on a pool of worker processes."""
+
+import asyncio
+import datetime as dt
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+from scraper.domain.ports.court_case_extractor import CourtCaseExtractorFilters
+
+DEFAULT_SEARCH_TERMS = '"RPV"+e+"pagamento+pelo+INSS"'
+
+
+@dataclass(frozen=True)
+class ScrapeShard:
+    """One day, optionally restricted to one diary section, scraped by a single worker."""
+
+    day: dt.date
+    section_id: str | None = None
+    search_terms: str = DEFAULT_SEARCH_TERMS
+
+    def to_filters(self) -> CourtCaseExtractorFilters:
+        return CourtCaseExtractorFilters(
+            start_date=self.day,
+            end_date=self.day,
+            section_id=self.section_id,
+            search_terms=self.search_terms,
+        )
+
+    def __str__(self) -> str:
+        return f"{self.day}" + (f" section {self.section_id}" if self.section_id else "")
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    shard: ScrapeShard
+    extracted_count: int = 0
+    duration: float = 0.0
+    error: str | None = None
+
+    def __str__(self) -> str:
+        outcome = f"FAILED ({self.error})" if self.error else f"{self.extracted_count} cases"
+        return f"{self.shard}: {outcome} in {self.duration:.1f}s"
+
+
+@dataclass
+class RangeSummary:
+    """Results of every shard of a ``scrape-range`` run."""
+
+    results: list[ShardResult] = field(default_factory=list)
+
+    @property
+    def extracted_count(self) -> int:
+        return sum(result.extracted_count for result in self.results)
+
+    @property
+    def failed(self) -> list[ShardResult]:
+        return [result for result in self.results if result.error]
+
+    def lines(self) -> list[str]:
+        ordered = sorted(self.results, key=lambda r: (r.shard.day, r.shard.section_id or ""))
+        lines = [f"  {result}" for result in ordered]
+        lines.append(
+            f"Extracted {self.extracted_count} court cases from {len(self.results)} shards, "
+            f"{len(self.failed)} failed."
+        )
+        return lines
+
+
+def build_shards(
+    start: dt.date,
+    end: dt.date,
+    section_ids: list[str] | None = None,
+    search_terms: str = DEFAULT_SEARCH_TERMS,
+) -> list[ScrapeShard]:
+    """
+    Splits ``start``..``end`` (inclusive) into one shard per day and section.
+
+    :param start: First day of the range.
+    :param end: Last day of the range.
+    :param section_ids: Diary sections to shard by, or ``None`` for the default section.
+    :param search_terms: Free-text search sent with every shard.
+    """
+    if end < start:
+        raise ValueError(f"End date {end} is before start date {start}")
+    days = [start + dt.timedelta(days=offset) for offset in range((end - start).days + 1)]
+    return [
+        ScrapeShard(day=day, section_id=section_id, search_terms=search_terms)
+        for day in days
+        for section_id in (section_ids or [None])
+    ]
+
+
+def run_shard(shard: ScrapeShard) -> ShardResult:
+    """
+    Scrapes one shard in the calling process, on a fresh event loop.
+
+    Worker processes start with ``spawn``, so each one imports the container
+    and gets its own engine; the pool is disposed before the loop closes
+    because asyncpg connections cannot move between event loops.
+    """
+    started_at = time.monotonic()
+    try:
+        extracted_count = asyncio.run(_scrape_shard(shard))
+    except Exception as ex:
+        return ShardResult(
+            shard, duration=time.monotonic() - started_at, error=f"{type(ex).__name__}: {ex}"
+        )
+    return ShardResult(shard, extracted_count, duration=time.monotonic() - started_at)
+
+
+async def _scrape_shard(shard: ScrapeShard) -> int:
+    from scraper.infrastructure.container import (
+        dispose_engine,
+        get_db_session,
+        get_extract_and_persist_course_case_service,
+    )
+
+    try:
+        async with get_db_session() as session:
+            service = get_extract_and_persist_course_case_service(session)
+            return await service.execute(shard.to_filters())
+    finally:
+        await dispose_engine()
+
+
+def parsing_workers_per_shard(max_workers: int) -> int:
+    """Splits the cores between the range workers, for the parsing pool of each."""
+    return max(1, (os.cpu_count() or 1) // max_workers)
+
+
+def _init_worker(parsing_workers: int) -> None:
+    # Runs before the worker imports the container, which reads its config from the
+    # environment. An explicit SCRAPER_PARSING_WORKERS still wins.
+    os.environ.setdefault("SCRAPER_PARSING_WORKERS", str(parsing_workers))
+
+
+def scrape_range(
+    shards: list[ScrapeShard],
+    max_workers: int | None = None,
+    run: Callable[[ScrapeShard], ShardResult] = run_shard,
+) -> RangeSummary:
+    """
+    Runs ``shards`` on a pool of spawned worker processes and merges their results.
+
+    Each worker parses diary pages on a pool of its share of the cores, reused
+    by every shard it runs, so the range does not start a pool per CPU per shard.
+
+    :param shards: Shards to scrape.
+    :param max_workers: Number of worker processes, defaults to the CPU count.
+    :param run: Picklable function scraping one shard, injectable for tests.
+    """
+    max_workers = min(max_workers or os.cpu_count() or 1, len(shards)) or 1
+    summary = RangeSummary()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(parsing_workers_per_shard(max_workers),),
+    ) as executor:
+        futures = {executor.submit(run, shard): shard for shard in shards}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as ex:
+                # The worker process itself died, e.g. BrokenProcessPool.
+                result = ShardResult(futures[future], error=f"{type(ex).__name__}: {ex}")
+            print(f"[Toolkit] Shard {result}")
+            summary.results.append(result)
+    return summary
@@ -1,3 +1,6 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from unittest import mock
 
 import pytest
@@ -7,10 +10,11 @@ from scraper.application.ports.extract_and_persist_court_data_use_case import (
 )
 from scraper.application.services.extract_and_persist_court_data_service import (
     ExtractAndPersistCourtDataService,
+    PersistencePipelineSettings,
 )
 from scraper.domain.court_case import CourtCase
 from scraper.domain.ports.court_case_extractor import CourtCaseExtractor
-from scraper.domain.ports.court_case_repository import CourtCaseRepository
+from scraper.domain.ports.court_case_repository import CourtCaseRepository, SaveManyResult
 
 
 @pytest.fixture()
@@ -26,9 +30,21 @@ def filters() -> ExtractAndPersistFilterRequest:
     )
 
 
+def _stream(*batches: list[CourtCase]) -> mock.Mock:
+    """Builds an `extract_stream` replacement yielding the given batches."""
+
+    async def extract_stream(
+        filters: ExtractAndPersistFilterRequest, wait_persisted=None
+    ) -> AsyncIterator:
+        for batch in batches:
+            yield batch
+
+    return mock.Mock(side_effect=extract_stream)
+
+
 class TestExtractAndPersistCourtDataService:
     @pytest.mark.asyncio
-    async def test_execute_when_extract_returns_cases_then_calls_save_for_each_case(
+    async def test_execute_when_extract_returns_cases_then_save_them_in_one_batch(
         self,
         filters: ExtractAndPersistFilterRequest,
     ) -> None:
@@ -39,21 +55,19 @@ class TestExtractAndPersistCourtDataService:
             mock.AsyncMock(spec=CourtCase),
             mock.AsyncMock(spec=CourtCase),
         ]
-        mock_court_case_extractor.extract.return_value = mock_cases
+        mock_court_case_extractor.extract_stream = _stream([mock_cases[0]], [mock_cases[1]])
+        mock_court_case_repository.save_many.return_value = SaveManyResult(inserted=1)
         service = ExtractAndPersistCourtDataService(
             court_case_extractor=mock_court_case_extractor,
             court_case_repository=mock_court_case_repository,
         )
 
         # Act
-        await service.execute(filters)
+        extracted_count = await service.execute(filters)
 
         # Assert
-        expected_call_args = [
-            mock.call(mock_cases[0]),
-            mock.call(mock_cases[1]),
-        ]
-        mock_court_case_repository.save.assert_has_calls(expected_call_args)
+        assert extracted_count == 2
+        mock_court_case_repository.save_many.assert_awaited_once_with(mock_cases)
 
     @pytest.mark.asyncio
     async def test_execute_when_extractor_raises_exception_then_let_it_raise(
@@ -63,7 +77,9 @@ class TestExtractAndPersistCourtDataService:
         # Arrange
         mock_court_case_extractor = mock.AsyncMock(spec=CourtCaseExtractor)
         mock_court_case_repository = mock.AsyncMock(spec=CourtCaseRepository)
-        mock_court_case_extractor.extract.side_effect = Exception("Extraction failed")
+        mock_court_case_extractor.extract_stream = mock.Mock(
+            side_effect=Exception("Extraction failed")
+        )
         service = ExtractAndPersistCourtDataService(
             court_case_extractor=mock_court_case_extractor,
             court_case_repository=mock_court_case_repository,
@@ -85,8 +101,8 @@ class TestExtractAndPersistCourtDataService:
             mock.AsyncMock(spec=CourtCase),
             mock.AsyncMock(spec=CourtCase),
         ]
-        mock_court_case_extractor.extract.return_value = mock_cases
-        mock_court_case_repository.save.side_effect = Exception("Save failed")
+        mock_court_case_extractor.extract_stream = _stream(mock_cases)
+        mock_court_case_repository.save_many.side_effect = Exception("Save failed")
         service = ExtractAndPersistCourtDataService(
             court_case_extractor=mock_court_case_extractor,
             court_case_repository=mock_court_case_repository,
@@ -95,3 +111,351 @@ class TestExtractAndPersistCourtDataService:
         # Act & Assert
         with pytest.raises(Exception) as _:
             await service.execute(filters)
+
+    @pytest.mark.asyncio
+    async def test_execute_when_stream_fails_midway_then_earlier_batches_are_persisted(
+        self,
+        filters: ExtractAndPersistFilterRequest,
+    ) -> None:
+        # Arrange
+        mock_court_case_extractor = mock.AsyncMock(spec=CourtCaseExtractor)
+        mock_court_case_repository = mock.AsyncMock(spec=CourtCaseRepository)
+        first_case = mock.AsyncMock(spec=CourtCase)
+        mock_court_case_repository.save_many.return_value = SaveManyResult(inserted=1)
+
+        async def extract_stream(
+            filters: ExtractAndPersistFilterRequest, wait_persisted=None
+        ) -> AsyncIterator:
+            yield [first_case]
+            raise Exception("Extraction failed")
+
+        mock_court_case_extractor.extract_stream = mock.Mock(side_effect=extract_stream)
+        service = ExtractAndPersistCourtDataService(
+            court_case_extractor=mock_court_case_extractor,
+            court_case_repository=mock_court_case_repository,
+        )
+
+        # Act
+        with pytest.raises(Exception, match="Extraction failed"):
+            await service.execute(filters)
+
+        # Assert
+        mock_court_case_repository.save_many.assert_awaited_once_with([first_case])
+
+
+def _repository() -> mock.AsyncMock:
+    repository = mock.AsyncMock(spec=CourtCaseRepository)
+    repository.save_many.side_effect = lambda cases: SaveManyResult(inserted=len(cases))
+    return repository
+
+
+def _service(
+    extract_stream: mock.Mock,
+    repository: mock.AsyncMock,
+    **pipeline,
+) -> ExtractAndPersistCourtDataService:
+    extractor = mock.AsyncMock(spec=CourtCaseExtractor)
+    extractor.extract_stream = extract_stream
+    return ExtractAndPersistCourtDataService(
+        court_case_extractor=extractor,
+        court_case_repository=repository,
+        pipeline=PersistencePipelineSettings(**pipeline),
+    )
+
+
+class TestExtractAndPersistCourtDataServicePipeline:
+    def test_init_when_several_writers_without_repository_scope_then_raise(self) -> None:
+        # Arrange / Act / Assert
+        with pytest.raises(ValueError, match="repository_scope"):
+            _service(_stream(), _repository(), writers=2)
+
+    @pytest.mark.asyncio
+    async def test_execute_when_batch_size_reached_then_save_full_batches(
+        self, filters: ExtractAndPersistFilterRequest
+    ) -> None:
+        # Arrange
+        repository = _repository()
+        cases = [mock.Mock(spec=CourtCase) for _ in range(5)]
+        service = _service(_stream(cases[:3], cases[3:]), repository, batch_size=2)
+
+        # Act
+        extracted_count = await service.execute(filters)
+
+        # Assert
+        assert extracted_count == 5
+        assert [call.args[0] for call in repository.save_many.await_args_list] == [
+            cases[0:2],
+            cases[2:4],
+            cases[4:],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_when_flush_interval_elapses_then_save_partial_batch(
+        self, filters: ExtractAndPersistFilterRequest
+    ) -> None:
+        # Arrange
+        repository = _repository()
+        first_case, second_case = mock.Mock(spec=CourtCase), mock.Mock(spec=CourtCase)
+        saved_before_second_batch: list[int] = []
+
+        async def extract_stream(
+            filters: ExtractAndPersistFilterRequest, wait_persisted=None
+        ) -> AsyncIterator:
+            yield [first_case]
+            await asyncio.sleep(0.1)
+            saved_before_second_batch.append(repository.save_many.await_count)
+            yield [second_case]
+
+        service = _service(
+            mock.Mock(side_effect=extract_stream), repository, batch_size=10, flush_interval=0.01
+        )
+
+        # Act
+        await service.execute(filters)
+
+        # Assert
+        assert saved_before_second_batch == [1]
+        assert [call.args[0] for call in repository.save_many.await_args_list] == [
+            [first_case],
+            [second_case],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_when_writer_is_slow_then_stop_pulling_from_extractor(
+        self, filters: ExtractAndPersistFilterRequest
+    ) -> None:
+        # Arrange
+        release_writer = asyncio.Event()
+        pulled: list[int] = []
+        repository = _repository()
+
+        async def slow_save_many(cases):
+            await release_writer.wait()
+            return SaveManyResult(inserted=len(cases))
+
+        repository.save_many.side_effect = slow_save_many
+
+        async def extract_stream(
+            filters: ExtractAndPersistFilterRequest, wait_persisted=None
+        ) -> AsyncIterator:
+            for index in range(20):
+                pulled.append(index)
+                yield [mock.Mock(spec=CourtCase)]
+
+        service = _service(
+            mock.Mock(side_effect=extract_stream), repository, batch_size=1, queue_size=2
+        )
+
+        # Act
+        execution = asyncio.create_task(service.execute(filters))
+        await asyncio.sleep(0.05)
+        pulled_while_blocked = len(pulled)
+        release_writer.set()
+        extracted_count = await execution
+
+        # Assert
+        assert pulled_while_blocked <= 4
+        assert extracted_count == 20
+        assert repository.save_many.await_count == 20
+
+    @pytest.mark.asyncio
+    async def test_execute_when_writer_fails_then_stop_extraction_and_raise(
+        self, filters: ExtractAndPersistFilterRequest
+    ) -> None:
+        # Arrange
+        repository = _repository()
+        repository.save_many.side_effect = RuntimeError("database is down")
+        closed = asyncio.Event()
+
+        async def extract_stream(
+            filters: ExtractAndPersistFilterRequest, wait_persisted=None
+        ) -> AsyncIterator:
+            try:
+                while True:
+                    yield [mock.Mock(spec=CourtCase)]
+            finally:
+                closed.set()
+
+        service = _service(
+            mock.Mock(side_effect=extract_stream), repository, batch_size=1, queue_size=1
+        )
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="database is down"):
+            await service.execute(filters)
+        assert closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_execute_when_extractor_waits_persisted_then_flush_pending_cases_first(
+        self, filters: ExtractAndPersistFilterRequest
+    ) -> None:
+        # Arrange
+        repository = _repository()
+        cases = [mock.Mock(spec=CourtCase) for _ in range(3)]
+        saved_when_persisted: list[int] = []
+
+        async def extract_stream(
+            filters: ExtractAndPersistFilterRequest, wait_persisted=None
+        ) -> AsyncIterator:
+            yield cases[:2]
+            await wait_persisted()
+            saved_when_persisted.append(repository.save_many.await_count)
+            yield cases[2:]
+
+        service = _service(
+            mock.Mock(side_effect=extract_stream), repository, batch_size=10, flush_interval=60
+        )
+
+        # Act
+        await service.execute(filters)
+
+        # Assert
+        assert saved_when_persisted == [1]
+        assert [call.args[0] for call in repository.save_many.await_args_list] == [
+            cases[:2],
+            cases[2:],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_when_writer_fails_before_persisted_then_raise_from_wait(
+        self, filters: ExtractAndPersistFilterRequest
+    ) -> None:
+        # Arrange
+        repository = _repository()
+        repository.save_many.side_effect = RuntimeError("database is down")
+        persisted = False
+
+        async def extract_stream(
+            filters: ExtractAndPersistFilterRequest, wait_persisted=None
+        ) -> AsyncIterator:
+            nonlocal persisted
+            yield [mock.Mock(spec=CourtCase)]
+            await wait_persisted()
+            persisted = True
+
+        service = _service(
+            mock.Mock(side_effect=extract_stream), repository, batch_size=10, flush_interval=60
+        )
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="database is down"):
+            await service.execute(filters)
+        assert not persisted
+
+    @pytest.mark.asyncio
+    async def test_execute_when_several_writers_wait_persisted_then_every_writer_flushes(
+        self, filters: ExtractAndPersistFilterRequest
+    ) -> None:
+        # Arrange
+        repositories: list[mock.AsyncMock] = []
+
+        @asynccontextmanager
+        async def repository_scope():
+            repository = _repository()
+            repositories.append(repository)
+            yield repository
+
+        saved_when_persisted: list[int] = []
+
+        async def extract_stream(
+            filters: ExtractAndPersistFilterRequest, wait_persisted=None
+        ) -> AsyncIterator:
+            yield [mock.Mock(spec=CourtCase) for _ in range(5)]
+            await wait_persisted()
+            saved_when_persisted.append(
+                sum(
+                    len(call.args[0])
+                    for repository in repositories
+                    for call in repository.save_many.await_args_list
+                )
+            )
+
+        extractor = mock.AsyncMock(spec=CourtCaseExtractor)
+        extractor.extract_stream = mock.Mock(side_effect=extract_stream)
+        service = ExtractAndPersistCourtDataService(
+            court_case_extractor=extractor,
+            court_case_repository=mock.AsyncMock(spec=CourtCaseRepository),
+            pipeline=PersistencePipelineSettings(writers=2, batch_size=10, flush_interval=60),
+            repository_scope=repository_scope,
+        )
+
+        # Act
+        extracted_count = await service.execute(filters)
+
+        # Assert
+        assert extracted_count == 5
+        assert saved_when_persisted == [5]
+
+    @pytest.mark.asyncio
+    async def test_execute_when_one_writer_is_idle_then_wait_persisted_flushes_the_other(
+        self, filters: ExtractAndPersistFilterRequest
+    ) -> None:
+        # Arrange
+        repositories: list[mock.AsyncMock] = []
+
+        @asynccontextmanager
+        async def repository_scope():
+            repository = _repository()
+            repositories.append(repository)
+            yield repository
+
+        saved_when_persisted: list[int] = []
+
+        async def extract_stream(
+            filters: ExtractAndPersistFilterRequest, wait_persisted=None
+        ) -> AsyncIterator:
+            for _ in range(2):
+                yield [mock.Mock(spec=CourtCase)]
+                await asyncio.sleep(0)
+            # One writer holds both cases. The idle one is woken first by the flush
+            # and must not take both markers, leaving them to the flush interval.
+            await asyncio.wait_for(wait_persisted(), timeout=1)
+            saved_when_persisted.append(
+                sum(repository.save_many.await_count for repository in repositories)
+            )
+
+        extractor = mock.AsyncMock(spec=CourtCaseExtractor)
+        extractor.extract_stream = mock.Mock(side_effect=extract_stream)
+        service = ExtractAndPersistCourtDataService(
+            court_case_extractor=extractor,
+            court_case_repository=mock.AsyncMock(spec=CourtCaseRepository),
+            pipeline=PersistencePipelineSettings(writers=2, batch_size=10, flush_interval=60),
+            repository_scope=repository_scope,
+        )
+
+        # Act
+        extracted_count = await service.execute(filters)
+
+        # Assert
+        assert extracted_count == 2
+        assert saved_when_persisted == [1]
+
+    @pytest.mark.asyncio
+    async def test_execute_when_several_writers_then_each_uses_its_own_repository(
+        self, filters: ExtractAndPersistFilterRequest
+    ) -> None:
+        # Arrange
+        repositories: list[mock.AsyncMock] = []
+
+        @asynccontextmanager
+        async def repository_scope():
+            repository = _repository()
+            repositories.append(repository)
+            yield repository
+
+        extractor = mock.AsyncMock(spec=CourtCaseExtractor)
+        extractor.extract_stream = _stream([mock.Mock(spec=CourtCase) for _ in range(6)])
+        service = ExtractAndPersistCourtDataService(
+            court_case_extractor=extractor,
+            court_case_repository=mock.AsyncMock(spec=CourtCaseRepository),
+            pipeline=PersistencePipelineSettings(writers=3, batch_size=1),
+            repository_scope=repository_scope,
+        )
+
+        # Act
+        extracted_count = await service.execute(filters)
+
+        # Assert
+        assert extracted_count == 6
+        assert len(repositories) == 3
+        assert sum(repository.save_many.await_count for repository in repositories) == 6
@@ -0,0 +1,134 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+from unittest import mock
+
+import pytest
+
+from scraper.application.services.scrape_job_worker_service import ScrapeJobWorkerService
+from scraper.domain.ports.scrape_job_queue import ScrapeJobQueue
+from scraper.domain.scrape_job import ScrapeJob, ScrapeJobStatus
+
+
+def _job(job_id: int) -> ScrapeJob:
+    return ScrapeJob(
+        id=job_id,
+        day=date(2024, 11, 13),
+        section_id="12",
+        search_terms="RPV",
+        status=ScrapeJobStatus.RUNNING,
+        attempts=1,
+    )
+
+
+def _queue(*jobs: ScrapeJob) -> mock.AsyncMock:
+    queue = mock.AsyncMock(spec=ScrapeJobQueue)
+    queue.claim.side_effect = [*jobs, None]
+    queue.heartbeat.return_value = True
+    return queue
+
+
+def _worker(queue, service, **kwargs) -> ScrapeJobWorkerService:
+    @asynccontextmanager
+    async def service_scope():
+        yield service
+
+    return ScrapeJobWorkerService(queue, service_scope, worker_id="worker-1", **kwargs)
+
+
+class TestScrapeJobWorkerService:
+    def test_init_when_heartbeat_not_shorter_than_lease_then_raise(self):
+        # Arrange / Act / Assert
+        with pytest.raises(ValueError):
+            _worker(_queue(), mock.AsyncMock(), lease_seconds=10, heartbeat_interval=10)
+
+    @pytest.mark.asyncio
+    async def test_run_when_jobs_succeed_then_complete_them_and_stop_when_empty(self):
+        # Arrange
+        queue = _queue(_job(1), _job(2))
+        service = mock.AsyncMock()
+        service.execute.side_effect = [3, 4]
+
+        # Act
+        summary = await _worker(queue, service).run()
+
+        # Assert
+        assert summary.completed == 2
+        assert summary.extracted_count == 7
+        queue.complete.assert_has_awaits([mock.call(1, "worker-1", 3), mock.call(2, "worker-1", 4)])
+        assert service.execute.await_args_list[0].args[0].start_date == date(2024, 11, 13)
+
+    @pytest.mark.asyncio
+    async def test_run_when_job_raises_then_fail_it_and_continue(self):
+        # Arrange
+        queue = _queue(_job(1), _job(2))
+        service = mock.AsyncMock()
+        service.execute.side_effect = [RuntimeError("boom"), 5]
+
+        # Act
+        summary = await _worker(queue, service).run()
+
+        # Assert
+        assert (summary.completed, summary.failed) == (1, 1)
+        queue.fail.assert_awaited_once_with(1, "worker-1", "RuntimeError: boom")
+        queue.complete.assert_awaited_once_with(2, "worker-1", 5)
+
+    @pytest.mark.asyncio
+    async def test_run_when_max_jobs_reached_then_stop(self):
+        # Arrange
+        queue = _queue(_job(1), _job(2))
+        service = mock.AsyncMock()
+        service.execute.return_value = 0
+
+        # Act
+        summary = await _worker(queue, service).run(max_jobs=1)
+
+        # Assert
+        assert summary.completed == 1
+        assert queue.claim.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_run_when_job_is_slow_then_renew_its_lease(self):
+        # Arrange
+        queue = _queue(_job(1))
+        service = mock.AsyncMock()
+
+        async def slow_execute(filters):
+            await asyncio.sleep(0.05)
+            return 1
+
+        service.execute.side_effect = slow_execute
+
+        # Act
+        await _worker(queue, service, lease_seconds=1, heartbeat_interval=0.01).run()
+
+        # Assert
+        assert queue.heartbeat.await_count >= 2
+        queue.heartbeat.assert_awaited_with(1, "worker-1", 1)
+        queue.complete.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_when_lease_lost_then_cancel_job_without_completing_it(self):
+        # Arrange
+        queue = _queue(_job(1))
+        queue.heartbeat.return_value = False
+        service = mock.AsyncMock()
+        cancelled = asyncio.Event()
+
+        async def hanging_execute(filters):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        service.execute.side_effect = hanging_execute
+
+        # Act
+        summary = await _worker(queue, service, lease_seconds=1, heartbeat_interval=0.01).run()
+
+        # Assert
+        assert cancelled.is_set()
+        assert summary.failed == 1
+        queue.complete.assert_not_awaited()
+        queue.fail.assert_not_awaited()
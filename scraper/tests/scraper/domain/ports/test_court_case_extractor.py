@@ -0,0 +1,35 @@
+from collections.abc import AsyncIterator
+from unittest import mock
+
+import pytest
+
+from scraper.domain.court_case import CourtCase
+from scraper.domain.ports.court_case_extractor import (
+    CourtCaseExtractor,
+    CourtCaseExtractorFilters,
+)
+
+
+class FakeCourtCaseExtractor(CourtCaseExtractor):
+    def __init__(self, batches: list[list[CourtCase]]) -> None:
+        self.batches = batches
+
+    async def extract_stream(
+        self, filters: CourtCaseExtractorFilters
+    ) -> AsyncIterator[list[CourtCase]]:
+        for batch in self.batches:
+            yield batch
+
+
+class TestCourtCaseExtractor:
+    @pytest.mark.asyncio
+    async def test_extract_when_stream_yields_batches_then_return_flattened_cases(self) -> None:
+        # Arrange
+        cases = [mock.Mock(spec=CourtCase) for _ in range(3)]
+        extractor = FakeCourtCaseExtractor([[cases[0]], [cases[1], cases[2]]])
+
+        # Act
+        result = await extractor.extract(CourtCaseExtractorFilters())
+
+        # Assert
+        assert result == cases
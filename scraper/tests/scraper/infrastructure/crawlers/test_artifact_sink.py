@@ -0,0 +1,70 @@
+import gzip
+
+import pytest
+
+from scraper.infrastructure.crawlers.artifact_sink import FileArtifactSink, NullArtifactSink
+
+
+class TestNullArtifactSink:
+    def test_sample_when_page_failed_then_return_false(self) -> None:
+        assert NullArtifactSink().sample(failed=True) is False
+
+
+class TestFileArtifactSink:
+    def test_constructor_when_sample_every_below_one_then_raise_value_error(self, tmp_path) -> None:
+        with pytest.raises(ValueError, match="sample_every must be at least 1"):
+            FileArtifactSink(tmp_path, sample_every=0)
+
+    def test_sample_when_only_failures_configured_then_skip_successful_pages(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        sink = FileArtifactSink(tmp_path)
+
+        # Act
+        decisions = [sink.sample(failed=False), sink.sample(failed=True)]
+
+        # Assert
+        assert decisions == [False, True]
+
+    def test_sample_when_sample_every_set_then_capture_one_in_n_pages(self, tmp_path) -> None:
+        # Arrange
+        sink = FileArtifactSink(tmp_path, sample_every=3)
+
+        # Act
+        decisions = [sink.sample(failed=False) for _ in range(6)]
+
+        # Assert
+        assert decisions == [False, False, True, False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_capture_when_run_finished_then_write_compressed_files_in_run_directory(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        sink = FileArtifactSink(tmp_path)
+        sink.start_run()
+
+        # Act
+        sink.capture("diary/4067", {"page.html": b"<html></html>"})
+        await sink.finish_run()
+
+        # Assert
+        [run_dir] = tmp_path.iterdir()
+        written = run_dir / "00001-diary_4067" / "page.html.gz"
+        assert gzip.decompress(written.read_bytes()) == b"<html></html>"
+        assert sink.captured == 1
+
+    @pytest.mark.asyncio
+    async def test_capture_when_quota_exceeded_then_drop_artifacts(self, tmp_path) -> None:
+        # Arrange
+        sink = FileArtifactSink(tmp_path, max_bytes=10)
+        sink.start_run()
+
+        # Act
+        sink.capture("page", {"page.html": b"<html></html>" * 100})
+        await sink.finish_run()
+
+        # Assert
+        assert list(tmp_path.iterdir()) == []
+        assert sink.dropped == 1
@@ -0,0 +1,82 @@
+from unittest import mock
+
+import pytest
+
+from scraper.infrastructure.crawlers.browser_session import PlaywrightBrowserSession
+
+
+@pytest.fixture()
+def browser() -> mock.AsyncMock:
+    browser = mock.AsyncMock()
+    browser.new_context.side_effect = lambda **_: mock.AsyncMock(on=mock.Mock())
+    return browser
+
+
+class TestPlaywrightBrowserSession:
+    @pytest.mark.asyncio
+    async def test_context_when_called_for_several_pages_then_reuse_same_context(
+        self, browser: mock.AsyncMock
+    ) -> None:
+        # Arrange
+        session = PlaywrightBrowserSession(user_agent="agent", browser=browser)
+
+        # Act
+        first = await session.context([])
+        second = await session.context([{"name": "JSESSIONID", "value": "1"}])
+
+        # Assert
+        assert first is second
+        assert session.context_count == 1
+        browser.new_context.assert_awaited_once_with(user_agent="agent")
+        second.add_cookies.assert_awaited_once_with([{"name": "JSESSIONID", "value": "1"}])
+
+    @pytest.mark.asyncio
+    async def test_context_when_created_then_install_resource_router(
+        self, browser: mock.AsyncMock
+    ) -> None:
+        # Arrange
+        router = mock.AsyncMock()
+        session = PlaywrightBrowserSession(user_agent="agent", browser=browser, router=router)
+
+        # Act
+        context = await session.context([])
+
+        # Assert
+        router.attach.assert_awaited_once_with(context)
+        context.on.assert_called_once_with("page", session._on_page)
+
+    @pytest.mark.asyncio
+    async def test_context_when_page_budget_exhausted_then_recycle_context(
+        self, browser: mock.AsyncMock
+    ) -> None:
+        # Arrange
+        session = PlaywrightBrowserSession(
+            user_agent="agent", browser=browser, max_pages_per_context=2
+        )
+        first = await session.context([])
+        session._on_page(mock.Mock())
+        session._on_page(mock.Mock())
+
+        # Act
+        second = await session.context([])
+
+        # Assert
+        assert first is not second
+        first.close.assert_awaited_once()
+        assert session.context_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_when_browser_injected_then_keep_browser_running(
+        self, browser: mock.AsyncMock
+    ) -> None:
+        # Arrange
+        session = PlaywrightBrowserSession(user_agent="agent", browser=browser)
+        context = await session.context([])
+
+        # Act
+        await session.close()
+
+        # Assert
+        context.close.assert_awaited_once()
+        browser.close.assert_not_awaited()
+        assert session.launch_count == 0
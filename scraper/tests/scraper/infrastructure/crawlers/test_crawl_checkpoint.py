@@ -0,0 +1,52 @@
+from scraper.domain.ports.court_case_extractor import CourtCaseExtractorFilters
+from scraper.infrastructure.crawlers.crawl_checkpoint import CheckpointStore, CrawlCheckpoint
+from scraper.infrastructure.crawlers.retry_policy import DeadLetter
+
+
+class TestCheckpointStore:
+    def test_key_for_when_filters_equal_then_same_key(self) -> None:
+        first = CheckpointStore.key_for(CourtCaseExtractorFilters(start_date="2024-11-13"))
+        second = CheckpointStore.key_for(CourtCaseExtractorFilters(start_date="2024-11-13"))
+        other = CheckpointStore.key_for(CourtCaseExtractorFilters(start_date="2024-11-14"))
+
+        assert first == second
+        assert first != other
+
+    def test_load_when_checkpoint_saved_then_return_same_checkpoint(self, tmp_path) -> None:
+        # Arrange
+        store = CheckpointStore(tmp_path)
+        checkpoint = CrawlCheckpoint(
+            filters_key="abc",
+            next_page=3,
+            seen_pages=[1, 2, 3],
+            processed_urls=["https://dje/a"],
+            exported_count=7,
+            dead_letters=[DeadLetter("https://dje/b", "placeholder", 3)],
+        )
+
+        # Act
+        store.save(checkpoint)
+        loaded = store.load("abc")
+
+        # Assert
+        assert loaded == checkpoint
+        assert [path.name for path in tmp_path.iterdir()] == ["abc.json"]
+
+    def test_load_when_no_checkpoint_then_return_none(self, tmp_path) -> None:
+        assert CheckpointStore(tmp_path).load("abc") is None
+
+    def test_load_when_checkpoint_unreadable_then_return_none(self, tmp_path) -> None:
+        (tmp_path / "abc.json").write_text("{not json", encoding="utf-8")
+
+        assert CheckpointStore(tmp_path).load("abc") is None
+
+    def test_clear_when_checkpoint_exists_then_remove_it(self, tmp_path) -> None:
+        # Arrange
+        store = CheckpointStore(tmp_path)
+        store.save(CrawlCheckpoint(filters_key="abc", next_page=None))
+
+        # Act
+        store.clear("abc")
+
+        # Assert
+        assert store.load("abc") is None
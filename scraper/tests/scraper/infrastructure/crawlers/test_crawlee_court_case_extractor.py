@@ -0,0 +1,324 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pytest
+from crawlee import Request
+from crawlee.crawlers import HttpCrawler
+
+from scraper.domain.ports.court_case_extractor import CourtCaseExtractorFilters
+from scraper.infrastructure.crawlers.crawlee_court_case_extractor import (
+    DIARY_PAGE_LABEL,
+    MAX_PENDING_BATCHES,
+    SEARCH_LABEL,
+    CrawleeCourtCaseExtractor,
+    CrawleeRun,
+    _autoscaled_pool,
+)
+from scraper.infrastructure.juscash_assessment_settings import JuscashAssessmentSettings
+
+DIARY_HTML = "<html><body>" + "Processo 0000001-02.2024.8.26.0000 " * 5 + "</body></html>"
+
+
+def _search_results_html(seq_pages: list[int], next_pages: list[int]) -> str:
+    rows = "".join(
+        '<tr><td><a class="layout" title="Visualizar" '
+        f"onclick=\"popup('/cdje/consultaSimples.do?cdVolume=1&nuDiario=1&cdCaderno=12&nuSeqpagina={n}')\">"
+        "Visualizar</a></td></tr>"
+        for n in seq_pages
+    )
+    links = "".join(f'<a onclick="trocaDePg({n});">{n}</a>' for n in next_pages)
+    return f'<html><table>{rows}</table><span class="style5">{links}</span></html>'
+
+
+def _run() -> CrawleeRun:
+    return CrawleeRun(
+        filters=CourtCaseExtractorFilters(search_terms="RPV"),
+        published_at_fallback=datetime(2024, 11, 13),
+        batches=asyncio.Queue(),
+    )
+
+
+def _extractor(**kwargs) -> CrawleeCourtCaseExtractor:
+    parsing_executor = mock.Mock()
+    parsing_executor.parse_html = mock.AsyncMock(return_value=["case"])
+    parsing_executor.parse_pdf = mock.AsyncMock(return_value=["pdf case"])
+    return CrawleeCourtCaseExtractor(parsing_executor=parsing_executor, **kwargs)
+
+
+def _http_context(url: str, content: bytes, content_type: str = "text/html", **user_data):
+    context = mock.Mock()
+    context.request.url = url
+    context.request.user_data = user_data
+    context.http_response.read.return_value = content
+    context.http_response.headers = {"content-type": content_type}
+    context.add_requests = mock.AsyncMock()
+    return context
+
+
+class TestCrawleeCourtCaseExtractorSettings:
+    def test_init_when_max_concurrency_is_zero_then_raise(self):
+        # Arrange / Act / Assert
+        with pytest.raises(ValueError):
+            CrawleeCourtCaseExtractor(max_concurrency=0)
+
+    def test_crawler_options_when_called_then_apply_assessment_settings(self):
+        # Arrange
+        settings = JuscashAssessmentSettings(
+            timeout=timedelta(seconds=12), max_requests_per_crawler=7
+        )
+        extractor = _extractor(settings=settings, max_concurrency=3, max_request_retries=2)
+
+        # Act
+        options = extractor._crawler_options(request_queue=mock.sentinel.queue)
+
+        # Assert
+        assert options["request_manager"] is mock.sentinel.queue
+        assert options["max_requests_per_crawl"] == 7
+        assert options["request_handler_timeout"] == timedelta(seconds=12)
+        assert options["max_request_retries"] == 2
+        assert options["concurrency_settings"].max_concurrency == 3
+
+    def test_search_request_when_built_then_post_form_with_unique_key_per_page(self):
+        # Arrange
+        extractor = _extractor()
+        filters = CourtCaseExtractorFilters(search_terms="RPV")
+
+        # Act
+        first = extractor._search_request(filters, 1)
+        second = extractor._search_request(filters, 2)
+
+        # Assert
+        assert first.method == "POST"
+        assert first.label == SEARCH_LABEL
+        assert b"pesquisaLivre=RPV" in first.payload
+        assert b"pagina=2" in second.payload
+        assert first.unique_key != second.unique_key
+
+
+class TestCrawleeCourtCaseExtractorHandlers:
+    @pytest.mark.asyncio
+    async def test_handle_search_when_results_found_then_enqueue_diary_pages_and_next_page(self):
+        # Arrange
+        extractor = _extractor()
+        run = _run()
+        html = _search_results_html([1, 2, 1], [1, 2]).encode()
+        context = _http_context(extractor.url, html, page_num=1)
+
+        # Act
+        await extractor._handle_search(context, run)
+
+        # Assert
+        requests = context.add_requests.await_args.args[0]
+        diary_requests = [r for r in requests if r.label == DIARY_PAGE_LABEL]
+        search_requests = [r for r in requests if r.label == SEARCH_LABEL]
+        assert len(diary_requests) == 2
+        assert all("getPaginaDoDiario.do" in r.url for r in diary_requests)
+        assert diary_requests[0].user_data["popup_url"].endswith("nuSeqpagina=1")
+        assert [r.user_data["page_num"] for r in search_requests] == [2]
+        assert run.seen_pages == {1, 2}
+
+    @pytest.mark.asyncio
+    async def test_handle_search_when_no_popups_then_enqueue_nothing(self):
+        # Arrange
+        extractor = _extractor()
+        context = _http_context(extractor.url, b"<html></html>", page_num=3)
+
+        # Act
+        await extractor._handle_search(context, _run())
+
+        # Assert
+        context.add_requests.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_handle_diary_page_when_html_then_publish_parsed_cases(self):
+        # Arrange
+        extractor = _extractor()
+        run = _run()
+        context = _http_context("https://dje/getPaginaDoDiario.do", DIARY_HTML.encode())
+
+        # Act
+        await extractor._handle_diary_page(context, run)
+
+        # Assert
+        assert run.batches.get_nowait() == ["case"]
+        assert run.exported_count == 1
+        extractor.parsing_executor.parse_html.assert_awaited_once_with(
+            DIARY_HTML, run.published_at_fallback
+        )
+
+    @pytest.mark.asyncio
+    async def test_handle_diary_page_when_pdf_then_parse_pdf(self):
+        # Arrange
+        extractor = _extractor()
+        run = _run()
+        context = _http_context("https://dje/getPaginaDoDiario.do", b"%PDF-1.4 ...")
+
+        # Act
+        await extractor._handle_diary_page(context, run)
+
+        # Assert
+        assert run.batches.get_nowait() == ["pdf case"]
+
+    @pytest.mark.asyncio
+    async def test_handle_diary_page_when_placeholder_then_defer_to_browser(self):
+        # Arrange
+        extractor = _extractor()
+        run = _run()
+        context = _http_context(
+            "https://dje/getPaginaDoDiario.do",
+            b"<html>processando</html>",
+            popup_url="https://dje/cdje/consultaSimples.do?nuSeqpagina=1",
+        )
+
+        # Act
+        await extractor._handle_diary_page(context, run)
+
+        # Assert
+        assert run.placeholder_urls == ["https://dje/cdje/consultaSimples.do?nuSeqpagina=1"]
+        assert run.batches.empty()
+
+    @pytest.mark.asyncio
+    async def test_handle_rendered_page_when_still_placeholder_then_raise_for_retry(self):
+        # Arrange
+        extractor = _extractor()
+        frame = mock.AsyncMock()
+        frame.content.return_value = "<html>processando</html>"
+        context = mock.Mock()
+        context.page.wait_for_selector = mock.AsyncMock(
+            return_value=mock.Mock(content_frame=mock.AsyncMock(return_value=frame))
+        )
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="still processing"):
+            await extractor._handle_rendered_page(context, _run())
+        extractor.parsing_executor.parse_html.assert_not_awaited()
+
+
+class TestCrawleeCourtCaseExtractorStream:
+    @pytest.mark.asyncio
+    async def test_extract_when_placeholders_found_then_render_them_in_the_browser(self):
+        # Arrange
+        extractor = _extractor()
+        popup_url = "https://dje/cdje/consultaSimples.do?nuSeqpagina=1"
+
+        def build_http_crawler(run, request_queue):
+            async def fake_run(requests):
+                await extractor._publish(["http case"], run)
+                run.placeholder_urls.append(popup_url)
+
+            return mock.Mock(run=mock.AsyncMock(side_effect=fake_run))
+
+        def build_browser_crawler(run, request_queue):
+            async def fake_run(requests):
+                assert [r.url for r in requests] == [popup_url]
+                await extractor._publish(["browser case"], run)
+
+            return mock.Mock(run=mock.AsyncMock(side_effect=fake_run))
+
+        with (
+            mock.patch.object(extractor, "_build_http_crawler", build_http_crawler),
+            mock.patch.object(extractor, "_build_browser_crawler", build_browser_crawler),
+        ):
+            # Act
+            result = await extractor.extract(CourtCaseExtractorFilters(search_terms="RPV"))
+
+        # Assert
+        assert result == ["http case", "browser case"]
+        # Injected executors belong to the caller, which may reuse them.
+        extractor.parsing_executor.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publish_when_too_many_batches_pending_then_pause_without_waiting(self):
+        # Arrange
+        extractor = _extractor()
+        run = _run()
+        run.pool = mock.Mock()
+
+        # Act
+        for index in range(MAX_PENDING_BATCHES + 3):
+            await asyncio.wait_for(extractor._publish([f"case {index}"], run), timeout=1)
+
+        # Assert
+        run.pool.pause.assert_called_once()
+        assert run.batches.qsize() == MAX_PENDING_BATCHES + 3
+        assert run.exported_count == MAX_PENDING_BATCHES + 3
+
+    @pytest.mark.asyncio
+    async def test_extract_when_consumer_catches_up_then_resume_crawler(self):
+        # Arrange
+        extractor = _extractor()
+        crawler = mock.Mock()
+        runs: list[CrawleeRun] = []
+
+        async def fake_run(requests):
+            for index in range(MAX_PENDING_BATCHES):
+                await extractor._publish([index], runs[0])
+            # A paused pool starts no request until it is resumed.
+            while runs[0].paused:
+                await asyncio.sleep(0)
+
+        def build_http_crawler(run, request_queue):
+            runs.append(run)
+            crawler.run = mock.AsyncMock(side_effect=fake_run)
+            return crawler
+
+        with mock.patch.object(extractor, "_build_http_crawler", build_http_crawler):
+            # Act
+            result = await extractor.extract(CourtCaseExtractorFilters(search_terms="RPV"))
+
+        # Assert
+        assert result == list(range(MAX_PENDING_BATCHES))
+        crawler._autoscaled_pool.pause.assert_called_once()
+        crawler._autoscaled_pool.resume.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_extract_when_crawler_fails_then_raise(self):
+        # Arrange
+        extractor = CrawleeCourtCaseExtractor()
+        failing_crawler = mock.Mock(run=mock.AsyncMock(side_effect=RuntimeError("boom")))
+
+        with (
+            mock.patch.object(extractor, "_build_http_crawler", return_value=failing_crawler),
+            mock.patch.object(extractor.parsing_executor, "close") as close,
+        ):
+            # Act / Assert
+            with pytest.raises(RuntimeError, match="boom"):
+                await extractor.extract(CourtCaseExtractorFilters())
+        close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_extract_when_request_limit_leaves_requests_queued_then_log_it(self, capsys):
+        # Arrange
+        extractor = _extractor()
+
+        def build_http_crawler(run, request_queue):
+            async def fake_run(requests):
+                # A crawler stopped by max_requests_per_crawl leaves these unhandled.
+                await request_queue.add_request(Request.from_url("https://dje/left-over"))
+
+            return mock.Mock(run=mock.AsyncMock(side_effect=fake_run))
+
+        with mock.patch.object(extractor, "_build_http_crawler", build_http_crawler):
+            # Act
+            await extractor.extract(CourtCaseExtractorFilters(search_terms="RPV"))
+
+        # Assert
+        assert "stopped at its limit of 10 requests" in capsys.readouterr().out
+
+
+class TestAutoscaledPool:
+    def test_autoscaled_pool_when_crawlee_crawler_then_return_pausable_pool(self):
+        # Arrange
+        crawler = HttpCrawler()
+
+        # Act
+        pool = _autoscaled_pool(crawler)
+
+        # Assert
+        assert callable(pool.pause)
+        assert callable(pool.resume)
+
+    def test_autoscaled_pool_when_attribute_missing_then_raise(self):
+        with pytest.raises(RuntimeError, match="_autoscaled_pool"):
+            _autoscaled_pool(object())
@@ -0,0 +1,129 @@
+import os
+from pathlib import Path
+from unittest import mock
+
+from scraper.infrastructure.crawlers.diary_page_cache import DiaryPageCache, DiaryPageKey
+
+POPUP_URL = (
+    "https://dje.tjsp.jus.br/cdje/consultaSimples.do?cdVolume=19&nuDiario=4067"
+    "&cdCaderno=12&nuSeqpagina=3710"
+)
+
+
+def _key(page: int) -> DiaryPageKey:
+    return DiaryPageKey(cd_volume="19", nu_diario="4067", cd_caderno="12", nu_seqpagina=str(page))
+
+
+class TestDiaryPageKey:
+    def test_from_url_when_popup_url_then_read_page_identifiers(self) -> None:
+        key = DiaryPageKey.from_url(POPUP_URL)
+
+        assert key == _key(3710)
+
+    def test_from_url_when_parameters_missing_then_return_none(self) -> None:
+        key = DiaryPageKey.from_url("https://dje.tjsp.jus.br/cdje/consultaSimples.do?cdVolume=19")
+
+        assert key is None
+
+    def test_digest_when_same_page_from_different_urls_then_equal(self) -> None:
+        reordered = (
+            "https://dje.tjsp.jus.br/cdje/getPaginaDoDiario.do?nuSeqpagina=3710"
+            "&cdCaderno=12&nuDiario=4067&cdVolume=19&uuidCaptcha="
+        )
+
+        assert DiaryPageKey.from_url(reordered).digest == DiaryPageKey.from_url(POPUP_URL).digest
+
+
+class TestDiaryPageCache:
+    def test_get_when_page_not_cached_then_return_none_and_count_miss(self, tmp_path: Path) -> None:
+        cache = DiaryPageCache(tmp_path)
+
+        assert cache.get(_key(1), "diary") is None
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_get_when_page_cached_then_return_content_and_count_hit(self, tmp_path: Path) -> None:
+        cache = DiaryPageCache(tmp_path)
+        cache.put(_key(1), "diary", b"<html>page</html>")
+
+        assert cache.get(_key(1), "diary") == b"<html>page</html>"
+        assert cache.get(_key(1), "frame") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_put_when_over_max_bytes_then_evict_least_recently_used(self, tmp_path: Path) -> None:
+        # Arrange
+        cache = DiaryPageCache(tmp_path, max_bytes=20)
+        cache.put(_key(1), "diary", b"a" * 8)
+        cache.put(_key(2), "diary", b"b" * 8)
+        old = cache._path(_key(1), "diary").stat().st_mtime - 10
+        os.utime(cache._path(_key(2), "diary"), (old, old))
+        os.utime(cache._path(_key(1), "diary"), (old + 1, old + 1))
+
+        # Act
+        cache.put(_key(3), "diary", b"c" * 8)
+
+        # Assert
+        assert cache.get(_key(2), "diary") is None
+        assert cache.get(_key(1), "diary") == b"a" * 8
+        assert cache.get(_key(3), "diary") == b"c" * 8
+
+    def test_constructor_when_directory_has_entries_then_keep_them(self, tmp_path: Path) -> None:
+        DiaryPageCache(tmp_path).put(_key(1), "diary", b"persisted")
+
+        cache = DiaryPageCache(tmp_path)
+
+        assert cache.get(_key(1), "diary") == b"persisted"
+
+    def test_get_when_file_evicted_by_another_process_after_read_then_return_content(
+        self, tmp_path: Path
+    ) -> None:
+        # Arrange
+        cache = DiaryPageCache(tmp_path)
+        cache.put(_key(1), "diary", b"page")
+
+        # Act
+        with mock.patch("os.utime", side_effect=FileNotFoundError):
+            content = cache.get(_key(1), "diary")
+
+        # Assert
+        assert content == b"page"
+        assert cache.hits == 1
+
+    def test_put_when_another_process_shares_directory_then_evict_by_disk_usage(
+        self, tmp_path: Path
+    ) -> None:
+        # Arrange
+        first, second = (
+            DiaryPageCache(tmp_path, max_bytes=20),
+            DiaryPageCache(tmp_path, max_bytes=20),
+        )
+        first.put(_key(1), "diary", b"a" * 8)
+        second.put(_key(2), "diary", b"b" * 8)
+        old = first._path(_key(1), "diary").stat().st_mtime - 10
+        os.utime(first._path(_key(1), "diary"), (old, old))
+
+        # Act
+        with mock.patch("scraper.infrastructure.crawlers.diary_page_cache.RESCAN_EVERY_PUTS", 1):
+            first.put(_key(3), "diary", b"c" * 8)
+
+        # Assert
+        assert first.get(_key(1), "diary") is None
+        assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= 20
+
+    def test_put_when_entry_vanishes_during_eviction_then_skip_it(self, tmp_path: Path) -> None:
+        # Arrange
+        cache = DiaryPageCache(tmp_path, max_bytes=10)
+        cache.put(_key(1), "diary", b"a" * 8)
+        vanished = tmp_path / "gone.diary"
+        entries = cache._entries
+
+        def entries_with_vanished_file() -> list[Path]:
+            return [*entries(), vanished]
+
+        cache._entries = entries_with_vanished_file
+
+        # Act
+        cache.put(_key(2), "diary", b"b" * 8)
+
+        # Assert
+        assert cache.get(_key(2), "diary") == b"b" * 8
+        assert cache.get(_key(1), "diary") is None
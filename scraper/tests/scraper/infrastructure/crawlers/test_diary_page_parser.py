@@ -0,0 +1,77 @@
+from datetime import datetime
+from decimal import Decimal
+
+from scraper.domain.court_case import CourtCaseAmount
+from scraper.infrastructure.crawlers.diary_page_parser import (
+    parse_detail_html,
+    parse_detail_pdf_text,
+)
+
+PUBLISHED_AT_FALLBACK = datetime(2024, 11, 13)
+
+
+class TestParseDetailHtml:
+    def test_parse_detail_html_when_page_has_process_blocks_then_return_one_case_per_block(
+        self,
+    ) -> None:
+        # Arrange
+        html = (
+            "<html><body>"
+            "<p>PROCESSO: 0001234-56.2024.8.26.0053</p><p>ADVOGADO: Maria Silva</p>"
+            "<p>PROCESSO: 0006543-21.2024.8.26.0053</p>"
+            "</body></html>"
+        )
+
+        # Act
+        cases = parse_detail_html(html, PUBLISHED_AT_FALLBACK)
+
+        # Assert
+        assert [case.id for case in cases] == [
+            "0001234-56.2024.8.26.0053",
+            "0006543-21.2024.8.26.0053",
+        ]
+        assert cases[0].lawyers == ["Maria Silva"]
+        assert cases[1].lawyers == []
+        assert cases[0].published_at == PUBLISHED_AT_FALLBACK
+
+    def test_parse_detail_html_when_no_process_blocks_then_return_empty_list(self) -> None:
+        cases = parse_detail_html("<html><body>Nada</body></html>", PUBLISHED_AT_FALLBACK)
+
+        assert cases == []
+
+    def test_parse_detail_html_when_amounts_present_then_fill_them_and_default_to_zero(
+        self,
+    ) -> None:
+        # Arrange
+        html = (
+            "<p>Disponibilização: Terça-feira, 3 de junho de 2025</p>"
+            "<p>PROCESSO: 0001234-56.2024.8.26.0053</p>"
+            "<p>Valor principal: R$ 2.500,00 - honorários: R$ 250,00</p>"
+        )
+
+        # Act
+        (case,) = parse_detail_html(html, PUBLISHED_AT_FALLBACK)
+
+        # Assert
+        assert case.amount == CourtCaseAmount(Decimal("2500.00"), Decimal("0"), Decimal("250.00"))
+        assert case.published_at == datetime(2025, 6, 3)
+        assert case.content.startswith("PROCESSO: 0001234-56.2024.8.26.0053")
+
+
+class TestParseDetailPdfText:
+    def test_parse_detail_pdf_text_when_text_has_processes_then_return_cases(self) -> None:
+        # Arrange
+        pdf_text = (
+            "Processo 0004319-12.2018.8.26.0509 - Execução - ADV: JOSE SOUZA (OAB 123/SP)\n"
+            "Processo 0004320-12.2018.8.26.0509 - Execução\n"
+        )
+
+        # Act
+        cases = parse_detail_pdf_text(pdf_text, PUBLISHED_AT_FALLBACK)
+
+        # Assert
+        assert [case.id for case in cases] == [
+            "0004319-12.2018.8.26.0509",
+            "0004320-12.2018.8.26.0509",
+        ]
+        assert cases[0].lawyers == ["JOSE SOUZA"]
@@ -0,0 +1,113 @@
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from scraper.infrastructure.crawlers.diary_text_tokenizer import (
+    parse_amount,
+    parse_publication_date,
+    tokenize_diary_text,
+)
+
+PAGE_TEXT = (
+    "Disponibilização: Quarta-feira, 13 de novembro de 2024 Diário da Justiça Eletrônico\n"
+    "Processo 0004319-12.2018.8.26.0053 - Cumprimento de Sentença - RPV\n"
+    "Expeça-se o pagamento do valor principal de R$ 12.345,67, juros moratórios de\n"
+    "R$ 1.234,56 e honorários advocatícios de R$ 987,00.\n"
+    "ADV: JOSE SOUZA (OAB 123456/SP), MARIA DA SILVA (OAB 654321/SP)\n"
+    "Processo 0004320-12.2018.8.26.0053 - Execução - pagamento de R$ 500,00\n"
+)
+
+
+class TestTokenizeDiaryText:
+    def test_tokenize_diary_text_when_page_has_blocks_then_extract_every_field(self) -> None:
+        # Act
+        diary_text = tokenize_diary_text(PAGE_TEXT)
+
+        # Assert
+        first, second = diary_text.blocks
+        assert diary_text.published_at == datetime(2024, 11, 13)
+        assert first.case_id == "0004319-12.2018.8.26.0053"
+        assert first.lawyers == ["JOSE SOUZA", "MARIA DA SILVA"]
+        assert first.gross_principal == Decimal("12345.67")
+        assert first.interest == Decimal("1234.56")
+        assert first.lawyer_fees == Decimal("987.00")
+        assert second.gross_principal == Decimal("500.00")
+        assert second.interest is None
+        assert PAGE_TEXT[second.start : second.end].startswith("Processo 0004320")
+
+    def test_tokenize_diary_text_when_process_is_mentioned_again_then_keep_one_block(
+        self,
+    ) -> None:
+        # Arrange
+        text = (
+            "PROCESSO: 0001234-56.2024.8.26.0053\n"
+            "Referente ao Processo 0001234-56.2024.8.26.0053 - ADVOGADO: Maria Silva\n"
+        )
+
+        # Act
+        diary_text = tokenize_diary_text(text)
+
+        # Assert
+        assert [block.case_id for block in diary_text.blocks] == ["0001234-56.2024.8.26.0053"]
+        assert diary_text.blocks[0].lawyers == ["Maria Silva"]
+
+    def test_tokenize_diary_text_when_fields_precede_first_block_then_ignore_them(self) -> None:
+        # Arrange
+        text = "ADV: FORA (OAB 1/SP) R$ 10,00\nPROCESSO: 0001234-56.2024.8.26.0053\n"
+
+        # Act
+        diary_text = tokenize_diary_text(text)
+
+        # Assert
+        block = diary_text.blocks[0]
+        assert block.lawyers == []
+        assert block.gross_principal is None
+
+    def test_tokenize_diary_text_when_lawyers_line_runs_into_next_process_then_split_there(
+        self,
+    ) -> None:
+        # Arrange
+        text = (
+            "Processo 0004319-12.2018.8.26.0509 - ADV: JOSE SOUZA (OAB 123/SP) "
+            "Processo 0004320-12.2018.8.26.0509 - Execução"
+        )
+
+        # Act
+        diary_text = tokenize_diary_text(text)
+
+        # Assert
+        assert len(diary_text.blocks) == 2
+        assert diary_text.blocks[0].lawyers == ["JOSE SOUZA"]
+
+    def test_tokenize_diary_text_when_text_is_large_then_scan_in_linear_time(self) -> None:
+        # Arrange
+        def page(blocks: int) -> str:
+            return "".join(
+                f"Processo {n:07d}-12.2018.8.26.0509 - " + "texto da decisão " * 20 + "\n"
+                for n in range(blocks)
+            )
+
+        small, large = page(500), page(5000)
+
+        # Act
+        started_at = time.perf_counter()
+        tokenize_diary_text(small)
+        small_duration = time.perf_counter() - started_at
+        started_at = time.perf_counter()
+        diary_text = tokenize_diary_text(large)
+        large_duration = time.perf_counter() - started_at
+
+        # Assert
+        assert len(diary_text.blocks) == 5000
+        assert large_duration < small_duration * 30
+
+
+class TestParseHelpers:
+    def test_parse_amount_when_brazilian_format_then_return_decimal(self) -> None:
+        assert parse_amount("1.234.567,89") == Decimal("1234567.89")
+
+    def test_parse_publication_date_when_month_is_unknown_then_return_none(self) -> None:
+        assert parse_publication_date("13 de brumário de 2024") is None
+
+    def test_parse_publication_date_when_month_has_cedilla_then_parse_it(self) -> None:
+        assert parse_publication_date("Sexta-feira, 7 de Março de 2025") == datetime(2025, 3, 7)
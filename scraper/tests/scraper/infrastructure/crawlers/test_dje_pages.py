@@ -0,0 +1,102 @@
+from scraper.infrastructure.crawlers.dje_pages import (
+    find_next_page,
+    page_number_from_onclick,
+    popup_url_from_onclick,
+    scan_search_page,
+)
+
+BASE_URL_ROOT = "https://dje.tjsp.jus.br"
+
+
+def _popup_link(seq_page: int, title: str = "Visualizar") -> str:
+    return (
+        f'<a class="layout" title="{title}" '
+        f"onclick=\"popup('/cdje/consultaSimples.do?nuSeqpagina={seq_page}&amp;cdVolume=1')\">"
+        "Visualizar</a>"
+    )
+
+
+class TestScanSearchPage:
+    def test_scan_search_page_when_results_found_then_return_canonical_popup_urls(self) -> None:
+        # Arrange
+        html = f"<html><table><tr><td>{_popup_link(1)}</td><td>{_popup_link(2)}</td></tr></table>"
+
+        # Act
+        links = scan_search_page(html, BASE_URL_ROOT)
+
+        # Assert
+        assert links.popup_urls == [
+            f"{BASE_URL_ROOT}/cdje/consultaSimples.do?cdVolume=1&nuSeqpagina=1",
+            f"{BASE_URL_ROOT}/cdje/consultaSimples.do?cdVolume=1&nuSeqpagina=2",
+        ]
+        assert links.page_links == []
+
+    def test_scan_search_page_when_link_is_not_a_visualizar_layout_link_then_skip_it(
+        self,
+    ) -> None:
+        # Arrange
+        html = (
+            _popup_link(1, title="Imprimir")
+            + '<a title="Visualizar" onclick="popup(\'/cdje/x.do?nuSeqpagina=2\')">x</a>'
+        )
+
+        # Act
+        links = scan_search_page(html, BASE_URL_ROOT)
+
+        # Assert
+        assert links.popup_urls == []
+
+    def test_scan_search_page_when_attribute_contains_angle_bracket_then_keep_scanning(
+        self,
+    ) -> None:
+        # Arrange
+        html = '<a class="layout" title="a > b">x</a>' + _popup_link(3)
+
+        # Act
+        links = scan_search_page(html, BASE_URL_ROOT)
+
+        # Assert
+        assert [url.rsplit("=", 1)[1] for url in links.popup_urls] == ["3"]
+
+    def test_scan_search_page_when_several_style5_spans_then_read_pages_from_the_first(
+        self,
+    ) -> None:
+        # Arrange
+        html = (
+            '<a onclick="trocaDePg(9);">9</a>'
+            '<span class="style5"><span>1</span>'
+            '<a onclick="trocaDePg(2);">2</a><a onclick="trocaDePg(3);">3</a></span>'
+            '<span class="style5"><a onclick="trocaDePg(4);">4</a></span>'
+        )
+
+        # Act
+        links = scan_search_page(html, BASE_URL_ROOT)
+
+        # Assert
+        assert links.page_links == [2, 3]
+
+
+class TestOnclickHelpers:
+    def test_popup_url_from_onclick_when_popup_handler_then_return_canonical_url(self) -> None:
+        # Act
+        url = popup_url_from_onclick("popup('/cdje/consultaSimples.do?nuSeqpagina=7&cdVolume=1')")
+
+        # Assert
+        assert url == f"{BASE_URL_ROOT}/cdje/consultaSimples.do?cdVolume=1&nuSeqpagina=7"
+
+    def test_popup_url_from_onclick_when_other_handler_then_return_none(self) -> None:
+        assert popup_url_from_onclick("trocaDePg(2);") is None
+
+    def test_page_number_from_onclick_when_page_handler_then_return_page(self) -> None:
+        assert page_number_from_onclick("trocaDePg(12);") == 12
+
+    def test_page_number_from_onclick_when_other_handler_then_return_none(self) -> None:
+        assert page_number_from_onclick("popup('/cdje/x.do')") is None
+
+
+class TestFindNextPage:
+    def test_find_next_page_when_pages_were_seen_then_return_first_unseen(self) -> None:
+        assert find_next_page([1, 2, 3], {1, 2}) == 3
+
+    def test_find_next_page_when_all_pages_seen_then_return_none(self) -> None:
+        assert find_next_page([1, 2], {1, 2}) is None
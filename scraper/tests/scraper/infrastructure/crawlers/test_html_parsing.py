@@ -0,0 +1,70 @@
+from unittest import mock
+
+import pytest
+
+from scraper.infrastructure.crawlers import html_parsing
+from scraper.infrastructure.crawlers.html_parsing import (
+    HTML_PARSER,
+    LXML,
+    default_backend,
+    html_to_text,
+)
+
+DIARY_HTML = (
+    "<html><head><title>DJE</title><style>p { color: red; }</style>"
+    "<script>var x = '<p>hidden</p>';</script></head>"
+    "<body><!-- comment --><p>PROCESSO: 0001234-56.2024.8.26.0053</p>"
+    "<p>  ADVOGADO:  <b>Maria Silva</b> (OAB 123/SP) </p>"
+    "<p>Valor: R$ 1.234,56 &amp; juros</p></body></html>"
+)
+
+
+class TestHtmlToText:
+    @pytest.mark.parametrize("backend", [LXML, HTML_PARSER])
+    def test_html_to_text_when_called_then_return_stripped_visible_text(self, backend) -> None:
+        # Act
+        text = html_to_text(DIARY_HTML, backend)
+
+        # Assert
+        assert text.splitlines() == [
+            "DJE",
+            "PROCESSO: 0001234-56.2024.8.26.0053",
+            "ADVOGADO:",
+            "Maria Silva",
+            "(OAB 123/SP)",
+            "Valor: R$ 1.234,56 & juros",
+        ]
+
+    def test_html_to_text_when_backends_differ_then_return_the_same_text(self) -> None:
+        # Arrange
+        html = "<div>Intimação<br>  Disponibilização: <span>Terça</span></div><p></p>"
+
+        # Act / Assert
+        assert html_to_text(html, LXML) == html_to_text(html, HTML_PARSER)
+
+    def test_html_to_text_when_empty_then_return_empty_string(self) -> None:
+        assert html_to_text("", LXML) == ""
+
+
+class TestDefaultBackend:
+    def test_default_backend_when_lxml_installed_then_return_lxml(self, monkeypatch) -> None:
+        # Arrange
+        monkeypatch.delenv("SCRAPER_HTML_PARSER", raising=False)
+
+        # Act / Assert
+        assert default_backend() == LXML
+
+    def test_default_backend_when_forced_by_env_then_return_html_parser(self, monkeypatch) -> None:
+        # Arrange
+        monkeypatch.setenv("SCRAPER_HTML_PARSER", HTML_PARSER)
+
+        # Act / Assert
+        assert default_backend() == HTML_PARSER
+        assert html_to_text("<p>x</p>") == "x"
+
+    def test_default_backend_when_lxml_missing_then_fall_back_to_html_parser(self) -> None:
+        # Arrange
+        with mock.patch.object(html_parsing, "lxml", None):
+            # Act / Assert
+            assert default_backend() == HTML_PARSER
+            assert html_to_text("<p>x</p>") == "x"
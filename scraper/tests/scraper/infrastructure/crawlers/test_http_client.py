@@ -0,0 +1,37 @@
+from unittest import mock
+
+import pytest
+
+from scraper.infrastructure.crawlers import http_client
+from scraper.infrastructure.crawlers.http_client import HttpClientSettings, build_async_client
+
+
+class TestBuildAsyncClient:
+    @pytest.mark.asyncio
+    async def test_build_async_client_when_settings_given_then_apply_timeouts_and_user_agent(
+        self,
+    ) -> None:
+        # Arrange
+        settings = HttpClientSettings(connect_timeout=1.5, read_timeout=7.0)
+
+        # Act
+        async with build_async_client(settings, user_agent="agent/1.0") as client:
+            # Assert
+            assert client.timeout.connect == 1.5
+            assert client.timeout.read == 7.0
+            assert client.headers["User-Agent"] == "agent/1.0"
+
+    @pytest.mark.asyncio
+    async def test_build_async_client_when_http2_requested_without_h2_then_fall_back(
+        self,
+    ) -> None:
+        # Arrange
+        settings = HttpClientSettings(http2=True)
+
+        # Act
+        with mock.patch.object(http_client, "h2", None):
+            client = build_async_client(settings)
+
+        # Assert
+        async with client:
+            assert client._transport._pool._http2 is False
@@ -0,0 +1,60 @@
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from scraper.infrastructure.crawlers.parsing_executor import ParsingExecutor
+
+HTML = "<html><body><p>PROCESSO: 0001234-56.2024.8.26.0053</p></body></html>"
+
+
+class TestParsingExecutor:
+    @pytest.mark.asyncio
+    async def test_parse_html_when_input_below_threshold_then_do_not_start_process_pool(
+        self,
+    ) -> None:
+        # Arrange
+        executor = ParsingExecutor(inline_threshold=len(HTML) + 1)
+
+        # Act
+        cases = await executor.parse_html(HTML, datetime(2024, 11, 13))
+
+        # Assert
+        assert [case.id for case in cases] == ["0001234-56.2024.8.26.0053"]
+        assert executor._process_pool is None
+
+    @pytest.mark.asyncio
+    async def test_parse_html_when_input_above_threshold_then_parse_in_process_pool(
+        self,
+    ) -> None:
+        # Arrange
+        executor = ParsingExecutor(max_workers=1, inline_threshold=0)
+
+        # Act
+        try:
+            cases = await executor.parse_html(HTML, datetime(2024, 11, 13))
+            started_pool = executor._process_pool
+        finally:
+            executor.close()
+
+        # Assert
+        assert [case.id for case in cases] == ["0001234-56.2024.8.26.0053"]
+        assert started_pool is not None
+        assert executor._process_pool is None
+
+    @pytest.mark.asyncio
+    async def test_parse_pdf_when_processes_disabled_then_run_on_thread(self) -> None:
+        # Arrange
+        executor = ParsingExecutor(inline_threshold=0, use_processes=False)
+
+        # Act
+        with mock.patch(
+            "scraper.infrastructure.crawlers.parsing_executor.parse_detail_pdf",
+            return_value=[],
+        ) as parse_detail_pdf:
+            cases = await executor.parse_pdf(b"%PDF-1.4", datetime(2024, 11, 13))
+
+        # Assert
+        assert cases == []
+        parse_detail_pdf.assert_called_once()
+        assert executor._process_pool is None
@@ -0,0 +1,121 @@
+import asyncio
+
+import httpx
+import pytest
+
+from scraper.infrastructure.crawlers.rate_limiter import (
+    AimdRateLimiter,
+    AimdSettings,
+    HostRateLimiters,
+    LimiterSignal,
+)
+
+
+class TestAimdSettings:
+    @pytest.mark.parametrize(
+        "limits",
+        [
+            {"min_limit": 0.5},
+            {"min_limit": 2.0, "initial_limit": 1.0},
+            {"initial_limit": 8.0, "max_limit": 4.0},
+        ],
+    )
+    def test_init_when_limits_out_of_order_then_raise(self, limits: dict) -> None:
+        with pytest.raises(ValueError, match="min_limit"):
+            AimdSettings(**limits)
+
+
+class TestAimdRateLimiter:
+    def test_record_when_responses_healthy_then_grow_limit_additively(self) -> None:
+        # Arrange
+        limiter = AimdRateLimiter(AimdSettings(initial_limit=2.0))
+
+        # Act
+        limiter.record(LimiterSignal.OK, latency=0.1)
+        limiter.record(LimiterSignal.OK, latency=0.1)
+
+        # Assert
+        assert limiter.metrics.limit == pytest.approx(2.0 + 1 / 2 + 1 / 2.5)
+        assert limiter.metrics.increases == 2
+
+    def test_record_when_throttled_then_back_off_multiplicatively_once_per_cooldown(self) -> None:
+        # Arrange
+        limiter = AimdRateLimiter(AimdSettings(initial_limit=8.0, decrease_cooldown=60.0))
+
+        # Act
+        limiter.record(LimiterSignal.THROTTLED)
+        limiter.record(LimiterSignal.PLACEHOLDER)
+
+        # Assert
+        assert limiter.metrics.limit == 4.0
+        assert (limiter.metrics.decreases, limiter.metrics.holds) == (1, 1)
+
+    def test_record_when_response_slow_then_hold_limit(self) -> None:
+        # Arrange
+        limiter = AimdRateLimiter(AimdSettings(initial_limit=3.0, latency_threshold=1.0))
+
+        # Act
+        limiter.record(LimiterSignal.OK, latency=2.0)
+
+        # Assert
+        assert limiter.metrics.limit == 3.0
+        assert limiter.metrics.last_decision == "hold"
+
+    def test_record_when_backing_off_repeatedly_then_never_go_below_min_limit(self) -> None:
+        # Arrange
+        limiter = AimdRateLimiter(AimdSettings(initial_limit=2.0, decrease_cooldown=0.0))
+
+        # Act
+        for _ in range(5):
+            limiter.record(LimiterSignal.TIMEOUT)
+
+        # Assert
+        assert limiter.metrics.limit == 1.0
+
+    @pytest.mark.asyncio
+    async def test_permit_when_limit_reached_then_wait_for_a_free_slot(self) -> None:
+        # Arrange
+        limiter = AimdRateLimiter(AimdSettings(initial_limit=2.0, max_limit=2.0))
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def request() -> None:
+            nonlocal in_flight, peak_in_flight
+            async with limiter.permit():
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        # Act
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        # Assert
+        assert peak_in_flight == 2
+        assert limiter.metrics.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_permit_when_request_times_out_then_record_timeout(self) -> None:
+        # Arrange
+        limiter = AimdRateLimiter(AimdSettings(initial_limit=4.0))
+
+        # Act
+        with pytest.raises(httpx.ReadTimeout):
+            async with limiter.permit():
+                raise httpx.ReadTimeout("timeout")
+
+        # Assert
+        assert limiter.metrics.signals == {LimiterSignal.TIMEOUT: 1}
+        assert limiter.metrics.limit == 2.0
+
+
+class TestHostRateLimiters:
+    def test_for_url_when_same_host_then_share_limiter(self) -> None:
+        limiters = HostRateLimiters()
+
+        first = limiters.for_url("https://dje.tjsp.jus.br/cdje/consultaAvancada.do")
+        second = limiters.for_url("https://dje.tjsp.jus.br/cdje/getPaginaDoDiario.do")
+        other = limiters.for_url("https://esaj.tjsp.jus.br/")
+
+        assert first is second
+        assert first is not other
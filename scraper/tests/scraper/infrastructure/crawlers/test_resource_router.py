@@ -0,0 +1,97 @@
+from unittest import mock
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+from scraper.infrastructure.crawlers.resource_router import ResourceRouter, ResourceRoutingRules
+
+
+def _route(resource_type: str, url: str = "https://dje/static/app.js") -> mock.AsyncMock:
+    route = mock.AsyncMock()
+    route.request = mock.Mock(resource_type=resource_type, method="GET", url=url)
+    response = mock.AsyncMock(ok=True, status=200, headers={"content-type": "text/javascript"})
+    response.body.return_value = b"console.log(1)"
+    route.fetch.return_value = response
+    return route
+
+
+class TestResourceRouter:
+    @pytest.mark.asyncio
+    async def test_handle_when_resource_type_blocked_then_abort_request(self) -> None:
+        # Arrange
+        router = ResourceRouter()
+        route = _route("image", "https://dje/logo.png")
+
+        # Act
+        await router.handle(route)
+
+        # Assert
+        route.abort.assert_awaited_once()
+        route.continue_.assert_not_awaited()
+        assert router.stats.blocked == 1
+
+    @pytest.mark.asyncio
+    async def test_handle_when_document_requested_then_continue_untouched(self) -> None:
+        # Arrange
+        router = ResourceRouter()
+        route = _route("document", "https://dje/cdje/getPaginaDoDiario.do")
+
+        # Act
+        await router.handle(route)
+
+        # Assert
+        route.continue_.assert_awaited_once()
+        assert router.stats.by_resource_type == {"document": 1}
+
+    @pytest.mark.asyncio
+    async def test_handle_when_static_asset_requested_twice_then_serve_second_from_cache(
+        self,
+    ) -> None:
+        # Arrange
+        router = ResourceRouter()
+        first, second = _route("script"), _route("script")
+
+        # Act
+        await router.handle(first)
+        await router.handle(second)
+
+        # Assert
+        first.fetch.assert_awaited_once()
+        second.fetch.assert_not_awaited()
+        second.fulfill.assert_awaited_once_with(
+            status=200, headers={"content-type": "text/javascript"}, body=b"console.log(1)"
+        )
+        assert (router.stats.cache_misses, router.stats.cache_hits) == (1, 1)
+
+    @pytest.mark.parametrize("failing_call", ["fetch", "body"])
+    @pytest.mark.asyncio
+    async def test_handle_when_asset_fetch_fails_then_continue_request(
+        self, failing_call: str
+    ) -> None:
+        # Arrange
+        router = ResourceRouter()
+        route = _route("script")
+        if failing_call == "fetch":
+            route.fetch.side_effect = PlaywrightError("net::ERR_CONNECTION_RESET")
+        else:
+            route.fetch.return_value.body.side_effect = PlaywrightError("Response body unavailable")
+
+        # Act
+        await router.handle(route)
+
+        # Assert
+        route.continue_.assert_awaited_once()
+        route.fulfill.assert_not_awaited()
+        assert router.stats.fetch_errors == 1
+
+    @pytest.mark.asyncio
+    async def test_handle_when_cache_full_then_evict_least_recently_used_asset(self) -> None:
+        # Arrange
+        router = ResourceRouter(ResourceRoutingRules(max_cached_bytes=20))
+
+        # Act
+        await router.handle(_route("script", "https://dje/a.js"))
+        await router.handle(_route("script", "https://dje/b.js"))
+
+        # Assert
+        assert list(router._assets) == ["https://dje/b.js"]
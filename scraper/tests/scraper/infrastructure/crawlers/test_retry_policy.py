@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from scraper.infrastructure.crawlers.retry_policy import (
+    CircuitBreaker,
+    RetrySettings,
+    backoff_delay,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetrySettings:
+    @pytest.mark.parametrize(
+        ("settings", "message"),
+        [
+            ({"max_attempts": 0}, "max_attempts"),
+            ({"base_delay": -1.0}, "base_delay"),
+            ({"base_delay": 10.0, "max_delay": 5.0}, "base_delay"),
+        ],
+    )
+    def test_init_when_settings_out_of_bounds_then_raise(self, settings, message) -> None:
+        with pytest.raises(ValueError, match=message):
+            RetrySettings(**settings)
+
+
+class TestBackoffDelay:
+    def test_backoff_delay_when_attempts_grow_then_double_ceiling_up_to_max_delay(self) -> None:
+        settings = RetrySettings(base_delay=1.0, max_delay=5.0)
+
+        delays = [backoff_delay(attempt, settings, rand=lambda: 1.0) for attempt in (1, 2, 3, 4)]
+
+        assert delays == [1.0, 2.0, 4.0, 5.0]
+
+    def test_backoff_delay_when_jittered_then_stay_below_ceiling(self) -> None:
+        settings = RetrySettings(base_delay=2.0)
+
+        delay = backoff_delay(2, settings, rand=lambda: 0.25)
+
+        assert delay == 1.0
+
+
+class TestCircuitBreaker:
+    def test_record_when_failure_rate_reached_then_open(self) -> None:
+        # Arrange
+        breaker = CircuitBreaker(min_calls=4, failure_rate=0.5, clock=FakeClock())
+
+        # Act
+        for success in (True, False, True, False):
+            breaker.record(success)
+
+        # Assert
+        assert breaker.state == "open"
+        assert breaker.open_count == 1
+
+    def test_record_when_too_few_calls_then_stay_closed(self) -> None:
+        breaker = CircuitBreaker(min_calls=4, clock=FakeClock())
+
+        breaker.record(False)
+        breaker.record(False)
+
+        assert breaker.state == "closed"
+
+    def test_record_when_half_open_trial_succeeds_then_close(self) -> None:
+        # Arrange
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_seconds=10.0, clock=clock)
+        breaker.record(False)
+        clock.now = 11.0
+
+        # Act
+        breaker.record(True)
+
+        # Assert
+        assert breaker.state == "closed"
+
+    def test_record_when_half_open_trial_fails_then_open_again(self) -> None:
+        # Arrange
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_seconds=10.0, clock=clock)
+        breaker.record(False)
+        clock.now = 11.0
+
+        # Act
+        breaker.record(False)
+
+        # Assert
+        assert breaker.state == "open"
+        assert breaker.open_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_until_closed_when_breaker_open_then_sleep_for_remaining_time(
+        self, mocker
+    ) -> None:
+        # Arrange
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_seconds=10.0, clock=clock)
+        breaker.record(False)
+        clock.now = 4.0
+
+        async def fake_sleep(seconds: float) -> None:
+            clock.now += seconds
+
+        sleep = mocker.patch("asyncio.sleep", side_effect=fake_sleep)
+
+        # Act
+        await breaker.wait_until_closed()
+
+        # Assert
+        sleep.assert_awaited_once_with(6.0)
+
+    @pytest.mark.asyncio
+    async def test_wait_until_closed_when_half_open_then_let_a_single_trial_through(
+        self,
+    ) -> None:
+        # Arrange
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_seconds=10.0, clock=clock)
+        breaker.record(False)
+        clock.now = 11.0
+
+        # Act
+        await breaker.wait_until_closed()
+        waiters = [asyncio.create_task(breaker.wait_until_closed()) for _ in range(3)]
+        await asyncio.sleep(0)
+        blocked_during_trial = not any(waiter.done() for waiter in waiters)
+        breaker.record(True)
+        await asyncio.gather(*waiters)
+
+        # Assert
+        assert blocked_during_trial
+        assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_wait_until_closed_when_trial_fails_then_keep_waiters_blocked(self) -> None:
+        # Arrange
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_seconds=10.0, clock=clock)
+        breaker.record(False)
+        clock.now = 11.0
+        await breaker.wait_until_closed()
+        waiter = asyncio.create_task(breaker.wait_until_closed())
+        await asyncio.sleep(0)
+
+        # Act
+        breaker.record(False)
+        await asyncio.sleep(0.01)
+
+        # Assert
+        assert breaker.state == "open"
+        assert not waiter.done()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
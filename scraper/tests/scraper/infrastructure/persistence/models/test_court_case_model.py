@@ -1,3 +1,4 @@
+from dataclasses import replace
 from datetime import UTC, datetime
 from decimal import Decimal
 
@@ -75,3 +76,41 @@ class TestCourtCaseModel:
         assert model.interest == expected_interest_value
         assert model.lawyer_fees == expected_lawyer_fees_value
         assert model.content == expected_content_value
+
+    def test_fingerprint_when_only_whitespace_or_status_differs_then_return_same_hash(self):
+        # Arrange
+        court_case = _court_case(content="PROCESSO: 1\nADV: Maria", lawyers=["Maria  Silva"])
+        reformatted = replace(
+            _court_case(content="  PROCESSO: 1 ADV:   Maria ", lawyers=["Maria Silva"]),
+            status=CourtCaseStatus.READ,
+        )
+
+        # Act / Assert
+        assert CourtCaseModel.fingerprint(court_case) == CourtCaseModel.fingerprint(reformatted)
+        assert len(CourtCaseModel.fingerprint(court_case)) == 64
+
+    def test_fingerprint_when_amount_changes_then_return_different_hash(self):
+        # Arrange
+        court_case = _court_case()
+        changed = replace(
+            court_case,
+            amount=CourtCaseAmount(Decimal("1000.01"), Decimal(100), Decimal(50)),
+        )
+
+        # Act / Assert
+        assert CourtCaseModel.fingerprint(court_case) != CourtCaseModel.fingerprint(changed)
+        assert CourtCaseModel.from_entity(court_case).content_hash == CourtCaseModel.fingerprint(
+            court_case
+        )
+
+
+def _court_case(content: str = "PROCESSO: 1", lawyers: list[str] | None = None) -> CourtCase:
+    return CourtCase(
+        id="12345",
+        name="Fake Court Case",
+        lawyers=lawyers or ["Lawyer A"],
+        published_at=datetime(2024, 11, 13, tzinfo=UTC),
+        status=CourtCaseStatus.NEW,
+        amount=CourtCaseAmount(Decimal(1000), Decimal(100), Decimal(50)),
+        content=content,
+    )
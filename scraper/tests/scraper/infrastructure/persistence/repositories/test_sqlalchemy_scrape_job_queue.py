@@ -0,0 +1,185 @@
+from collections.abc import AsyncGenerator
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from scraper.domain.scrape_job import ScrapeJob, ScrapeJobStatus
+from scraper.infrastructure.persistence.models.base import Base
+from scraper.infrastructure.persistence.models.scrape_job_model import ScrapeJobModel
+from scraper.infrastructure.persistence.repositories import SQLAlchemyScrapeJobQueue
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2024, 11, 13, 12, 0, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+async def session_factory() -> AsyncGenerator[async_sessionmaker, None]:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(session_factory, clock) -> SQLAlchemyScrapeJobQueue:
+    return SQLAlchemyScrapeJobQueue(session_factory, max_attempts=2, clock=clock)
+
+
+def _job(day: int, section_id: str | None = None) -> ScrapeJob:
+    return ScrapeJob(day=date(2024, 11, day), section_id=section_id, search_terms="RPV")
+
+
+async def _stored(session_factory, job_id: int) -> ScrapeJobModel:
+    async with session_factory() as session:
+        return await session.get(ScrapeJobModel, job_id)
+
+
+class TestSQLAlchemyScrapeJobQueue:
+    @pytest.mark.asyncio
+    async def test_enqueue_when_job_already_queued_then_skip_it(self, queue):
+        # Arrange
+        await queue.enqueue([_job(13)])
+
+        # Act
+        added = await queue.enqueue([_job(13), _job(14), _job(14, "11")])
+
+        # Assert
+        assert added == 2
+
+    @pytest.mark.asyncio
+    async def test_claim_when_jobs_pending_then_lease_oldest_day(self, queue, clock):
+        # Arrange
+        await queue.enqueue([_job(14), _job(13)])
+
+        # Act
+        job = await queue.claim("worker-1", lease_seconds=60)
+
+        # Assert
+        assert job.day == date(2024, 11, 13)
+        assert job.status == ScrapeJobStatus.RUNNING
+        assert job.attempts == 1
+        assert job.lease_owner == "worker-1"
+        assert job.lease_expires_at.replace(tzinfo=UTC) == clock.now + timedelta(seconds=60)
+
+    @pytest.mark.asyncio
+    async def test_claim_when_job_leased_then_next_worker_gets_another_job(self, queue):
+        # Arrange
+        await queue.enqueue([_job(13), _job(14)])
+
+        # Act
+        first = await queue.claim("worker-1", lease_seconds=60)
+        second = await queue.claim("worker-2", lease_seconds=60)
+        third = await queue.claim("worker-3", lease_seconds=60)
+
+        # Assert
+        assert first.id != second.id
+        assert third is None
+
+    @pytest.mark.asyncio
+    async def test_claim_when_lease_expired_then_requeue_job(self, queue, clock):
+        # Arrange
+        await queue.enqueue([_job(13)])
+        first = await queue.claim("worker-1", lease_seconds=60)
+        clock.advance(61)
+
+        # Act
+        second = await queue.claim("worker-2", lease_seconds=60)
+
+        # Assert
+        assert second.id == first.id
+        assert second.lease_owner == "worker-2"
+        assert second.attempts == 2
+        assert not await queue.heartbeat(first.id, "worker-1", lease_seconds=60)
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_when_lease_held_then_extend_it(self, queue, clock, session_factory):
+        # Arrange
+        await queue.enqueue([_job(13)])
+        job = await queue.claim("worker-1", lease_seconds=60)
+        clock.advance(50)
+
+        # Act
+        renewed = await queue.heartbeat(job.id, "worker-1", lease_seconds=60)
+        clock.advance(50)
+
+        # Assert
+        assert renewed
+        assert await queue.requeue_expired() == 0
+        stored = await _stored(session_factory, job.id)
+        assert stored.status == ScrapeJobStatus.RUNNING
+
+    @pytest.mark.asyncio
+    async def test_complete_when_called_then_mark_done(self, queue, session_factory):
+        # Arrange
+        await queue.enqueue([_job(13)])
+        job = await queue.claim("worker-1", lease_seconds=60)
+
+        # Act
+        await queue.complete(job.id, "worker-1", extracted_count=7)
+
+        # Assert
+        stored = await _stored(session_factory, job.id)
+        assert stored.status == ScrapeJobStatus.DONE
+        assert stored.extracted_count == 7
+        assert stored.lease_owner is None
+        assert await queue.claim("worker-1", lease_seconds=60) is None
+
+    @pytest.mark.asyncio
+    async def test_fail_when_attempts_left_then_requeue_until_max_attempts(
+        self, queue, session_factory
+    ):
+        # Arrange
+        await queue.enqueue([_job(13)])
+
+        # Act
+        job = await queue.claim("worker-1", lease_seconds=60)
+        await queue.fail(job.id, "worker-1", "boom")
+        retried = await queue.claim("worker-1", lease_seconds=60)
+        await queue.fail(retried.id, "worker-1", "boom again")
+
+        # Assert
+        assert retried.id == job.id
+        stored = await _stored(session_factory, job.id)
+        assert stored.status == ScrapeJobStatus.FAILED
+        assert stored.last_error == "boom again"
+        assert await queue.claim("worker-1", lease_seconds=60) is None
+
+    @pytest.mark.asyncio
+    async def test_requeue_expired_when_out_of_attempts_then_mark_failed(
+        self, queue, clock, session_factory
+    ):
+        # Arrange
+        await queue.enqueue([_job(13)])
+        await queue.claim("worker-1", lease_seconds=60)
+        clock.advance(61)
+        job = await queue.claim("worker-2", lease_seconds=60)
+        clock.advance(61)
+
+        # Act
+        changed = await queue.requeue_expired()
+
+        # Assert
+        assert changed == 1
+        stored = await _stored(session_factory, job.id)
+        assert stored.status == ScrapeJobStatus.FAILED
+        assert stored.last_error == "Lease expired"
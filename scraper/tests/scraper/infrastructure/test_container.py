@@ -1,5 +1,10 @@
+import atexit
+from dataclasses import replace
+from unittest import mock
+
 import pytest
 
+from scraper.infrastructure import container
 from scraper.infrastructure.container import (
     get_db_session,
     get_extract_and_persist_course_case_service,
@@ -20,3 +25,39 @@ class TestContainer:
             service = get_extract_and_persist_course_case_service(session)
             assert service is not None
             assert hasattr(service, "execute")
+
+
+class TestParsingExecutor:
+    def test_get_parsing_executor_when_called_twice_then_share_one_closed_at_exit(
+        self, monkeypatch
+    ) -> None:
+        # Arrange
+        monkeypatch.setattr(container, "_parsing_executor", None)
+
+        # Act
+        with mock.patch.object(atexit, "register") as register:
+            first = container.get_parsing_executor()
+            second = container.get_parsing_executor()
+
+        # Assert
+        assert first is second
+        register.assert_called_once_with(first.close)
+
+
+class TestCourtCaseExtractor:
+    def test_get_court_case_extractor_when_crawlee_then_retry_after_the_first_attempt(
+        self, monkeypatch
+    ) -> None:
+        # Arrange
+        monkeypatch.setattr(
+            container,
+            "crawler_config",
+            replace(container.crawler_config, extractor="crawlee", retry_max_attempts=3),
+        )
+        monkeypatch.setattr(container, "_parsing_executor", None)
+
+        # Act
+        extractor = container.get_court_case_extractor()
+
+        # Assert
+        assert extractor.max_request_retries == 2
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[3] / "src"
+# `scraper --help` used to take over a second to import; it is now around 0.15s.
+IMPORT_TIME_BUDGET_SECONDS = 0.6
+HEAVY_MODULES = ("sqlalchemy", "crawlee", "playwright", "bs4", "pdfminer", "PyPDF2", "lxml")
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def _cli_import_seconds() -> float:
+    stderr = _run_python("-X", "importtime", "-c", "import scraper.presentation.cli").stderr
+    # Lines read "import time: self [us] | cumulative | package".
+    cumulative = next(
+        line.split("|")[1]
+        for line in stderr.splitlines()
+        if line.split("|")[-1].strip() == "scraper.presentation.cli"
+    )
+    return int(cumulative) / 1_000_000
+
+
+class TestCliStartup:
+    def test_import_cli_when_called_then_skip_heavy_dependencies(self) -> None:
+        # Act
+        result = _run_python(
+            "-c",
+            "import sys, scraper.presentation.cli; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        )
+
+        # Assert
+        assert result.stdout.strip() == ""
+
+    def test_import_cli_when_measured_then_stay_within_budget(self) -> None:
+        # Act
+        import_seconds = min(_cli_import_seconds() for _ in range(3))
+
+        # Assert
+        assert import_seconds < IMPORT_TIME_BUDGET_SECONDS
+
+    def test_import_container_when_called_then_do_not_create_engine(self) -> None:
+        # Act
+        result = _run_python(
+            "-c",
+            "import asyncio; from scraper.infrastructure import container; "
+            "asyncio.run(container.dispose_engine()); print(container._engine)",
+        )
+
+        # Assert
+        assert result.stdout.strip() == "None"
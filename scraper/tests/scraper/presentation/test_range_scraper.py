@@ -0,0 +1,118 @@
+import datetime as dt
+import os
+from unittest import mock
+
+import pytest
+
+from scraper.presentation import range_scraper
+from scraper.presentation.range_scraper import (
+    RangeSummary,
+    ScrapeShard,
+    ShardResult,
+    build_shards,
+    parsing_workers_per_shard,
+    scrape_range,
+)
+
+
+def _fake_run(shard: ScrapeShard) -> ShardResult:
+    if shard.day.day == 13:
+        return ShardResult(shard, error="RuntimeError: boom")
+    return ShardResult(shard, extracted_count=shard.day.day)
+
+
+class TestBuildShards:
+    def test_build_shards_when_range_given_then_one_shard_per_day(self):
+        # Act
+        shards = build_shards(dt.date(2024, 11, 13), dt.date(2024, 11, 16))
+
+        # Assert
+        assert [shard.day.day for shard in shards] == [13, 14, 15, 16]
+        assert all(shard.section_id is None for shard in shards)
+
+    def test_build_shards_when_sections_given_then_one_shard_per_day_and_section(self):
+        # Act
+        shards = build_shards(dt.date(2024, 11, 13), dt.date(2024, 11, 14), ["11", "12"])
+
+        # Assert
+        assert [(shard.day.day, shard.section_id) for shard in shards] == [
+            (13, "11"),
+            (13, "12"),
+            (14, "11"),
+            (14, "12"),
+        ]
+
+    def test_build_shards_when_end_before_start_then_raise(self):
+        # Act / Assert
+        with pytest.raises(ValueError):
+            build_shards(dt.date(2024, 11, 16), dt.date(2024, 11, 13))
+
+    def test_to_filters_when_called_then_restrict_to_shard_day(self):
+        # Arrange
+        shard = ScrapeShard(day=dt.date(2024, 11, 13), section_id="12")
+
+        # Act
+        filters = shard.to_filters()
+
+        # Assert
+        assert filters.start_date == filters.end_date == dt.date(2024, 11, 13)
+        assert filters.section_id == "12"
+
+
+class TestScrapeRange:
+    def test_scrape_range_when_shards_run_on_workers_then_merge_results(self):
+        # Arrange
+        shards = build_shards(dt.date(2024, 11, 13), dt.date(2024, 11, 15))
+
+        # Act
+        summary = scrape_range(shards, max_workers=2, run=_fake_run)
+
+        # Assert
+        assert sorted(result.shard.day.day for result in summary.results) == [13, 14, 15]
+        assert summary.extracted_count == 14 + 15
+        assert [result.shard.day.day for result in summary.failed] == [13]
+
+    def test_lines_when_called_then_list_shards_in_order_and_totals(self):
+        # Arrange
+        day = dt.date(2024, 11, 13)
+        summary = RangeSummary(
+            [
+                ShardResult(ScrapeShard(day + dt.timedelta(days=1)), extracted_count=3),
+                ShardResult(ScrapeShard(day), error="RuntimeError: boom"),
+            ]
+        )
+
+        # Act
+        lines = summary.lines()
+
+        # Assert
+        assert lines[0].startswith("  2024-11-13: FAILED (RuntimeError: boom)")
+        assert lines[1].startswith("  2024-11-14: 3 cases")
+        assert lines[2] == "Extracted 3 court cases from 2 shards, 1 failed."
+
+
+class TestParsingWorkers:
+    @pytest.mark.parametrize(("workers", "expected"), [(1, 8), (3, 2), (8, 1), (16, 1)])
+    def test_parsing_workers_per_shard_when_cores_shared_then_split_them(self, workers, expected):
+        with mock.patch.object(os, "cpu_count", return_value=8):
+            assert parsing_workers_per_shard(workers) == expected
+
+    def test_init_worker_when_parsing_workers_unset_then_set_the_share(self, monkeypatch):
+        # Arrange
+        monkeypatch.delenv("SCRAPER_PARSING_WORKERS", raising=False)
+
+        # Act
+        range_scraper._init_worker(2)
+
+        # Assert
+        assert os.environ["SCRAPER_PARSING_WORKERS"] == "2"
+
+    def test_init_worker_when_parsing_workers_set_then_keep_it(self, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("SCRAPER_PARSING_WORKERS", "5")
+
+        # Act
+        range_scraper._init_worker(2)
+
+        # Assert
+        assert os.environ["SCRAPER_PARSING_WORKERS"] == "5"